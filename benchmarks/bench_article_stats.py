@@ -0,0 +1,87 @@
+"""
+Benchmark: GROUP BY status over articles vs trigger-maintained article_counts
+
+Grows a scratch database to each target size and times both stats queries.
+The GROUP BY cost grows with the table; the article_counts read stays flat.
+
+    NEON_CONNECTION_STRING=postgresql://... python -m benchmarks.bench_article_stats --sizes 10000 100000 1000000
+Generated rows are tagged with a run id and deleted afterwards.
+"""
+import argparse
+import asyncio
+import time
+import uuid
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from src.database.connection import db_manager
+
+GROUP_BY_QUERY = """
+    SELECT status, COUNT(*) AS count
+    FROM articles
+    GROUP BY status
+"""
+
+COUNTER_QUERY = """
+    SELECT status, count
+    FROM article_counts
+"""
+
+INSERT_QUERY = """
+    INSERT INTO articles (title, content, status, attributes)
+    SELECT
+        'Stats benchmark ' || n,
+        'Generated body ' || n,
+        (ARRAY['draft', 'review', 'published', 'archived'])[1 + n % 4],
+        jsonb_build_object('benchmark_run', $2::text)
+    FROM generate_series(1, $1) AS n
+"""
+
+
+async def time_query(query: str, repeats: int) -> float:
+    """Median latency in milliseconds"""
+    timings = []
+    async with db_manager.acquire() as conn:
+        for _ in range(repeats):
+            start = time.perf_counter()
+            await conn.fetch(query)
+            timings.append((time.perf_counter() - start) * 1000)
+    timings.sort()
+    return timings[len(timings) // 2]
+
+
+async def run(sizes, repeats: int, batch: int):
+    await db_manager.initialize()
+    run_id = uuid.uuid4().hex
+    try:
+        async with db_manager.acquire() as conn:
+            current = await conn.fetchval("SELECT COUNT(*) FROM articles")
+
+        print(f"{'rows':>10} {'GROUP BY (ms)':>15} {'article_counts (ms)':>21}")
+        for target in sorted(sizes):
+            async with db_manager.acquire() as conn:
+                while current < target:
+                    step = min(batch, target - current)
+                    await conn.execute(INSERT_QUERY, step, run_id)
+                    current += step
+                await conn.execute("ANALYZE articles")
+
+            group_by = await time_query(GROUP_BY_QUERY, repeats)
+            counter = await time_query(COUNTER_QUERY, repeats)
+            print(f"{current:>10} {group_by:>15.2f} {counter:>21.3f}")
+    finally:
+        await db_manager.execute_query(
+            "DELETE FROM articles WHERE attributes->>'benchmark_run' = $1", run_id
+        )
+        await db_manager.close()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10000, 100000, 1000000])
+    parser.add_argument('--repeats', type=int, default=21)
+    parser.add_argument('--batch', type=int, default=100000)
+    args = parser.parse_args()
+    asyncio.run(run(args.sizes, args.repeats, args.batch))
@@ -0,0 +1,62 @@
+"""
+Benchmark: per-row create_article_with_search vs COPY-based bulk_create_articles
+
+Run from the repository root against a scratch database:
+    NEON_CONNECTION_STRING=postgresql://... python -m benchmarks.bench_bulk_ingest --rows 5000
+Rows are tagged with a run id and deleted afterwards.
+"""
+import argparse
+import asyncio
+import time
+import uuid
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from src.database.connection import db_manager
+from src.database.operations import ArticleOperations
+
+
+def make_articles(count: int, run_id: str):
+    """Generate synthetic articles of realistic size"""
+    paragraph = "Remote work visas, coworking costs and tax residency rules vary by country. " * 20
+    for i in range(count):
+        yield {
+            'title': f'Benchmark article {i}',
+            'content': f'# Benchmark article {i}\n\n## Overview\n\n{paragraph}\n\n## Details\n\n{paragraph}',
+            'attributes': {'benchmark_run': run_id, 'category': 'Guide'},
+            'status': 'draft'
+        }
+
+
+async def run(rows: int, chunk_size: int):
+    await db_manager.initialize()
+    run_id = uuid.uuid4().hex
+    try:
+        start = time.perf_counter()
+        for article in make_articles(rows, run_id):
+            await ArticleOperations.create_article_with_search(**article)
+        per_row = time.perf_counter() - start
+
+        start = time.perf_counter()
+        ids = await ArticleOperations.bulk_create_articles(make_articles(rows, run_id), chunk_size=chunk_size)
+        bulk = time.perf_counter() - start
+
+        print(f"rows={rows} chunk_size={chunk_size}")
+        print(f"per-row insert : {per_row:8.2f}s  ({rows / per_row:10.0f} rows/s)")
+        print(f"bulk COPY      : {bulk:8.2f}s  ({len(ids) / bulk:10.0f} rows/s)")
+        print(f"speedup        : {per_row / bulk:8.1f}x")
+    finally:
+        await db_manager.execute_query(
+            "DELETE FROM articles WHERE attributes->>'benchmark_run' = $1", run_id
+        )
+        await db_manager.close()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, default=5000)
+    parser.add_argument('--chunk-size', type=int, default=1000)
+    args = parser.parse_args()
+    asyncio.run(run(args.rows, args.chunk_size))
@@ -0,0 +1,75 @@
+"""
+Benchmark: section-wise enhancement and scoring of long articles against the fake API
+
+Builds an article of --sections Markdown sections of --words words each, then
+enhances and scores it --rounds times twice: once as a single whole-article
+prompt (the section budgets raised out of reach) and once split into sections.
+The fake API echoes enhancement input cut off at max_tokens and charges
+--token-latency seconds per output token, so the single prompt should come back
+truncated and slower; the sectioned run should return the whole article.
+
+    python -m benchmarks.bench_chunked_enhancement --sections 20 --words 400
+"""
+import argparse
+import asyncio
+import os
+import time
+
+from dotenv import load_dotenv
+
+from benchmarks.fake_anthropic import FakeAnthropicServer
+
+load_dotenv()
+
+
+def make_article(sections: int, words: int) -> str:
+    vocabulary = "visa residency coworking internet budget housing taxes insurance banking community".split()
+    parts = ["# The Long Guide to Working Remotely Abroad\n"]
+    for number in range(sections):
+        body = " ".join(vocabulary[(number + index) % len(vocabulary)] for index in range(words))
+        parts.append(f"## Part {number + 1}\n\n{body}.\n")
+    return "\n".join(parts)
+
+
+async def run(sections: int, words: int, rounds: int, token_latency: float):
+    os.environ.setdefault('CLAUDE_API_KEY', 'fake-key')
+    os.environ.setdefault('CLAUDE_REQUESTS_PER_MINUTE', '100000')
+    os.environ.setdefault('CLAUDE_TOKENS_PER_MINUTE', '100000000')
+    os.environ['CLAUDE_CACHE_ENABLED'] = 'false'
+    os.environ['CLAUDE_ROUTING_ENABLED'] = 'false'
+    from src.ai_services import claude
+    from src.ai_services.tokens import estimate_tokens
+
+    article = make_article(sections, words)
+    source_words = len(article.split())
+    print(f"article: {sections} sections, {source_words} words, ~{estimate_tokens(article)} tokens")
+
+    defaults = (claude.ENHANCE_SECTION_TOKENS, claude.SCORE_SECTION_TOKENS)
+    for mode, budgets in (('single', (10 ** 9, 10 ** 9)), ('sections', defaults)):
+        claude.ENHANCE_SECTION_TOKENS, claude.SCORE_SECTION_TOKENS = budgets
+        with FakeAnthropicServer(latency=0.2, output_token_latency=token_latency) as server:
+            service = claude.ClaudeService(base_url=server.url)
+            start = time.perf_counter()
+            for _ in range(rounds):
+                enhanced, quality = await asyncio.gather(
+                    service.enhance_content(article),
+                    service.score_content_quality(article)
+                )
+            elapsed = time.perf_counter() - start
+            await service.close()
+
+        returned = len(enhanced.split())
+        print(f"{mode:<9} elapsed={elapsed:.2f}s ({elapsed / rounds:.2f}s/round) requests={server.requests} "
+              f"enhanced_words={returned}/{source_words} ({returned / source_words:.0%}) score={quality['quality_score']}")
+
+    claude.ENHANCE_SECTION_TOKENS, claude.SCORE_SECTION_TOKENS = defaults
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--sections', type=int, default=20)
+    parser.add_argument('--words', type=int, default=400)
+    parser.add_argument('--rounds', type=int, default=3)
+    parser.add_argument('--token-latency', type=float, default=0.002)
+    args = parser.parse_args()
+    asyncio.run(run(args.sections, args.words, args.rounds, args.token_latency))
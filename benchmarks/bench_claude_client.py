@@ -0,0 +1,60 @@
+"""
+Benchmark: ClaudeService throughput and 429s under the token-bucket limiter
+
+Starts the local fake Messages API with a requests/tokens-per-minute budget and
+fires concurrent calls through ClaudeService. With the limiter configured to the
+same budget the fake should see (almost) no 429s, and throughput should track the
+limit rather than the number of callers. No API key or network access needed.
+
+    python -m benchmarks.bench_claude_client --calls 200 --rpm 600
+"""
+import argparse
+import asyncio
+import os
+import time
+
+from dotenv import load_dotenv
+
+from benchmarks.fake_anthropic import FakeAnthropicServer
+
+load_dotenv()
+
+
+async def run(calls: int, rpm: int, tpm: int, latency: float):
+    os.environ['CLAUDE_REQUESTS_PER_MINUTE'] = str(rpm)
+    os.environ['CLAUDE_TOKENS_PER_MINUTE'] = str(tpm)
+    # The SDK's own retries would hide 429s from the measurement
+    os.environ['CLAUDE_MAX_RETRIES'] = '0'
+    from src.ai_services.claude import ClaudeService
+
+    with FakeAnthropicServer(requests_per_minute=rpm, tokens_per_minute=tpm, latency=latency) as server:
+        service = ClaudeService(api_key='fake-key', base_url=server.url)
+        errors = 0
+
+        async def call(index: int):
+            nonlocal errors
+            try:
+                await service._create_message(service.fast_model, 100, f"Write a meta description #{index}")
+            except Exception:
+                errors += 1
+
+        start = time.perf_counter()
+        await asyncio.gather(*(call(i) for i in range(calls)))
+        elapsed = time.perf_counter() - start
+        await service.close()
+
+        print(f"calls={calls} rpm={rpm} tpm={tpm} latency={latency}s")
+        print(f"elapsed={elapsed:.1f}s  throughput={calls / elapsed * 60:.0f}/min  "
+              f"server_requests={server.requests} server_429s={server.rate_limited} "
+              f"client_errors={errors} max_in_flight={server.max_in_flight}")
+        print(f"limiter={service.rate_limiter.get_metrics()}")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--calls', type=int, default=200)
+    parser.add_argument('--rpm', type=int, default=600)
+    parser.add_argument('--tpm', type=int, default=400000)
+    parser.add_argument('--latency', type=float, default=0.2)
+    args = parser.parse_args()
+    asyncio.run(run(args.calls, args.rpm, args.tpm, args.latency))
@@ -0,0 +1,89 @@
+"""
+Benchmark: streaming export throughput and peak memory vs fetch-everything
+
+Loads a generated corpus of published articles (100k by default), then exports it
+to a temporary file as NDJSON (and Parquet when pyarrow is installed) through the
+server-side cursor path, and compares against fetching every row before writing.
+Peak Python heap is measured with tracemalloc.
+
+    NEON_CONNECTION_STRING=postgresql://... python -m benchmarks.bench_export --articles 100000
+"""
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+import tracemalloc
+import uuid
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from src.database.connection import db_manager
+from src.database.operations import ArticleOperations, _projection_columns
+from src.export.articles import export_published_articles, NDJSONExportWriter, pa
+from benchmarks.bench_search import make_corpus
+
+
+async def fetch_all_export(output):
+    """Baseline: materialize every published row, then write"""
+    rows = await db_manager.execute_query(f"""
+        SELECT {_projection_columns('public')}
+        FROM articles WHERE status = 'published'
+        ORDER BY updated_at, id
+    """)
+    writer = NDJSONExportWriter(output)
+    writer.write_chunk([dict(row) for row in rows])
+    writer.close()
+    return len(rows)
+
+
+async def measure(label: str, func):
+    with tempfile.NamedTemporaryFile(suffix='.export', delete=False) as output:
+        path = output.name
+        tracemalloc.start()
+        start = time.perf_counter()
+        rows = await func(output)
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    size_mb = os.path.getsize(path) / 1e6
+    os.unlink(path)
+    print(f"{label:<24} {rows:>8} {rows / elapsed:>12.0f} {size_mb / elapsed:>8.1f} {peak / 1e6:>10.1f}")
+
+
+async def run(articles: int, words: int, chunk_size: int):
+    await db_manager.initialize()
+    run_id = uuid.uuid4().hex
+    try:
+        corpus = [dict(article, status='published') for article in make_corpus(articles, words, run_id)]
+        await ArticleOperations.bulk_create_articles(corpus, chunk_size=5000)
+        del corpus
+
+        def streamed(fmt):
+            async def export(output):
+                result = await export_published_articles(output, fmt, chunk_size=chunk_size)
+                return result['rows']
+            return export
+
+        print(f"articles={articles} words={words} chunk_size={chunk_size}")
+        print(f"{'path':<24} {'rows':>8} {'rows/s':>12} {'MB/s':>8} {'peak (MB)':>10}")
+        await measure('fetch-all ndjson', fetch_all_export)
+        await measure('streamed ndjson', streamed('ndjson'))
+        if pa is not None:
+            await measure('streamed parquet', streamed('parquet'))
+        else:
+            print("streamed parquet: skipped (pyarrow not installed)")
+    finally:
+        await db_manager.execute_query("DELETE FROM articles WHERE attributes->>'benchmark_run' = $1", run_id)
+        await db_manager.close()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--articles', type=int, default=100000)
+    parser.add_argument('--words', type=int, default=300)
+    parser.add_argument('--chunk-size', type=int, default=1000)
+    args = parser.parse_args()
+    asyncio.run(run(args.articles, args.words, args.chunk_size))
@@ -0,0 +1,75 @@
+"""
+Benchmark: hybrid_search candidate queries run concurrently vs sequentially
+
+Loads a generated corpus with local embeddings, then times the lexical and vector
+candidate queries issued one after the other against ArticleOperations.hybrid_search,
+which gathers them on separate pooled connections. The search cache is cleared
+before every call so both paths hit the database.
+
+    NEON_CONNECTION_STRING=postgresql://... python -m benchmarks.bench_hybrid_search --articles 20000
+"""
+import argparse
+import asyncio
+import time
+import uuid
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from src.database.connection import db_manager
+from src.database.cache import search_cache
+from src.database.operations import ArticleOperations
+from src.ai_services.embeddings import LocalHashEmbeddingProvider, article_embedding_text
+from benchmarks.bench_search import make_corpus, SEARCHES
+
+
+async def median_ms(func, repeats: int) -> float:
+    timings = []
+    for _ in range(repeats):
+        search_cache.invalidate()
+        start = time.perf_counter()
+        await func()
+        timings.append((time.perf_counter() - start) * 1000)
+    timings.sort()
+    return timings[len(timings) // 2]
+
+
+async def run(articles: int, candidates: int, repeats: int):
+    await db_manager.initialize()
+    run_id = uuid.uuid4().hex
+    provider = LocalHashEmbeddingProvider()
+    try:
+        corpus = list(make_corpus(articles, 300, run_id))
+        ids = await ArticleOperations.bulk_create_articles(corpus, chunk_size=5000)
+        for start in range(0, len(ids), 1000):
+            batch = corpus[start:start + 1000]
+            vectors = await provider.embed([article_embedding_text(a['title'], a['content']) for a in batch])
+            await ArticleOperations.upsert_embeddings(dict(zip(ids[start:start + 1000], vectors)))
+        await db_manager.execute_query("ANALYZE articles")
+
+        print(f"articles={articles} candidates={candidates}")
+        print(f"{'query':<28} {'sequential (ms)':>16} {'concurrent (ms)':>16}")
+        for search in SEARCHES:
+            embedding = (await provider.embed([search]))[0]
+
+            async def sequential():
+                await ArticleOperations.search_articles_bm25(search, limit=candidates)
+                await ArticleOperations.find_similar_to_embedding(embedding, k=candidates)
+
+            async def concurrent():
+                await ArticleOperations.hybrid_search(search, embedding, candidates=candidates)
+
+            print(f"{search:<28} {await median_ms(sequential, repeats):>16.1f} {await median_ms(concurrent, repeats):>16.1f}")
+    finally:
+        await db_manager.execute_query("DELETE FROM articles WHERE attributes->>'benchmark_run' = $1", run_id)
+        await db_manager.close()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--articles', type=int, default=20000)
+    parser.add_argument('--candidates', type=int, default=50)
+    parser.add_argument('--repeats', type=int, default=11)
+    args = parser.parse_args()
+    asyncio.run(run(args.articles, args.candidates, args.repeats))
@@ -0,0 +1,92 @@
+"""
+Microbenchmark: JSONB codec and prepared statement registry
+
+Part 1 (no database) compares stdlib json round-trips of article attributes
+with the serialization helpers the connection codec uses (orjson when installed).
+Part 2 (needs NEON_CONNECTION_STRING) compares get_article through the
+registered statement with an unprepared, text-JSON connection that re-parses
+the SQL on every call.
+
+    python -m benchmarks.bench_jsonb_codec --iterations 20000
+"""
+import argparse
+import asyncio
+import json
+import os
+import uuid
+import time
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from src.utils.serialization import json_dumps_bytes, json_loads, orjson
+
+ATTRIBUTES = {
+    'seo_title': 'Digital Nomad Visas in 2024: Complete Country Guide',
+    'seo_description': 'Compare remote work visas, income requirements and tax rules across 40 countries.',
+    'category': 'Guide',
+    'tags': ['visa', 'remote work', 'tax', 'relocation', 'europe', 'asia'],
+    'featured_image': 'https://res.cloudinary.com/quest/image/upload/v1/articles/visas.jpg',
+    'sources': [{'url': f'https://example.org/source/{i}', 'title': f'Source {i}'} for i in range(10)],
+}
+
+
+def bench(label: str, func, iterations: int):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<40} {elapsed * 1e6 / iterations:8.2f} us/op")
+
+
+def bench_serialization(iterations: int):
+    encoded = json.dumps(ATTRIBUTES)
+    print(f"serializer: {'orjson' if orjson else 'stdlib json'}")
+    bench('json.dumps (old write path)', lambda: json.dumps(ATTRIBUTES), iterations)
+    bench('codec encode', lambda: b'\x01' + json_dumps_bytes(ATTRIBUTES), iterations)
+    bench('json.loads (old read path)', lambda: json.loads(encoded), iterations)
+    bench('codec decode', lambda: json_loads(encoded.encode()), iterations)
+
+
+async def bench_database(iterations: int):
+    import asyncpg
+    from src.database.connection import db_manager
+    from src.database.operations import ArticleOperations
+
+    await db_manager.initialize()
+    article_id = await ArticleOperations.create_article_with_search(
+        'Codec benchmark article', '# Codec benchmark\n\nBody', ATTRIBUTES
+    )
+    query = db_manager.statements['get_article'][0]
+    unprepared = await asyncpg.connect(db_manager.connection_string, statement_cache_size=0)
+    try:
+        start = time.perf_counter()
+        for _ in range(iterations):
+            rows = await unprepared.fetch(query, uuid.UUID(article_id))
+            json.loads(rows[0]['attributes'])
+        baseline = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in range(iterations):
+            await ArticleOperations.get_article(article_id)
+        registered = time.perf_counter() - start
+
+        print(f"{'get_article unprepared + json.loads':<40} {baseline * 1e3 / iterations:8.3f} ms/op")
+        print(f"{'get_article registered + codec':<40} {registered * 1e3 / iterations:8.3f} ms/op")
+    finally:
+        await ArticleOperations.delete_article(article_id)
+        await unprepared.close()
+        await db_manager.close()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--iterations', type=int, default=20000)
+    parser.add_argument('--db-iterations', type=int, default=2000)
+    args = parser.parse_args()
+    bench_serialization(args.iterations)
+    if os.getenv('NEON_CONNECTION_STRING'):
+        asyncio.run(bench_database(args.db_iterations))
+    else:
+        print("NEON_CONNECTION_STRING not set; skipping database benchmark")
@@ -0,0 +1,93 @@
+"""
+Benchmark: bulk SEO/quality review via message batches, with a simulated restart
+
+Loads --articles published articles, then runs BulkAIReview against the local fake
+Messages/Batches API in two processes' worth of steps: a submit-only run
+(--no-wait), then a fresh instance that must resume and write back the batches the
+first one left behind. A final pass retries requests the fake failed
+(--error-rate). Checks every article ends with a quality score and SEO fields, and
+that no per-article Messages calls were made. Run against a database with no
+real in-flight ai_batches: pending batches are collected from the fake server.
+
+    NEON_CONNECTION_STRING=postgresql://... python -m benchmarks.bench_message_batches --articles 2000
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+import uuid
+
+from dotenv import load_dotenv
+
+from benchmarks.fake_anthropic import FakeAnthropicServer
+
+load_dotenv()
+
+
+async def run(articles: int, batch_size: int, batch_latency: float, error_rate: float) -> int:
+    with FakeAnthropicServer(batch_latency=batch_latency, batch_error_rate=error_rate) as server:
+        os.environ['CLAUDE_API_BASE_URL'] = server.url
+        os.environ['CLAUDE_API_KEY'] = 'fake-key'
+        from src.database.connection import db_manager
+        from src.database.operations import ArticleOperations
+        from src.jobs.bulk_ai_review import BulkAIReview
+        from benchmarks.bench_search import make_corpus
+
+        await db_manager.initialize()
+        run_id = uuid.uuid4().hex
+        try:
+            corpus = [dict(article, status='published') for article in make_corpus(articles, 300, run_id)]
+            await ArticleOperations.bulk_create_articles(corpus, chunk_size=5000)
+            del corpus
+
+            def review():
+                return BulkAIReview(
+                    batch_size=batch_size, poll_interval=batch_latency / 4, attributes={'benchmark_run': run_id}
+                )
+
+            start = time.perf_counter()
+            submitted = await review().run(wait=False)
+            print(f"submit-only run: {submitted}")
+
+            # "Restart": a new instance finds the recorded batches and collects them
+            resumed = await review().run()
+            print(f"resumed run:     {resumed}")
+
+            retried = await review().run()
+            print(f"retry run:       {retried}")
+            elapsed = time.perf_counter() - start
+
+            missing = await db_manager.execute_query("""
+                SELECT COUNT(*) AS missing FROM articles
+                WHERE attributes->>'benchmark_run' = $1
+                  AND (quality_score IS NULL OR COALESCE(attributes->>'seo_title', '') = '')
+            """, run_id, use_primary=True)
+
+            print(f"articles={articles} batch_size={batch_size} elapsed={elapsed:.2f}s "
+                  f"batches={len(server.batches)} batch_requests={server.batch_requests} "
+                  f"messages_requests={server.requests}")
+            print(f"articles still missing review: {missing[0]['missing']}")
+
+            ok = resumed.get('applied_batches') == submitted.get('submitted_batches') and server.requests == 0
+            # With an error rate, a few requests can fail twice in a row; those wait for the next run
+            ok = ok and (missing[0]['missing'] == 0 or error_rate > 0)
+            print("✅ batches resumed and written back" if ok else "❌ bulk review incomplete")
+            return 0 if ok else 1
+
+        finally:
+            await db_manager.execute_query(
+                "DELETE FROM ai_batches WHERE id = ANY($1::text[])", list(server.batches)
+            )
+            await db_manager.execute_query("DELETE FROM articles WHERE attributes->>'benchmark_run' = $1", run_id)
+            await db_manager.close()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--articles', type=int, default=2000)
+    parser.add_argument('--batch-size', type=int, default=500)
+    parser.add_argument('--batch-latency', type=float, default=2.0)
+    parser.add_argument('--error-rate', type=float, default=0.02)
+    args = parser.parse_args()
+    sys.exit(asyncio.run(run(args.articles, args.batch_size, args.batch_latency, args.error_rate)))
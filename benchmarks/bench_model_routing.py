@@ -0,0 +1,72 @@
+"""
+Benchmark: adaptive model routing against the fake API
+
+The fake primary model is slow and scores --primary-quality; the fast model is
+quick and scores --fast-quality. Runs --calls article generations and
+enhancements through ClaudeService with a small min-sample window and prints
+where the router sent them, fallbacks, and per-model latency. With a good fast
+model the primary-default call types should migrate to it; with a poor one they
+should stay on primary, with low-scoring fast results redone there.
+
+    python -m benchmarks.bench_model_routing --fast-quality 8
+    python -m benchmarks.bench_model_routing --fast-quality 5
+"""
+import argparse
+import asyncio
+import json
+import os
+import time
+
+from dotenv import load_dotenv
+
+from benchmarks.fake_anthropic import FakeAnthropicServer
+
+load_dotenv()
+
+
+async def run(calls: int, concurrency: int, fast_quality: int, primary_quality: int):
+    os.environ.setdefault('CLAUDE_REQUESTS_PER_MINUTE', '100000')
+    os.environ.setdefault('CLAUDE_TOKENS_PER_MINUTE', '100000000')
+    os.environ['CLAUDE_CACHE_ENABLED'] = 'false'
+    os.environ['CLAUDE_ROUTING_MIN_SAMPLES'] = '5'
+    os.environ['CLAUDE_ROUTING_EXPLORE_RATE'] = '0.2'
+    from src.ai_services.claude import ClaudeService
+
+    primary = os.getenv("CLAUDE_MODEL_PRIMARY", "claude-3-sonnet-20240229")
+    fast = os.getenv("CLAUDE_MODEL_FAST", "claude-3-haiku-20240307")
+
+    with FakeAnthropicServer(
+        latency=0.1,
+        model_latency={primary: 0.6, fast: 0.15},
+        model_quality={primary: primary_quality, fast: fast_quality}
+    ) as server:
+        service = ClaudeService(api_key='fake-key', base_url=server.url)
+        gate = asyncio.Semaphore(concurrency)
+
+        async def generate(index: int):
+            async with gate:
+                article = await service.generate_article_content(f"Remote work visas #{index}")
+                await service.enhance_content(article['content'] + f"\n\nRevision {index}")
+
+        start = time.perf_counter()
+        await asyncio.gather(*(generate(index) for index in range(calls)))
+        elapsed = time.perf_counter() - start
+        await service.close()
+
+        metrics = service.router.get_metrics()
+        print(f"calls={calls} fast_quality={fast_quality} primary_quality={primary_quality} "
+              f"elapsed={elapsed:.2f}s requests={server.requests}")
+        print(f"{'call type':<28} {'route':<8} {'decisions':<52} {'primary ms':>10} {'fast ms':>8}")
+        for task, figures in metrics['tasks'].items():
+            print(f"{task:<28} {figures['route']:<8} {json.dumps(figures['decisions']):<52} "
+                  f"{figures['primary']['avg_latency_ms'] or '-':>10} {figures['fast']['avg_latency_ms'] or '-':>8}")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--calls', type=int, default=100)
+    parser.add_argument('--concurrency', type=int, default=10)
+    parser.add_argument('--fast-quality', type=int, default=8)
+    parser.add_argument('--primary-quality', type=int, default=9)
+    args = parser.parse_args()
+    asyncio.run(run(args.calls, args.concurrency, args.fast_quality, args.primary_quality))
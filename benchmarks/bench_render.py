@@ -0,0 +1,79 @@
+"""
+Benchmark: render-on-read vs render-on-write for article views
+
+Bulk-loads a set of published articles, which renders their HTML once on write,
+then serves 10k views drawn from a skewed popularity distribution both ways:
+fetch the Markdown and render it per view, or fetch the stored content_html.
+
+    NEON_CONNECTION_STRING=postgresql://... python -m benchmarks.bench_render --views 10000
+"""
+import argparse
+import asyncio
+import random
+import time
+import uuid
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from src.database.connection import db_manager
+from src.database.operations import ArticleOperations
+from src.utils.rendering import render_markdown
+from benchmarks.bench_search import make_corpus
+
+READ_MARKDOWN = "SELECT content FROM articles WHERE id = $1"
+READ_HTML = "SELECT content_html FROM articles WHERE id = $1"
+
+
+async def serve(conn, ids, render: bool):
+    timings = []
+    query = READ_MARKDOWN if render else READ_HTML
+    for article_id in ids:
+        start = time.perf_counter()
+        value = await conn.fetchval(query, article_id)
+        if render:
+            render_markdown(value)
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def summarize(label: str, timings, elapsed: float):
+    timings = sorted(timings)
+    p50 = timings[len(timings) // 2]
+    p99 = timings[int(len(timings) * 0.99)]
+    print(f"{label:<18} {elapsed:>10.2f} {len(timings) / elapsed:>10.0f} {p50:>9.3f} {p99:>9.3f}")
+
+
+async def run(articles: int, views: int, words: int):
+    await db_manager.initialize()
+    run_id = uuid.uuid4().hex
+    try:
+        corpus = [dict(article, status='published') for article in make_corpus(articles, words, run_id)]
+        start = time.perf_counter()
+        ids = await ArticleOperations.bulk_create_articles(corpus, chunk_size=5000)
+        print(f"render-on-write: {len(ids)} articles loaded and rendered once in {time.perf_counter() - start:.2f}s")
+
+        rng = random.Random(11)
+        weights = [1 / (rank + 1) for rank in range(len(ids))]
+        view_ids = [uuid.UUID(article_id) for article_id in rng.choices(ids, weights=weights, k=views)]
+
+        print(f"articles={articles} views={views} words={words}")
+        print(f"{'path':<18} {'total (s)':>10} {'views/s':>10} {'p50 (ms)':>9} {'p99 (ms)':>9}")
+        async with db_manager.acquire() as conn:
+            for label, render in (('render-on-read', True), ('render-on-write', False)):
+                start = time.perf_counter()
+                timings = await serve(conn, view_ids, render)
+                summarize(label, timings, time.perf_counter() - start)
+    finally:
+        await db_manager.execute_query("DELETE FROM articles WHERE attributes->>'benchmark_run' = $1", run_id)
+        await db_manager.close()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--articles', type=int, default=500)
+    parser.add_argument('--views', type=int, default=10000)
+    parser.add_argument('--words', type=int, default=1200)
+    args = parser.parse_args()
+    asyncio.run(run(args.articles, args.views, args.words))
@@ -0,0 +1,123 @@
+"""
+Benchmark: legacy OR-of-two-vectors search vs weighted search_vector with deferred ts_headline
+
+Loads a generated corpus (100k articles by default) through bulk_create_articles,
+then times both query shapes for a set of search terms. The legacy query needs the
+old expression index, which is created for the run if migration 003 dropped it.
+
+    NEON_CONNECTION_STRING=postgresql://... python -m benchmarks.bench_search --articles 100000
+Generated rows are tagged with a run id and deleted afterwards.
+"""
+import argparse
+import asyncio
+import random
+import time
+import uuid
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from src.database.connection import db_manager
+from src.database.operations import ArticleOperations
+
+VOCABULARY = (
+    "visa remote work nomad tax residency coworking lisbon bali mexico city budget "
+    "insurance banking laptop internet coliving apartment rent flight passport "
+    "freelance startup income treaty health climate beach mountain community cafe "
+    "schengen digital permit embassy savings pension crypto invoice timezone meetup"
+).split()
+
+SEARCHES = [
+    "remote work visa",
+    "tax residency treaty",
+    "coworking lisbon",
+    "health insurance nomad",
+    "budget apartment rent",
+]
+
+LEGACY_QUERY = """
+    SELECT
+        id, title, status, attributes, created_at, published_at,
+        ts_rank_cd(title_search || content_search, websearch_to_tsquery($1)) as rank,
+        ts_headline('english', content, websearch_to_tsquery($1), 'MaxWords=20') as snippet
+    FROM articles
+    WHERE
+        title_search @@ websearch_to_tsquery($1)
+        OR content_search @@ websearch_to_tsquery($1)
+    ORDER BY rank DESC LIMIT $2
+"""
+
+
+def make_corpus(count: int, words: int, run_id: str):
+    """Deterministic synthetic articles built from a small travel/work vocabulary"""
+    rng = random.Random(42)
+    for i in range(count):
+        title = " ".join(rng.choice(VOCABULARY) for _ in range(6)).title()
+        sections = []
+        for heading in range(3):
+            body = " ".join(rng.choice(VOCABULARY) for _ in range(words // 3))
+            sections.append(f"## Section {heading + 1}\n\n{body}")
+        yield {
+            'title': title,
+            'content': f"# {title}\n\n" + "\n\n".join(sections),
+            'attributes': {'benchmark_run': run_id},
+            'status': 'published' if i % 2 else 'draft'
+        }
+
+
+async def median_ms(func, repeats: int) -> float:
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        await func()
+        timings.append((time.perf_counter() - start) * 1000)
+    timings.sort()
+    return timings[len(timings) // 2]
+
+
+async def run(articles: int, words: int, limit: int, repeats: int):
+    await db_manager.initialize()
+    run_id = uuid.uuid4().hex
+    created_legacy_index = False
+    try:
+        start = time.perf_counter()
+        await ArticleOperations.bulk_create_articles(make_corpus(articles, words, run_id), chunk_size=5000)
+        print(f"loaded {articles} articles in {time.perf_counter() - start:.1f}s")
+
+        async with db_manager.acquire() as conn:
+            created_legacy_index = not await conn.fetchval(
+                "SELECT EXISTS (SELECT 1 FROM pg_indexes WHERE indexname = 'articles_search_idx')"
+            )
+            if created_legacy_index:
+                await conn.execute(
+                    "CREATE INDEX articles_search_idx ON articles USING GIN ((title_search || content_search))"
+                )
+            await conn.execute("ANALYZE articles")
+
+        print(f"{'query':<28} {'legacy (ms)':>12} {'weighted (ms)':>14}")
+        for search in SEARCHES:
+            async def legacy():
+                async with db_manager.acquire() as conn:
+                    await conn.fetch(LEGACY_QUERY, search, limit)
+
+            async def weighted():
+                await ArticleOperations.search_articles_bm25(search, limit=limit)
+
+            print(f"{search:<28} {await median_ms(legacy, repeats):>12.1f} {await median_ms(weighted, repeats):>14.1f}")
+    finally:
+        async with db_manager.acquire() as conn:
+            if created_legacy_index:
+                await conn.execute("DROP INDEX IF EXISTS articles_search_idx")
+            await conn.execute("DELETE FROM articles WHERE attributes->>'benchmark_run' = $1", run_id)
+        await db_manager.close()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--articles', type=int, default=100000)
+    parser.add_argument('--words', type=int, default=300)
+    parser.add_argument('--limit', type=int, default=20)
+    parser.add_argument('--repeats', type=int, default=11)
+    args = parser.parse_args()
+    asyncio.run(run(args.articles, args.words, args.limit, args.repeats))
@@ -0,0 +1,61 @@
+"""
+Benchmark: time to first token, streamed vs blocking article generation
+
+Runs article generation against the local fake Messages API, where a full body
+takes --latency seconds. The blocking call shows nothing until the whole body
+arrives; the streaming call's first delta should arrive in well under a second.
+Also reports how many preview renders PREVIEW_FPS throttling allows.
+
+    python -m benchmarks.bench_streaming --latency 30
+"""
+import argparse
+import asyncio
+import os
+import time
+
+from dotenv import load_dotenv
+
+from benchmarks.fake_anthropic import FakeAnthropicServer
+
+load_dotenv()
+
+
+async def run(latency: float, runs: int):
+    os.environ.setdefault('CLAUDE_REQUESTS_PER_MINUTE', '100000')
+    os.environ.setdefault('CLAUDE_TOKENS_PER_MINUTE', '100000000')
+    from src.ai_services.claude import ClaudeService
+    from src.admin.content_editor import PREVIEW_FPS
+
+    with FakeAnthropicServer(latency=latency) as server:
+        service = ClaudeService(api_key='fake-key', base_url=server.url)
+        print(f"latency={latency}s runs={runs} preview_fps={PREVIEW_FPS}")
+        print(f"{'mode':<10} {'first text (s)':>15} {'complete (s)':>13} {'deltas':>7} {'previews':>9}")
+        for _ in range(runs):
+            start = time.perf_counter()
+            await service._create_message(service.primary_model, 4000, "Write an article about remote work visas")
+            blocking = time.perf_counter() - start
+            print(f"{'blocking':<10} {blocking:>15.2f} {blocking:>13.2f} {1:>7} {1:>9}")
+
+            start = time.perf_counter()
+            first = None
+            deltas = 0
+            previews = 0
+            last_preview = 0.0
+            async for _ in service.stream_article_content("Remote work visas"):
+                now = time.monotonic()
+                first = first or time.perf_counter() - start
+                deltas += 1
+                if now - last_preview >= 1 / PREVIEW_FPS:
+                    last_preview = now
+                    previews += 1
+            total = time.perf_counter() - start
+            print(f"{'streaming':<10} {first:>15.2f} {total:>13.2f} {deltas:>7} {previews + 1:>9}")
+        await service.close()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--latency', type=float, default=30.0, help='Seconds to produce a full article')
+    parser.add_argument('--runs', type=int, default=3)
+    args = parser.parse_args()
+    asyncio.run(run(args.latency, args.runs))
@@ -0,0 +1,115 @@
+"""
+Benchmark: recall and latency of ivfflat vs HNSW for content_embedding
+
+Loads a generated corpus with local embeddings, computes exact top-k neighbours
+with a sequential scan, then measures recall@k and median latency with only one
+ANN index visible at a time (the other is dropped inside a rolled-back transaction).
+Missing indexes are built for the run and removed afterwards.
+
+    NEON_CONNECTION_STRING=postgresql://... python -m benchmarks.bench_vector_index --articles 20000
+"""
+import argparse
+import asyncio
+import random
+import time
+import uuid
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from src.database.connection import db_manager
+from src.database.operations import ArticleOperations, _vector_literal
+from src.ai_services.embeddings import LocalHashEmbeddingProvider, article_embedding_text
+from benchmarks.bench_search import make_corpus
+
+INDEXES = {
+    'ivfflat': ('articles_embedding_idx', "USING ivfflat (content_embedding vector_cosine_ops) WITH (lists = {lists})"),
+    'hnsw': ('articles_embedding_hnsw_idx', "USING hnsw (content_embedding vector_cosine_ops) WITH (m = 16, ef_construction = 64)"),
+}
+
+NEIGHBOURS_QUERY = """
+    SELECT id FROM articles
+    WHERE content_embedding IS NOT NULL
+    ORDER BY content_embedding <=> $1::vector
+    LIMIT $2
+"""
+
+
+async def top_k(conn, vector: str, k: int):
+    rows = await conn.fetch(NEIGHBOURS_QUERY, vector, k)
+    return [row['id'] for row in rows]
+
+
+async def run(articles: int, queries: int, k: int, probes: int, ef_search: int):
+    await db_manager.initialize()
+    run_id = uuid.uuid4().hex
+    provider = LocalHashEmbeddingProvider()
+    created = []
+    try:
+        corpus = list(make_corpus(articles, 120, run_id))
+        ids = await ArticleOperations.bulk_create_articles(corpus, chunk_size=5000)
+        for start in range(0, len(ids), 1000):
+            batch = corpus[start:start + 1000]
+            vectors = await provider.embed([article_embedding_text(a['title'], a['content']) for a in batch])
+            await ArticleOperations.upsert_embeddings(dict(zip(ids[start:start + 1000], vectors)))
+
+        rng = random.Random(7)
+        samples = rng.sample(corpus, queries)
+        query_vectors = [
+            _vector_literal(v)
+            for v in await provider.embed([article_embedding_text(a['title'], a['content']) for a in samples])
+        ]
+
+        async with db_manager.acquire() as conn:
+            for name, (index_name, definition) in INDEXES.items():
+                exists = await conn.fetchval("SELECT EXISTS (SELECT 1 FROM pg_indexes WHERE indexname = $1)", index_name)
+                if not exists:
+                    ddl = definition.format(lists=max(10, articles // 1000))
+                    await conn.execute(f"CREATE INDEX {index_name} ON articles {ddl}")
+                    created.append(index_name)
+            await conn.execute("ANALYZE articles")
+
+            # Ground truth from an exact sequential scan
+            await conn.execute("SET enable_indexscan = off")
+            truth = [set(await top_k(conn, vector, k)) for vector in query_vectors]
+            await conn.execute("RESET enable_indexscan")
+            await conn.execute(f"SET ivfflat.probes = {probes}")
+            await conn.execute(f"SET hnsw.ef_search = {ef_search}")
+
+            print(f"articles={articles} queries={queries} k={k} probes={probes} ef_search={ef_search}")
+            print(f"{'index':<10} {'recall@k':>10} {'median (ms)':>12}")
+            for name in INDEXES:
+                other = next(index for key, (index, _) in INDEXES.items() if key != name)
+                transaction = conn.transaction()
+                await transaction.start()
+                try:
+                    await conn.execute(f"DROP INDEX {other}")
+                    hits, timings = 0, []
+                    for vector, expected in zip(query_vectors, truth):
+                        start = time.perf_counter()
+                        found = await top_k(conn, vector, k)
+                        timings.append((time.perf_counter() - start) * 1000)
+                        hits += len(expected.intersection(found))
+                    timings.sort()
+                    recall = hits / sum(len(expected) for expected in truth)
+                    print(f"{name:<10} {recall:>10.3f} {timings[len(timings) // 2]:>12.2f}")
+                finally:
+                    await transaction.rollback()
+    finally:
+        async with db_manager.acquire() as conn:
+            for index_name in created:
+                await conn.execute(f"DROP INDEX IF EXISTS {index_name}")
+            await conn.execute("DELETE FROM articles WHERE attributes->>'benchmark_run' = $1", run_id)
+        await db_manager.close()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--articles', type=int, default=20000)
+    parser.add_argument('--queries', type=int, default=200)
+    parser.add_argument('--k', type=int, default=10)
+    parser.add_argument('--probes', type=int, default=1, help='ivfflat.probes (pgvector default: 1)')
+    parser.add_argument('--ef-search', type=int, default=40, help='hnsw.ef_search (pgvector default: 40)')
+    args = parser.parse_args()
+    asyncio.run(run(args.articles, args.queries, args.k, args.probes, args.ef_search))
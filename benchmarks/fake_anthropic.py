@@ -0,0 +1,344 @@
+"""
+Local fake of the Anthropic Messages API for load tests and benchmarks
+
+Serves POST /v1/messages (JSON, or server-sent events when stream=true) on
+127.0.0.1 with configurable latency and enforces requests-per-minute /
+tokens-per-minute over a sliding 60 s window, returning
+anthropic-ratelimit-* headers and 429 + retry-after like the real API. Replies
+are shaped by the prompt so ClaudeService's parsers get usable output.
+
+Per-model latency and quality can be set (model_latency / model_quality): bodies
+carry a hidden marker naming the model that wrote them, and quality-scoring
+replies score by that marker, so routing between models can be exercised.
+Enhancement replies echo the content they were given, cut off at max_tokens, and
+`output_token_latency` adds generation time per output token.
+
+Also serves the Message Batches endpoints (create, retrieve, JSONL results):
+a batch stays in_progress for `batch_latency` seconds, then ends with
+`batch_error_rate` of its requests errored. Batches are not rate limited.
+
+    with FakeAnthropicServer(requests_per_minute=600, latency=0.2) as server:
+        service = ClaudeService(api_key='test', base_url=server.url)
+"""
+import json
+import random
+import re
+import threading
+import time
+import uuid
+from collections import deque
+from datetime import datetime, timezone, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+def fake_reply(prompt: str, max_tokens: int, model: str = None, model_quality: dict = None) -> str:
+    """Plausible output for each ClaudeService prompt type"""
+    if 'Rate this content quality' in prompt:
+        author = re.search(r'<!-- fake-model: (\S+) -->', prompt)
+        score = (model_quality or {}).get(author.group(1), 8) if author else 8
+        return f"SCORE: {score}, ISSUES: none"
+    if 'SEO_TITLE' in prompt:
+        return "SEO_TITLE: Remote Work Visa Guide\nMETA_DESCRIPTION: Everything you need to know.\nKEYWORDS: visa, remote work, nomad"
+    if 'meta description' in prompt:
+        return "Plan your move abroad with our practical remote work visa guide. Read it now."
+    for marker in ('Content to enhance:\n\n', 'Section to enhance:\n\n'):
+        if marker in prompt:
+            tag = f"<!-- fake-model: {model} -->\n\n" if model else ''
+            return (tag + prompt.split(marker, 1)[1])[:max_tokens * 4]
+
+    words = max(50, min(max_tokens, 1500) * 3 // 4)
+    sections = ["# Remote Work Visa Guide", ""]
+    if model:
+        sections += [f"<!-- fake-model: {model} -->", ""]
+    for number in range(1, 6):
+        sections += [f"## Section {number}", "", " ".join(["nomad"] * (words // 5)), ""]
+    return "\n".join(sections)
+
+
+class _Window:
+    """Sliding 60 s window of (timestamp, tokens) per admitted request"""
+
+    def __init__(self, requests_per_minute: int, tokens_per_minute: int):
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.events: deque = deque()
+        self.lock = threading.Lock()
+
+    def _expire(self, now: float):
+        while self.events and now - self.events[0][0] >= 60:
+            self.events.popleft()
+
+    def admit(self, tokens: int):
+        """(admitted, headers) for a request costing `tokens`"""
+        with self.lock:
+            now = time.monotonic()
+            self._expire(now)
+            used_tokens = sum(cost for _, cost in self.events)
+            admitted = (
+                len(self.events) < self.requests_per_minute
+                and used_tokens + tokens <= self.tokens_per_minute
+            )
+            if admitted:
+                self.events.append((now, tokens))
+                used_tokens += tokens
+
+            oldest = self.events[0][0] if self.events else now
+            reset = datetime.now(timezone.utc) + timedelta(seconds=max(0.0, 60 - (now - oldest)))
+            headers = {
+                'anthropic-ratelimit-requests-limit': str(self.requests_per_minute),
+                'anthropic-ratelimit-requests-remaining': str(max(0, self.requests_per_minute - len(self.events))),
+                'anthropic-ratelimit-requests-reset': reset.isoformat().replace('+00:00', 'Z'),
+                'anthropic-ratelimit-tokens-limit': str(self.tokens_per_minute),
+                'anthropic-ratelimit-tokens-remaining': str(max(0, self.tokens_per_minute - used_tokens)),
+                'anthropic-ratelimit-tokens-reset': reset.isoformat().replace('+00:00', 'Z'),
+            }
+            if not admitted:
+                headers['retry-after'] = str(max(1, int(60 - (now - oldest)) + 1))
+            return admitted, headers
+
+
+class FakeAnthropicServer:
+    """Threaded HTTP server; use as a context manager or call start()/stop()"""
+
+    def __init__(
+        self,
+        requests_per_minute: int = 1000,
+        tokens_per_minute: int = 10_000_000,
+        latency: float = 0.1,
+        port: int = 0,
+        batch_latency: float = 1.0,
+        batch_error_rate: float = 0.0,
+        model_latency: dict = None,
+        model_quality: dict = None,
+        output_token_latency: float = 0.0
+    ):
+        self.window = _Window(requests_per_minute, tokens_per_minute)
+        self.latency = latency
+        self.model_latency = model_latency or {}
+        self.model_quality = model_quality or {}
+        self.output_token_latency = output_token_latency
+        self.batch_latency = batch_latency
+        self.batch_error_rate = batch_error_rate
+        self.batches = {}
+        self.batch_requests = 0
+        self.requests = 0
+        self.rate_limited = 0
+        self.max_in_flight = 0
+        self._in_flight = 0
+        self._counter_lock = threading.Lock()
+        self._server = ThreadingHTTPServer(('127.0.0.1', port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> 'FakeAnthropicServer':
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> 'FakeAnthropicServer':
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def _track(self, delta: int):
+        with self._counter_lock:
+            self._in_flight += delta
+            self.max_in_flight = max(self.max_in_flight, self._in_flight)
+
+    def _handler_class(self):
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def log_message(self, *args):
+                pass
+
+            def _send_json(self, status: int, payload, headers=None):
+                body = json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header('content-type', 'application/json')
+                self.send_header('content-length', str(len(body)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def _not_found(self):
+                self._send_json(404, {'type': 'error', 'error': {'type': 'not_found_error', 'message': self.path}})
+
+            def do_POST(self):
+                length = int(self.headers.get('content-length', 0))
+                request = json.loads(self.rfile.read(length) or b'{}')
+                path = self.path.split('?')[0].rstrip('/')
+                if path == '/v1/messages':
+                    fake.handle_message(self, request)
+                elif path == '/v1/messages/batches':
+                    self._send_json(200, fake.create_batch(request))
+                else:
+                    self._not_found()
+
+            def do_GET(self):
+                parts = self.path.split('?')[0].strip('/').split('/')
+                if parts[:3] != ['v1', 'messages', 'batches'] or len(parts) not in (4, 5):
+                    self._not_found()
+                    return
+                batch = fake.batches.get(parts[3])
+                if batch is None:
+                    self._not_found()
+                elif len(parts) == 4:
+                    self._send_json(200, fake.batch_status(batch))
+                elif parts[4] == 'results' and fake.batch_status(batch)['processing_status'] == 'ended':
+                    body = ''.join(json.dumps(line) + '\n' for line in batch['results']).encode()
+                    self.send_response(200)
+                    self.send_header('content-type', 'application/binary')
+                    self.send_header('content-length', str(len(body)))
+                    self.end_headers()
+                    self.wfile.write(body)
+                else:
+                    self._not_found()
+
+        return Handler
+
+    def build_message(self, request) -> dict:
+        """Assistant message for a Messages API request body"""
+        prompt = ''.join(
+            message['content'] if isinstance(message['content'], str)
+            else ''.join(block.get('text', '') for block in message['content'])
+            for message in request.get('messages', [])
+        )
+        max_tokens = int(request.get('max_tokens', 1024))
+        text = fake_reply(prompt, max_tokens, request.get('model'), self.model_quality)
+        return {
+            'id': f"msg_{uuid.uuid4().hex[:24]}",
+            'type': 'message',
+            'role': 'assistant',
+            'model': request.get('model'),
+            'content': [{'type': 'text', 'text': text}],
+            'stop_reason': 'end_turn',
+            'stop_sequence': None,
+            'usage': {'input_tokens': len(prompt) // 4 + 1, 'output_tokens': min(max_tokens, len(text) // 4 + 1)}
+        }
+
+    def handle_message(self, handler, request):
+        """Messages endpoint: admit against the window, then reply after `latency`"""
+        message = self.build_message(request)
+
+        with self._counter_lock:
+            self.requests += 1
+        admitted, headers = self.window.admit(message['usage']['input_tokens'] + message['usage']['output_tokens'])
+        if not admitted:
+            with self._counter_lock:
+                self.rate_limited += 1
+            handler._send_json(429, {
+                'type': 'error',
+                'error': {'type': 'rate_limit_error', 'message': 'Fake rate limit exceeded'}
+            }, headers)
+            return
+
+        self._track(1)
+        try:
+            if request.get('stream'):
+                self._stream(handler, message, headers)
+                return
+            time.sleep(
+                self.model_latency.get(request.get('model'), self.latency)
+                + message['usage']['output_tokens'] * self.output_token_latency
+            )
+        finally:
+            self._track(-1)
+
+        handler._send_json(200, message, headers)
+
+    def stream_chunk_delay(self, chunks: int) -> float:
+        """First delta after ~0.1 s of `latency`; the rest of `latency` is spread over the chunks"""
+        return max(0.0, self.latency - 0.1) / max(1, chunks)
+
+    def _stream(self, handler, message, headers):
+        """Server-sent events in the Messages streaming format, one text delta per ~8 words"""
+        words = message['content'][0]['text'].split(' ')
+        chunks = [' '.join(words[i:i + 8]) + (' ' if i + 8 < len(words) else '') for i in range(0, len(words), 8)]
+
+        handler.send_response(200)
+        handler.send_header('content-type', 'text/event-stream')
+        handler.send_header('connection', 'close')
+        for name, value in headers.items():
+            handler.send_header(name, value)
+        handler.end_headers()
+        handler.close_connection = True
+
+        def event(name: str, data):
+            handler.wfile.write(f"event: {name}\ndata: {json.dumps(data)}\n\n".encode())
+            handler.wfile.flush()
+
+        start = dict(message, content=[], stop_reason=None,
+                     usage={'input_tokens': message['usage']['input_tokens'], 'output_tokens': 1})
+        time.sleep(min(self.latency, 0.1))
+        event('message_start', {'type': 'message_start', 'message': start})
+        event('content_block_start', {'type': 'content_block_start', 'index': 0,
+                                      'content_block': {'type': 'text', 'text': ''}})
+        delay = self.stream_chunk_delay(len(chunks))
+        for chunk in chunks:
+            event('content_block_delta', {'type': 'content_block_delta', 'index': 0,
+                                          'delta': {'type': 'text_delta', 'text': chunk}})
+            time.sleep(delay)
+        event('content_block_stop', {'type': 'content_block_stop', 'index': 0})
+        event('message_delta', {'type': 'message_delta',
+                                'delta': {'stop_reason': 'end_turn', 'stop_sequence': None},
+                                'usage': {'output_tokens': message['usage']['output_tokens']}})
+        event('message_stop', {'type': 'message_stop'})
+
+    def create_batch(self, request) -> dict:
+        """Message Batches create: results are computed up front and released after `batch_latency`"""
+        batch_id = f"msgbatch_{uuid.uuid4().hex[:24]}"
+        results = []
+        for item in request.get('requests', []):
+            if random.random() < self.batch_error_rate:
+                result = {'type': 'errored', 'error': {'type': 'error', 'error': {
+                    'type': 'api_error', 'message': 'Fake batch request failure'}}}
+            else:
+                result = {'type': 'succeeded', 'message': self.build_message(item['params'])}
+            results.append({'custom_id': item['custom_id'], 'result': result})
+
+        with self._counter_lock:
+            self.batch_requests += len(results)
+        self.batches[batch_id] = {
+            'id': batch_id,
+            'created_at': datetime.now(timezone.utc),
+            'started': time.monotonic(),
+            'results': results
+        }
+        return self.batch_status(self.batches[batch_id])
+
+    def batch_status(self, batch) -> dict:
+        """MessageBatch object: in_progress until `batch_latency` has passed, then ended"""
+        ended = time.monotonic() - batch['started'] >= self.batch_latency
+        succeeded = sum(1 for line in batch['results'] if line['result']['type'] == 'succeeded')
+        timestamp = lambda value: value.isoformat().replace('+00:00', 'Z')
+        return {
+            'id': batch['id'],
+            'type': 'message_batch',
+            'processing_status': 'ended' if ended else 'in_progress',
+            'request_counts': {
+                'processing': 0 if ended else len(batch['results']),
+                'succeeded': succeeded if ended else 0,
+                'errored': len(batch['results']) - succeeded if ended else 0,
+                'canceled': 0,
+                'expired': 0
+            },
+            'created_at': timestamp(batch['created_at']),
+            'expires_at': timestamp(batch['created_at'] + timedelta(hours=24)),
+            'ended_at': timestamp(batch['created_at'] + timedelta(seconds=self.batch_latency)) if ended else None,
+            'cancel_initiated_at': None,
+            'archived_at': None,
+            'results_url': f"{self.url}/v1/messages/batches/{batch['id']}/results" if ended else None
+        }
@@ -0,0 +1,72 @@
+"""
+Load test: N concurrent generate_article_content pipelines against the fake API
+
+Each pipeline makes one body call followed by three concurrent post-processing
+calls (SEO description, SEO metadata, quality score). The run fails (exit 1) if
+any pipeline misses the deadline - the old nested-semaphore design deadlocked
+once all permits were held by generations waiting on their own SEO call.
+With rate limits set high, wall time should stay close to two round trips
+regardless of N.
+
+    python -m benchmarks.load_generation_pipeline --concurrency 50 --latency 0.5
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+from dotenv import load_dotenv
+
+from benchmarks.fake_anthropic import FakeAnthropicServer
+
+load_dotenv()
+
+
+async def run(concurrency: int, latency: float, deadline: float) -> int:
+    os.environ.setdefault('CLAUDE_REQUESTS_PER_MINUTE', '100000')
+    os.environ.setdefault('CLAUDE_TOKENS_PER_MINUTE', '100000000')
+    os.environ.setdefault('CLAUDE_MAX_CONNECTIONS', str(concurrency * 4))
+    from src.ai_services.claude import ClaudeService
+
+    with FakeAnthropicServer(latency=latency) as server:
+        service = ClaudeService(api_key='fake-key', base_url=server.url)
+        start = time.perf_counter()
+        try:
+            results = await asyncio.wait_for(
+                asyncio.gather(*(
+                    service.generate_article_content(f"Remote work visas #{index}")
+                    for index in range(concurrency)
+                ), return_exceptions=True),
+                timeout=deadline
+            )
+        except asyncio.TimeoutError:
+            print(f"❌ DEADLOCK/STALL: {concurrency} pipelines did not finish within {deadline}s "
+                  f"(server saw {server.requests} requests)")
+            return 1
+        finally:
+            await service.close()
+        elapsed = time.perf_counter() - start
+
+    failures = [result for result in results if isinstance(result, Exception)]
+    complete = [
+        result for result in results
+        if not isinstance(result, Exception)
+        and result['seo_description'] and result['seo_metadata'] and result['quality_score']
+    ]
+    print(f"concurrency={concurrency} latency={latency}s elapsed={elapsed:.2f}s "
+          f"(~{elapsed / latency:.1f} round trips) requests={server.requests} "
+          f"max_in_flight={server.max_in_flight}")
+    print(f"complete={len(complete)} failed={len(failures)}")
+    for failure in failures[:5]:
+        print(f"  {failure!r}")
+    return 0 if len(complete) == concurrency else 1
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--concurrency', type=int, default=50)
+    parser.add_argument('--latency', type=float, default=0.5)
+    parser.add_argument('--deadline', type=float, default=60.0)
+    args = parser.parse_args()
+    sys.exit(asyncio.run(run(args.concurrency, args.latency, args.deadline)))
@@ -0,0 +1,125 @@
+"""
+Load test: several worker pools draining one generation queue concurrently
+
+Queues --jobs topics, then drains them with --pools independent GenerationWorkerPool
+instances (standing in for separate app processes) against the local fake Messages
+API, image step disabled. Every job must succeed exactly once: one article per job
+and no job processed by two pools. --fail-rate makes that share of first attempts
+fail right after the article insert, before its checkpoint - exercising the
+retry/backoff path, checkpoint resume and the idempotent create step.
+Queued jobs and created articles are deleted afterwards.
+
+    NEON_CONNECTION_STRING=postgresql://... python -m benchmarks.load_generation_queue --jobs 200 --pools 4
+"""
+import argparse
+import asyncio
+import os
+import random
+import sys
+import time
+import uuid
+
+from dotenv import load_dotenv
+
+from benchmarks.fake_anthropic import FakeAnthropicServer
+
+load_dotenv()
+
+
+async def run(jobs: int, pools: int, workers: int, latency: float, fail_rate: float) -> int:
+    os.environ.setdefault('CLAUDE_REQUESTS_PER_MINUTE', '100000')
+    os.environ.setdefault('CLAUDE_TOKENS_PER_MINUTE', '100000000')
+    # The image step is disabled for these jobs, so Replicate is never called
+    os.environ.setdefault('REPLICATE_API_TOKEN', 'unused')
+
+    with FakeAnthropicServer(latency=latency) as server:
+        os.environ['CLAUDE_API_BASE_URL'] = server.url
+        os.environ['CLAUDE_API_KEY'] = 'fake-key'
+        from src.database.connection import db_manager
+        from src.database.operations import ArticleOperations, GenerationJobOperations
+        from src.jobs.generation_queue import GenerationWorkerPool
+
+        await db_manager.initialize()
+        batch = f"benchmark-{uuid.uuid4().hex[:12]}"
+        try:
+            await GenerationJobOperations.enqueue(
+                batch,
+                [f"Remote work visas #{index}" for index in range(jobs)],
+                options={'status': 'draft', 'generate_image': False},
+                max_attempts=3
+            )
+
+            worker_pools = []
+            for number in range(pools):
+                pool = GenerationWorkerPool(workers=workers, retry_base_delay=0.01, retry_max_delay=0.01)
+                # Distinct worker ids, as separate processes would have
+                pool.process_id = f"{pool.process_id}-pool{number}"
+                worker_pools.append(pool)
+
+            if fail_rate:
+                create = ArticleOperations.create_generated_article
+                failed_once = set()
+
+                async def flaky_create(generation_job_id, *args, **kwargs):
+                    article_id = await create(generation_job_id, *args, **kwargs)
+                    if generation_job_id not in failed_once and random.random() < fail_rate:
+                        failed_once.add(generation_job_id)
+                        raise ValueError("Injected failure after insert")
+                    return article_id
+
+                ArticleOperations.create_generated_article = staticmethod(flaky_create)
+
+            start = time.perf_counter()
+            # Delayed retries make the queue look empty briefly; drain until nothing is left
+            while True:
+                results = await asyncio.gather(*(pool.drain() for pool in worker_pools))
+                progress = next(
+                    batch_progress for batch_progress in await GenerationJobOperations.get_batch_progress(100)
+                    if batch_progress['batch_name'] == batch
+                )
+                if not progress['queued'] and not progress['running']:
+                    break
+                await asyncio.sleep(0.05)
+            elapsed = time.perf_counter() - start
+
+            duplicates = await db_manager.execute_query("""
+                SELECT COUNT(*) - COUNT(DISTINCT a.generation_job_id) AS duplicates,
+                       COUNT(*) AS articles
+                FROM articles a JOIN generation_jobs j ON j.id = a.generation_job_id
+                WHERE j.batch_name = $1
+            """, batch, use_primary=True)
+
+            print(f"jobs={jobs} pools={pools} workers/pool={workers} latency={latency}s "
+                  f"elapsed={elapsed:.2f}s throughput={jobs / elapsed * 60:.0f} jobs/min "
+                  f"claude_requests={server.requests}")
+            print(f"progress={dict(progress)}")
+            print(f"per_pool={[result for result in results]}")
+            print(f"articles={duplicates[0]['articles']} duplicate_articles={duplicates[0]['duplicates']}")
+
+            ok = (
+                progress['succeeded'] == jobs
+                and duplicates[0]['articles'] == jobs
+                and duplicates[0]['duplicates'] == 0
+            )
+            print("✅ every job produced exactly one article" if ok else "❌ queue invariants violated")
+            return 0 if ok else 1
+
+        finally:
+            await db_manager.execute_query(
+                "DELETE FROM articles WHERE generation_job_id IN (SELECT id FROM generation_jobs WHERE batch_name = $1)", batch
+            )
+            await db_manager.execute_query(
+                "DELETE FROM generation_jobs WHERE batch_name = $1", batch
+            )
+            await db_manager.close()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--jobs', type=int, default=200)
+    parser.add_argument('--pools', type=int, default=4)
+    parser.add_argument('--workers', type=int, default=4)
+    parser.add_argument('--latency', type=float, default=0.2)
+    parser.add_argument('--fail-rate', type=float, default=0.1)
+    args = parser.parse_args()
+    sys.exit(asyncio.run(run(args.jobs, args.pools, args.workers, args.latency, args.fail_rate)))
@@ -19,8 +19,19 @@ CREATE TABLE IF NOT EXISTS articles (
     title_search TSVECTOR GENERATED ALWAYS AS (to_tsvector('english', title)) STORED,
     content_search TSVECTOR GENERATED ALWAYS AS (to_tsvector('english', content)) STORED,
     
-    -- AI embeddings for similarity and personalization
+    -- Single weighted vector used for ranking: title matches (A) outrank body matches (B)
+    search_vector TSVECTOR GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', title), 'A') ||
+        setweight(to_tsvector('english', content), 'B')
+    ) STORED,
+    
+    -- Sanitized HTML rendered on write; hash = md5(renderer version || content) it was rendered from
+    content_html TEXT,
+    content_html_hash TEXT,
+    
+    -- AI embeddings for similarity and personalization (embedded_at: last embedding write)
     content_embedding vector(1536),
+    embedded_at TIMESTAMPTZ,
     
     -- Audit and workflow tracking
     created_at TIMESTAMPTZ DEFAULT NOW(),
@@ -33,16 +44,21 @@ CREATE TABLE IF NOT EXISTS articles (
     ai_generated BOOLEAN DEFAULT false,
     ai_model TEXT,
     generation_prompt TEXT,
-    quality_score DECIMAL(3,2)
+    quality_score DECIMAL(4,2),
+    quality_issues JSONB,
+    
+    -- Batch generation job that created the article (unique: retried jobs never insert twice)
+    generation_job_id UUID
 );
 
 -- Performance indexes
-CREATE INDEX IF NOT EXISTS articles_search_idx ON articles USING GIN ((title_search || content_search));
-CREATE INDEX IF NOT EXISTS articles_status_idx ON articles (status, created_at DESC);
-CREATE INDEX IF NOT EXISTS articles_embedding_idx ON articles USING ivfflat (content_embedding vector_cosine_ops);
+CREATE INDEX IF NOT EXISTS articles_search_vector_idx ON articles USING GIN (search_vector);
+CREATE INDEX IF NOT EXISTS articles_status_keyset_idx ON articles (status, created_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS articles_embedding_hnsw_idx ON articles USING hnsw (content_embedding vector_cosine_ops) WITH (m = 16, ef_construction = 64);
 CREATE INDEX IF NOT EXISTS articles_attributes_idx ON articles USING GIN (attributes);
-CREATE INDEX IF NOT EXISTS articles_created_idx ON articles (created_at DESC);
+CREATE INDEX IF NOT EXISTS articles_created_keyset_idx ON articles (created_at DESC, id DESC);
 CREATE INDEX IF NOT EXISTS articles_published_idx ON articles (published_at DESC) WHERE status = 'published';
+CREATE UNIQUE INDEX IF NOT EXISTS articles_generation_job_idx ON articles (generation_job_id);
 
 -- Update trigger for updated_at
 CREATE OR REPLACE FUNCTION update_updated_at_column()
@@ -53,11 +69,262 @@ BEGIN
 END;
 $$ language 'plpgsql';
 
+-- Embedding-only writes keep updated_at (ETags, exports and watermarks key off it)
+DROP TRIGGER IF EXISTS update_articles_updated_at ON articles;
 CREATE TRIGGER update_articles_updated_at 
     BEFORE UPDATE ON articles 
     FOR EACH ROW 
+    WHEN (
+        OLD.content_embedding IS NOT DISTINCT FROM NEW.content_embedding
+        OR (OLD.title, OLD.content, OLD.status, OLD.attributes, OLD.content_html, OLD.published_at)
+           IS DISTINCT FROM (NEW.title, NEW.content, NEW.status, NEW.attributes, NEW.content_html, NEW.published_at)
+    )
     EXECUTE FUNCTION update_updated_at_column();
 
+-- Per-status article counts maintained by statement-level triggers,
+-- so dashboard stats are an O(1) read instead of a GROUP BY over articles
+CREATE TABLE IF NOT EXISTS article_counts (
+    status TEXT PRIMARY KEY,
+    count BIGINT NOT NULL DEFAULT 0
+);
+
+CREATE OR REPLACE FUNCTION maintain_article_counts()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        INSERT INTO article_counts (status, count)
+        SELECT status, COUNT(*) FROM new_rows
+        WHERE status IS NOT NULL
+        GROUP BY status
+        ORDER BY status
+        ON CONFLICT (status) DO UPDATE SET count = article_counts.count + EXCLUDED.count;
+    ELSIF TG_OP = 'UPDATE' THEN
+        INSERT INTO article_counts (status, count)
+        SELECT status, SUM(delta) FROM (
+            SELECT status, 1 AS delta FROM new_rows
+            UNION ALL
+            SELECT status, -1 AS delta FROM old_rows
+        ) changes
+        WHERE status IS NOT NULL
+        GROUP BY status
+        HAVING SUM(delta) <> 0
+        ORDER BY status
+        ON CONFLICT (status) DO UPDATE SET count = article_counts.count + EXCLUDED.count;
+    ELSE
+        INSERT INTO article_counts (status, count)
+        SELECT status, -COUNT(*) FROM old_rows
+        WHERE status IS NOT NULL
+        GROUP BY status
+        ORDER BY status
+        ON CONFLICT (status) DO UPDATE SET count = article_counts.count + EXCLUDED.count;
+    END IF;
+    RETURN NULL;
+END;
+$$ language 'plpgsql';
+
+DROP TRIGGER IF EXISTS article_counts_insert ON articles;
+CREATE TRIGGER article_counts_insert
+    AFTER INSERT ON articles
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION maintain_article_counts();
+
+DROP TRIGGER IF EXISTS article_counts_update ON articles;
+CREATE TRIGGER article_counts_update
+    AFTER UPDATE ON articles
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION maintain_article_counts();
+
+DROP TRIGGER IF EXISTS article_counts_delete ON articles;
+CREATE TRIGGER article_counts_delete
+    AFTER DELETE ON articles
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION maintain_article_counts();
+
+-- Recount articles per status, returning any drift that was corrected
+CREATE OR REPLACE FUNCTION rebuild_article_counts()
+RETURNS TABLE (
+    article_status TEXT,
+    stored_count BIGINT,
+    actual_count BIGINT
+) AS $$
+BEGIN
+    -- Block concurrent writers so the recount is exact
+    LOCK TABLE articles IN SHARE MODE;
+    
+    RETURN QUERY
+    SELECT 
+        COALESCE(actual.status, stored.status),
+        COALESCE(stored.count, 0)::BIGINT,
+        COALESCE(actual.count, 0)::BIGINT
+    FROM (
+        SELECT a.status, COUNT(*) AS count
+        FROM articles a
+        WHERE a.status IS NOT NULL
+        GROUP BY a.status
+    ) actual
+    FULL OUTER JOIN article_counts stored ON stored.status = actual.status
+    WHERE COALESCE(stored.count, 0) <> COALESCE(actual.count, 0);
+    
+    DELETE FROM article_counts;
+    INSERT INTO article_counts (status, count)
+    SELECT a.status, COUNT(*)
+    FROM articles a
+    WHERE a.status IS NOT NULL
+    GROUP BY a.status;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Cache invalidation for app replicas: NOTIFY article_changes with the id of every
+-- changed article that was published (only published articles are cached). Large
+-- statements send a single '*' so listeners flush instead of receiving thousands of
+-- messages. Notifications are delivered on commit, so rolled-back edits stay silent.
+CREATE OR REPLACE FUNCTION notify_article_changes()
+RETURNS TRIGGER AS $$
+DECLARE
+    changed_count INTEGER;
+BEGIN
+    SELECT COUNT(*) INTO changed_count FROM old_rows WHERE status = 'published';
+    
+    IF changed_count > 100 THEN
+        PERFORM pg_notify('article_changes', '*');
+    ELSIF changed_count > 0 THEN
+        PERFORM pg_notify('article_changes', id::text)
+        FROM old_rows
+        WHERE status = 'published';
+    END IF;
+    RETURN NULL;
+END;
+$$ language 'plpgsql';
+
+DROP TRIGGER IF EXISTS article_changes_update ON articles;
+CREATE TRIGGER article_changes_update
+    AFTER UPDATE ON articles
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION notify_article_changes();
+
+DROP TRIGGER IF EXISTS article_changes_delete ON articles;
+CREATE TRIGGER article_changes_delete
+    AFTER DELETE ON articles
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION notify_article_changes();
+
+-- Tombstones for incremental exports: published articles that were unpublished or deleted
+CREATE TABLE IF NOT EXISTS article_tombstones (
+    article_id UUID PRIMARY KEY,
+    removed_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS article_tombstones_removed_idx ON article_tombstones (removed_at, article_id);
+
+CREATE OR REPLACE FUNCTION record_article_tombstone()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF OLD.status = 'published' AND (TG_OP = 'DELETE' OR NEW.status IS DISTINCT FROM 'published') THEN
+        INSERT INTO article_tombstones (article_id, removed_at)
+        VALUES (OLD.id, NOW())
+        ON CONFLICT (article_id) DO UPDATE SET removed_at = EXCLUDED.removed_at;
+    ELSIF TG_OP = 'UPDATE' AND NEW.status = 'published' AND OLD.status IS DISTINCT FROM 'published' THEN
+        DELETE FROM article_tombstones WHERE article_id = NEW.id;
+    END IF;
+    RETURN NULL;
+END;
+$$ language 'plpgsql';
+
+DROP TRIGGER IF EXISTS article_tombstones_update ON articles;
+CREATE TRIGGER article_tombstones_update
+    AFTER UPDATE OF status ON articles
+    FOR EACH ROW
+    EXECUTE FUNCTION record_article_tombstone();
+
+DROP TRIGGER IF EXISTS article_tombstones_delete ON articles;
+CREATE TRIGGER article_tombstones_delete
+    AFTER DELETE ON articles
+    FOR EACH ROW
+    EXECUTE FUNCTION record_article_tombstone();
+
+-- Precomputed nearest neighbours for published articles (refreshed incrementally)
+CREATE TABLE IF NOT EXISTS related_articles (
+    article_id UUID NOT NULL REFERENCES articles(id) ON DELETE CASCADE,
+    related_id UUID NOT NULL REFERENCES articles(id) ON DELETE CASCADE,
+    rank SMALLINT NOT NULL,
+    similarity REAL NOT NULL,
+    computed_at TIMESTAMPTZ DEFAULT NOW(),
+    PRIMARY KEY (article_id, rank)
+);
+
+CREATE INDEX IF NOT EXISTS related_articles_related_idx ON related_articles (related_id);
+
+-- Watermarks and other resumable state for background jobs
+CREATE TABLE IF NOT EXISTS job_state (
+    job_name TEXT PRIMARY KEY,
+    state JSONB NOT NULL DEFAULT '{}',
+    updated_at TIMESTAMPTZ DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS articles_updated_idx ON articles (updated_at, id);
+CREATE INDEX IF NOT EXISTS articles_changed_idx ON articles ((GREATEST(updated_at, embedded_at)), id);
+
+-- Content-addressed cache of Claude responses (key = sha256 of method, model, parameters, prompt)
+CREATE TABLE IF NOT EXISTS ai_response_cache (
+    cache_key TEXT PRIMARY KEY,
+    method TEXT NOT NULL,
+    model TEXT NOT NULL,
+    response JSONB NOT NULL,
+    size_bytes INTEGER NOT NULL,
+    hit_count INTEGER NOT NULL DEFAULT 0,
+    created_at TIMESTAMPTZ DEFAULT NOW(),
+    last_used_at TIMESTAMPTZ DEFAULT NOW(),
+    expires_at TIMESTAMPTZ NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS ai_response_cache_expires_idx ON ai_response_cache (expires_at);
+CREATE INDEX IF NOT EXISTS ai_response_cache_last_used_idx ON ai_response_cache (last_used_at DESC);
+
+-- Durable queue for batch article generation; workers claim rows with FOR UPDATE SKIP LOCKED
+CREATE TABLE IF NOT EXISTS generation_jobs (
+    id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    batch_name TEXT NOT NULL,
+    topic TEXT NOT NULL,
+    target_audience TEXT NOT NULL DEFAULT 'digital_nomads',
+    options JSONB NOT NULL DEFAULT '{}',
+    status TEXT NOT NULL DEFAULT 'queued' CHECK (status IN ('queued', 'running', 'succeeded', 'failed', 'cancelled')),
+    step TEXT,
+    checkpoint JSONB NOT NULL DEFAULT '{}',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL DEFAULT 5,
+    run_after TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    locked_by TEXT,
+    locked_at TIMESTAMPTZ,
+    last_error TEXT,
+    article_id UUID REFERENCES articles(id) ON DELETE SET NULL,
+    created_at TIMESTAMPTZ DEFAULT NOW(),
+    updated_at TIMESTAMPTZ DEFAULT NOW(),
+    finished_at TIMESTAMPTZ
+);
+
+CREATE INDEX IF NOT EXISTS generation_jobs_ready_idx ON generation_jobs (run_after, created_at) WHERE status = 'queued';
+CREATE INDEX IF NOT EXISTS generation_jobs_running_idx ON generation_jobs (locked_at) WHERE status = 'running';
+CREATE INDEX IF NOT EXISTS generation_jobs_batch_idx ON generation_jobs (batch_name, status);
+
+-- Message batches submitted for bulk SEO/quality review; unapplied rows are resumed after a restart
+CREATE TABLE IF NOT EXISTS ai_batches (
+    id TEXT PRIMARY KEY,
+    status TEXT NOT NULL DEFAULT 'submitted' CHECK (status IN ('submitted', 'ended', 'applied')),
+    article_ids UUID[] NOT NULL,
+    request_count INTEGER NOT NULL,
+    request_counts JSONB,
+    submitted_at TIMESTAMPTZ DEFAULT NOW(),
+    ended_at TIMESTAMPTZ,
+    applied_at TIMESTAMPTZ
+);
+
+CREATE INDEX IF NOT EXISTS ai_batches_pending_idx ON ai_batches (submitted_at) WHERE status <> 'applied';
+
 -- Row Level Security (RLS) setup
 ALTER TABLE articles ENABLE ROW LEVEL SECURITY;
 
@@ -80,6 +347,7 @@ RETURNS TABLE (
     snippet TEXT
 ) AS $$
 BEGIN
+    -- Rank on the indexed search_vector first; ts_headline only runs on the top-N rows
     RETURN QUERY
     SELECT 
         a.id,
@@ -89,14 +357,17 @@ BEGIN
         a.attributes,
         a.created_at,
         a.published_at,
-        ts_rank_cd(a.title_search || a.content_search, websearch_to_tsquery(search_query)) as rank,
-        ts_headline('english', a.content, websearch_to_tsquery(search_query), 'MaxWords=20') as snippet
-    FROM articles a
-    WHERE 
-        a.title_search @@ websearch_to_tsquery(search_query) 
-        OR a.content_search @@ websearch_to_tsquery(search_query)
-    ORDER BY rank DESC
-    LIMIT result_limit;
+        ranked.score,
+        ts_headline('english', a.content, ranked.query, 'MaxWords=20') as snippet
+    FROM (
+        SELECT r.id, ts_rank_cd(r.search_vector, q.query) as score, q.query
+        FROM articles r, websearch_to_tsquery('english', search_query) AS q(query)
+        WHERE r.search_vector @@ q.query
+        ORDER BY score DESC
+        LIMIT result_limit
+    ) ranked
+    JOIN articles a ON a.id = ranked.id
+    ORDER BY ranked.score DESC;
 END;
 $$ LANGUAGE plpgsql;
 
@@ -0,0 +1,81 @@
+"""
+Quest-CMS published article export
+Usage: python export.py [--format ndjson|parquet] [--output PATH] [--updated-since ISO8601]
+
+Writes to stdout when --output is omitted (NDJSON only). The final log line reports
+the watermark to pass as --updated-since on the next incremental sync. Incremental
+output overlaps the previous sync by a few minutes (upsert rows by id) and ends with
+tombstones ("deleted": true) for articles unpublished or deleted since.
+"""
+import argparse
+import asyncio
+import logging
+import sys
+from datetime import datetime, timezone
+
+from dotenv import load_dotenv
+
+# Load environment variables
+load_dotenv()
+
+# Configure logging (stderr, so NDJSON on stdout stays clean)
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    stream=sys.stderr
+)
+logger = logging.getLogger(__name__)
+
+from src.database.connection import db_manager
+from src.export.articles import export_published_articles, EXPORT_FORMATS
+
+
+def parse_timestamp(value: str) -> datetime:
+    """ISO 8601 timestamp; naive values are taken as UTC"""
+    parsed = datetime.fromisoformat(value)
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Command line interface definition"""
+    parser = argparse.ArgumentParser(description='Export published Quest-CMS articles')
+    parser.add_argument('--format', choices=list(EXPORT_FORMATS), default='ndjson')
+    parser.add_argument('--output', help='Output file (default: stdout, NDJSON only)')
+    parser.add_argument('--updated-since', type=parse_timestamp, default=None,
+                        help='Only articles updated after this timestamp (incremental sync)')
+    parser.add_argument('--chunk-size', type=int, default=1000, help='Rows fetched and written per chunk')
+    return parser
+
+
+async def run(args) -> int:
+    """Run the export with an initialized database pool"""
+    if args.output is None and args.format != 'ndjson':
+        logger.error("❌ Parquet exports need --output")
+        return 2
+
+    await db_manager.initialize()
+    try:
+        if args.output is None:
+            result = await export_published_articles(
+                sys.stdout.buffer, args.format, args.updated_since, args.chunk_size
+            )
+        else:
+            with open(args.output, 'wb') as output:
+                result = await export_published_articles(
+                    output, args.format, args.updated_since, args.chunk_size
+                )
+        logger.info(
+            f"✅ Exported {result['rows']} articles and {result['tombstones']} tombstones; "
+            f"next --updated-since {result['watermark']}"
+        )
+        return 0
+    except ValueError as e:
+        logger.error(f"❌ Export failed: {e}")
+        return 1
+    finally:
+        await db_manager.close()
+
+
+if __name__ == '__main__':
+    arguments = build_parser().parse_args()
+    sys.exit(asyncio.run(run(arguments)))
@@ -20,12 +20,17 @@ logger = logging.getLogger(__name__)
 
 # Import application modules
 from src.database.connection import db_manager
+from src.database.cache import search_cache, article_cache
 from src.admin.dashboard import admin_dashboard
 from src.admin.content_editor import content_editor  
 from src.admin.review_workflow import review_workflow
+from src.admin.generation_queue import generation_queue_page
 from src.ai_services.claude import claude_service
 from src.ai_services.replicate_service import replicate_service
 from src.utils.validation import SystemValidator
+from src.jobs.related_articles import RelatedArticlesRefresh
+from src.jobs.generation_queue import GenerationWorkerPool
+from src.api import public as public_api
 
 class QuestCMS:
     """
@@ -35,6 +40,7 @@ class QuestCMS:
     
     def __init__(self):
         self.initialized = False
+        self.background_tasks = []
         
     async def initialize(self):
         """
@@ -71,6 +77,24 @@ class QuestCMS:
             performance_results = await SystemValidator.validate_performance_baseline()
             logger.info(f"✅ Performance baseline: {performance_results}")
             
+            # 7. Cross-replica cache invalidation for the public article cache
+            await db_manager.listen('article_changes', article_cache.handle_notification)
+            logger.info("✅ Listening for article changes")
+            
+            # 8. Background jobs (advisory-locked, so every replica can start them safely)
+            refresh_interval = int(os.getenv("RELATED_ARTICLES_REFRESH_INTERVAL", "0"))
+            if refresh_interval > 0:
+                self.background_tasks.append(
+                    asyncio.create_task(RelatedArticlesRefresh().run_forever(refresh_interval))
+                )
+                logger.info(f"✅ Related articles refresh scheduled every {refresh_interval}s")
+            
+            # 9. Batch generation workers (SKIP LOCKED claims, so every replica can drain the queue)
+            if int(os.getenv("GENERATION_WORKERS", "2")) > 0:
+                generation_pool = GenerationWorkerPool.from_env()
+                self.background_tasks.append(asyncio.create_task(generation_pool.run_forever()))
+                logger.info(f"✅ Batch generation workers started ({generation_pool.workers})")
+            
             self.initialized = True
             logger.info("🚀 Quest-CMS initialization completed successfully!")
             
@@ -81,6 +105,10 @@ class QuestCMS:
     async def shutdown(self):
         """Cleanup on application shutdown"""
         try:
+            for task in self.background_tasks:
+                task.cancel()
+            await asyncio.gather(*self.background_tasks, return_exceptions=True)
+            await claude_service.close()
             await db_manager.close()
             logger.info("🔄 Quest-CMS shutdown completed")
         except Exception as e:
@@ -89,6 +117,9 @@ class QuestCMS:
 # Global application instance
 quest_cms = QuestCMS()
 
+# Public read-only JSON API for Quest sites
+app.include_router(public_api.router)
+
 # NiceGUI Application Setup
 @ui.page('/')
 async def index():
@@ -107,7 +138,13 @@ async def health_check():
             'status': 'healthy',
             'database': 'connected',
             'ai_services': 'available',
-            'memory_usage': SystemValidator.check_memory_usage()['percent_used']
+            'memory_usage': SystemValidator.check_memory_usage()['percent_used'],
+            'database_pool': db_manager.get_pool_metrics(),
+            'search_cache': search_cache.get_metrics(),
+            'article_cache': article_cache.get_metrics(),
+            'claude_rate_limit': claude_service.rate_limiter.get_metrics(),
+            'claude_cache': claude_service.response_cache.get_metrics(),
+            'claude_routing': claude_service.router.get_metrics()
         }
         
         ui.json(health_status)
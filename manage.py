@@ -0,0 +1,189 @@
+"""
+Quest-CMS maintenance commands
+Usage: python manage.py <command> [options]
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import sys
+
+from dotenv import load_dotenv
+
+# Load environment variables
+load_dotenv()
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+from src.database.connection import db_manager
+from src.database.operations import AIResponseCacheOperations, ArticleOperations, GenerationJobOperations
+from src.jobs.embedding_backfill import EmbeddingBackfill
+from src.jobs.related_articles import RelatedArticlesRefresh
+
+
+async def check_counts(args) -> int:
+    """Verify article_counts against a full recount, optionally repairing drift"""
+    drift = await ArticleOperations.check_article_counts(repair=args.repair)
+
+    if not drift:
+        logger.info("✅ article_counts is consistent")
+        return 0
+
+    for row in drift:
+        logger.warning(
+            f"status={row['article_status']} stored={row['stored_count']} actual={row['actual_count']}"
+        )
+
+    if args.repair:
+        logger.info(f"🔧 Rebuilt article_counts ({len(drift)} statuses corrected)")
+        return 0
+
+    logger.error(f"❌ article_counts drifted for {len(drift)} statuses - rerun with --repair")
+    return 1
+
+
+async def backfill_embeddings(args) -> int:
+    """Compute embeddings for articles that have none"""
+    result = await EmbeddingBackfill(batch_size=args.batch_size).run(max_batches=args.max_batches)
+    return 1 if result['failed_batches'] else 0
+
+
+async def refresh_related(args) -> int:
+    """Recompute related articles for everything changed since the last run"""
+    result = await RelatedArticlesRefresh(
+        neighbours=args.neighbours, batch_size=args.batch_size
+    ).run(max_batches=args.max_batches)
+    return 1 if result.get('failed_batches') else 0
+
+
+async def render_html(args) -> int:
+    """Render HTML for published articles with a missing or stale render"""
+    rendered = await ArticleOperations.render_stale_articles(batch_size=args.batch_size)
+    logger.info(f"✅ Rendered HTML for {rendered} articles")
+    return 0
+
+
+async def prune_ai_cache(args) -> int:
+    """Delete expired Claude responses and trim the cache to its size budget"""
+    max_bytes = args.max_bytes or int(os.getenv("CLAUDE_CACHE_MAX_BYTES", 256 * 1024 * 1024))
+    evicted = await AIResponseCacheOperations.evict(max_bytes)
+    logger.info(f"✅ Evicted {evicted} cached AI responses")
+    return 0
+
+
+async def enqueue_generation(args) -> int:
+    """Queue one generation job per topic line of a file"""
+    with open(args.topics_file, encoding='utf-8') as topics_file:
+        topics = topics_file.read().splitlines()
+    queued = await GenerationJobOperations.enqueue(
+        args.batch,
+        topics,
+        target_audience=args.audience,
+        options={'status': args.status, 'generate_image': not args.no_images},
+        max_attempts=args.max_attempts
+    )
+    logger.info(f"✅ Queued {queued} generation jobs in batch '{args.batch}'")
+    return 0
+
+
+async def generation_workers(args) -> int:
+    """Run a worker pool against the generation queue"""
+    # Imported here: the AI services require API keys the other commands do not need
+    from src.jobs.generation_queue import GenerationWorkerPool
+
+    pool = GenerationWorkerPool.from_env(workers=args.workers)
+    if args.drain:
+        result = await pool.drain()
+        logger.info(f"✅ Generation queue drained: {result}")
+        return 1 if result['failed'] else 0
+    await pool.run_forever()
+    return 0
+
+
+async def bulk_ai_review(args) -> int:
+    """SEO metadata and quality scores for articles missing them, via message batches"""
+    # Imported here: the AI services require API keys the other commands do not need
+    from src.jobs.bulk_ai_review import BulkAIReview
+
+    review = BulkAIReview(
+        batch_size=args.batch_size,
+        poll_interval=args.poll_interval,
+        status=None if args.status == 'all' else args.status,
+        attributes=json.loads(args.attributes) if args.attributes else None
+    )
+    result = await review.run(max_batches=args.max_batches, wait=not args.no_wait)
+    return 1 if result.get('errored_requests') else 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Command line interface definition"""
+    parser = argparse.ArgumentParser(description='Quest-CMS maintenance commands')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    counts_parser = subparsers.add_parser('check-counts', help='Check trigger-maintained article counts')
+    counts_parser.add_argument('--repair', action='store_true', help='Rebuild counts from the articles table')
+    counts_parser.set_defaults(handler=check_counts)
+
+    backfill_parser = subparsers.add_parser('backfill-embeddings', help='Embed articles missing content_embedding')
+    backfill_parser.add_argument('--batch-size', type=int, default=100)
+    backfill_parser.add_argument('--max-batches', type=int, default=None, help='Stop after N batches (resume later)')
+    backfill_parser.set_defaults(handler=backfill_embeddings)
+
+    related_parser = subparsers.add_parser('refresh-related', help='Incrementally refresh related_articles')
+    related_parser.add_argument('--neighbours', type=int, default=10)
+    related_parser.add_argument('--batch-size', type=int, default=200)
+    related_parser.add_argument('--max-batches', type=int, default=None, help='Stop after N batches (resume later)')
+    related_parser.set_defaults(handler=refresh_related)
+
+    render_parser = subparsers.add_parser('render-html', help='Render missing or stale article HTML')
+    render_parser.add_argument('--batch-size', type=int, default=200)
+    render_parser.set_defaults(handler=render_html)
+
+    prune_parser = subparsers.add_parser('prune-ai-cache', help='Evict expired and over-budget AI responses')
+    prune_parser.add_argument('--max-bytes', type=int, default=None, help='Defaults to CLAUDE_CACHE_MAX_BYTES')
+    prune_parser.set_defaults(handler=prune_ai_cache)
+
+    enqueue_parser = subparsers.add_parser('enqueue-generation', help='Queue a batch of AI articles')
+    enqueue_parser.add_argument('topics_file', help='Text file with one topic per line')
+    enqueue_parser.add_argument('--batch', required=True, help='Batch name shown in /admin/jobs')
+    enqueue_parser.add_argument('--audience', default='digital_nomads')
+    enqueue_parser.add_argument('--status', choices=['draft', 'review'], default='review')
+    enqueue_parser.add_argument('--no-images', action='store_true', help='Skip featured image generation')
+    enqueue_parser.add_argument('--max-attempts', type=int, default=5)
+    enqueue_parser.set_defaults(handler=enqueue_generation)
+
+    workers_parser = subparsers.add_parser('generation-workers', help='Process the batch generation queue')
+    workers_parser.add_argument('--workers', type=int, default=None, help='Defaults to GENERATION_WORKERS')
+    workers_parser.add_argument('--drain', action='store_true', help='Exit once no runnable jobs are left')
+    workers_parser.set_defaults(handler=generation_workers)
+
+    review_parser = subparsers.add_parser('bulk-ai-review', help='Batch SEO metadata and quality scoring')
+    review_parser.add_argument('--batch-size', type=int, default=500, help='Articles per message batch')
+    review_parser.add_argument('--max-batches', type=int, default=None, help='Submit at most N new batches')
+    review_parser.add_argument('--status', default='published', help="Article status to review, or 'all'")
+    review_parser.add_argument('--attributes', default=None, help='JSON attribute filter, e.g. \'{"category": "visas"}\'')
+    review_parser.add_argument('--poll-interval', type=float, default=60.0)
+    review_parser.add_argument('--no-wait', action='store_true', help='Submit only; a later run collects the results')
+    review_parser.set_defaults(handler=bulk_ai_review)
+
+    return parser
+
+
+async def run(args) -> int:
+    """Run a command with an initialized database pool"""
+    await db_manager.initialize()
+    try:
+        return await args.handler(args)
+    finally:
+        await db_manager.close()
+
+
+if __name__ == '__main__':
+    arguments = build_parser().parse_args()
+    sys.exit(asyncio.run(run(arguments)))
@@ -0,0 +1,12 @@
+-- Migration 001: keyset pagination indexes
+-- Adds id as a tie-breaker to the listing indexes so that
+-- ArticleOperations.list_articles_page can seek on (created_at, id)
+-- instead of scanning and discarding OFFSET rows.
+-- The new indexes are built before the old ones are dropped, so listings
+-- keep an index to use for the whole build.
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS articles_status_keyset_idx ON articles (status, created_at DESC, id DESC);
+DROP INDEX CONCURRENTLY IF EXISTS articles_status_idx;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS articles_created_keyset_idx ON articles (created_at DESC, id DESC);
+DROP INDEX CONCURRENTLY IF EXISTS articles_created_idx;
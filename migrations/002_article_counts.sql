@@ -0,0 +1,107 @@
+-- Migration 002: trigger-maintained article_counts
+-- Run inside a transaction; articles is locked while the counts are seeded.
+
+BEGIN;
+
+LOCK TABLE articles IN SHARE ROW EXCLUSIVE MODE;
+
+-- Per-status article counts maintained by statement-level triggers,
+-- so dashboard stats are an O(1) read instead of a GROUP BY over articles
+CREATE TABLE IF NOT EXISTS article_counts (
+    status TEXT PRIMARY KEY,
+    count BIGINT NOT NULL DEFAULT 0
+);
+
+CREATE OR REPLACE FUNCTION maintain_article_counts()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        INSERT INTO article_counts (status, count)
+        SELECT status, COUNT(*) FROM new_rows
+        WHERE status IS NOT NULL
+        GROUP BY status
+        ORDER BY status
+        ON CONFLICT (status) DO UPDATE SET count = article_counts.count + EXCLUDED.count;
+    ELSIF TG_OP = 'UPDATE' THEN
+        INSERT INTO article_counts (status, count)
+        SELECT status, SUM(delta) FROM (
+            SELECT status, 1 AS delta FROM new_rows
+            UNION ALL
+            SELECT status, -1 AS delta FROM old_rows
+        ) changes
+        WHERE status IS NOT NULL
+        GROUP BY status
+        HAVING SUM(delta) <> 0
+        ORDER BY status
+        ON CONFLICT (status) DO UPDATE SET count = article_counts.count + EXCLUDED.count;
+    ELSE
+        INSERT INTO article_counts (status, count)
+        SELECT status, -COUNT(*) FROM old_rows
+        WHERE status IS NOT NULL
+        GROUP BY status
+        ORDER BY status
+        ON CONFLICT (status) DO UPDATE SET count = article_counts.count + EXCLUDED.count;
+    END IF;
+    RETURN NULL;
+END;
+$$ language 'plpgsql';
+
+DROP TRIGGER IF EXISTS article_counts_insert ON articles;
+CREATE TRIGGER article_counts_insert
+    AFTER INSERT ON articles
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION maintain_article_counts();
+
+DROP TRIGGER IF EXISTS article_counts_update ON articles;
+CREATE TRIGGER article_counts_update
+    AFTER UPDATE ON articles
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION maintain_article_counts();
+
+DROP TRIGGER IF EXISTS article_counts_delete ON articles;
+CREATE TRIGGER article_counts_delete
+    AFTER DELETE ON articles
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION maintain_article_counts();
+
+-- Recount articles per status, returning any drift that was corrected
+CREATE OR REPLACE FUNCTION rebuild_article_counts()
+RETURNS TABLE (
+    article_status TEXT,
+    stored_count BIGINT,
+    actual_count BIGINT
+) AS $$
+BEGIN
+    -- Block concurrent writers so the recount is exact
+    LOCK TABLE articles IN SHARE MODE;
+    
+    RETURN QUERY
+    SELECT 
+        COALESCE(actual.status, stored.status),
+        COALESCE(stored.count, 0)::BIGINT,
+        COALESCE(actual.count, 0)::BIGINT
+    FROM (
+        SELECT a.status, COUNT(*) AS count
+        FROM articles a
+        WHERE a.status IS NOT NULL
+        GROUP BY a.status
+    ) actual
+    FULL OUTER JOIN article_counts stored ON stored.status = actual.status
+    WHERE COALESCE(stored.count, 0) <> COALESCE(actual.count, 0);
+    
+    DELETE FROM article_counts;
+    INSERT INTO article_counts (status, count)
+    SELECT a.status, COUNT(*)
+    FROM articles a
+    WHERE a.status IS NOT NULL
+    GROUP BY a.status;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Seed counts from existing rows
+SELECT * FROM rebuild_article_counts();
+
+COMMIT;
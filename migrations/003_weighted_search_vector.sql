@@ -0,0 +1,53 @@
+-- Migration 003: weighted search_vector column
+-- Replaces ranking on (title_search || content_search) with one stored,
+-- weighted tsvector (title = A, content = B) and its own GIN index.
+-- Adding a STORED generated column rewrites the table; run it in a
+-- maintenance window on large databases.
+
+ALTER TABLE articles
+    ADD COLUMN IF NOT EXISTS search_vector TSVECTOR GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', title), 'A') ||
+        setweight(to_tsvector('english', content), 'B')
+    ) STORED;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS articles_search_vector_idx ON articles USING GIN (search_vector);
+
+-- The expression index is no longer used by any query
+DROP INDEX CONCURRENTLY IF EXISTS articles_search_idx;
+
+CREATE OR REPLACE FUNCTION search_articles_bm25(search_query TEXT, result_limit INTEGER DEFAULT 20)
+RETURNS TABLE (
+    id UUID,
+    title TEXT,
+    content TEXT,
+    status TEXT,
+    attributes JSONB,
+    created_at TIMESTAMPTZ,
+    published_at TIMESTAMPTZ,
+    rank REAL,
+    snippet TEXT
+) AS $$
+BEGIN
+    -- Rank on the indexed search_vector first; ts_headline only runs on the top-N rows
+    RETURN QUERY
+    SELECT 
+        a.id,
+        a.title,
+        a.content,
+        a.status,
+        a.attributes,
+        a.created_at,
+        a.published_at,
+        ranked.score,
+        ts_headline('english', a.content, ranked.query, 'MaxWords=20') as snippet
+    FROM (
+        SELECT r.id, ts_rank_cd(r.search_vector, q.query) as score, q.query
+        FROM articles r, websearch_to_tsquery('english', search_query) AS q(query)
+        WHERE r.search_vector @@ q.query
+        ORDER BY score DESC
+        LIMIT result_limit
+    ) ranked
+    JOIN articles a ON a.id = ranked.id
+    ORDER BY ranked.score DESC;
+END;
+$$ LANGUAGE plpgsql;
@@ -0,0 +1,10 @@
+-- Migration 004: HNSW index for content embeddings
+-- HNSW gives better recall than ivfflat at the same latency, needs no
+-- training data (ivfflat lists are fixed when the index is built), and
+-- stays accurate as articles are added. Requires pgvector >= 0.5.0.
+-- The ivfflat index (articles_embedding_idx) is kept: compare both with
+-- benchmarks/bench_vector_index.py, then drop it with migration 014.
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS articles_embedding_hnsw_idx
+    ON articles USING hnsw (content_embedding vector_cosine_ops)
+    WITH (m = 16, ef_construction = 64);
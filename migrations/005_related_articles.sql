@@ -0,0 +1,25 @@
+-- Migration 005: precomputed related articles
+-- related_articles holds the top-N published neighbours of each published
+-- article; job_state stores the refresh watermark. articles_updated_idx lets
+-- the refresh job find rows changed since its last run without a full scan.
+
+-- Precomputed nearest neighbours for published articles (refreshed incrementally)
+CREATE TABLE IF NOT EXISTS related_articles (
+    article_id UUID NOT NULL REFERENCES articles(id) ON DELETE CASCADE,
+    related_id UUID NOT NULL REFERENCES articles(id) ON DELETE CASCADE,
+    rank SMALLINT NOT NULL,
+    similarity REAL NOT NULL,
+    computed_at TIMESTAMPTZ DEFAULT NOW(),
+    PRIMARY KEY (article_id, rank)
+);
+
+CREATE INDEX IF NOT EXISTS related_articles_related_idx ON related_articles (related_id);
+
+-- Watermarks and other resumable state for background jobs
+CREATE TABLE IF NOT EXISTS job_state (
+    job_name TEXT PRIMARY KEY,
+    state JSONB NOT NULL DEFAULT '{}',
+    updated_at TIMESTAMPTZ DEFAULT NOW()
+);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS articles_updated_idx ON articles (updated_at, id);
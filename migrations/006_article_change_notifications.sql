@@ -0,0 +1,42 @@
+-- Migration 006: article_changes notifications
+-- Lets app replicas invalidate their in-process article cache via LISTEN article_changes.
+
+BEGIN;
+
+-- Cache invalidation for app replicas: NOTIFY article_changes with the id of every
+-- changed article that was published (only published articles are cached). Large
+-- statements send a single '*' so listeners flush instead of receiving thousands of
+-- messages. Notifications are delivered on commit, so rolled-back edits stay silent.
+CREATE OR REPLACE FUNCTION notify_article_changes()
+RETURNS TRIGGER AS $$
+DECLARE
+    changed_count INTEGER;
+BEGIN
+    SELECT COUNT(*) INTO changed_count FROM old_rows WHERE status = 'published';
+    
+    IF changed_count > 100 THEN
+        PERFORM pg_notify('article_changes', '*');
+    ELSIF changed_count > 0 THEN
+        PERFORM pg_notify('article_changes', id::text)
+        FROM old_rows
+        WHERE status = 'published';
+    END IF;
+    RETURN NULL;
+END;
+$$ language 'plpgsql';
+
+DROP TRIGGER IF EXISTS article_changes_update ON articles;
+CREATE TRIGGER article_changes_update
+    AFTER UPDATE ON articles
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION notify_article_changes();
+
+DROP TRIGGER IF EXISTS article_changes_delete ON articles;
+CREATE TRIGGER article_changes_delete
+    AFTER DELETE ON articles
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION notify_article_changes();
+
+COMMIT;
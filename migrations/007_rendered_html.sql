@@ -0,0 +1,6 @@
+-- Migration 007: pre-rendered article HTML
+-- Adds content_html and its source hash. Existing published rows start without a
+-- render; fill them with `python manage.py render-html` (safe to rerun).
+
+ALTER TABLE articles ADD COLUMN IF NOT EXISTS content_html TEXT;
+ALTER TABLE articles ADD COLUMN IF NOT EXISTS content_html_hash TEXT;
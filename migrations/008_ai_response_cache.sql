@@ -0,0 +1,17 @@
+-- Migration 008: persistent Claude response cache
+
+-- Content-addressed cache of Claude responses (key = sha256 of method, model, parameters, prompt)
+CREATE TABLE IF NOT EXISTS ai_response_cache (
+    cache_key TEXT PRIMARY KEY,
+    method TEXT NOT NULL,
+    model TEXT NOT NULL,
+    response JSONB NOT NULL,
+    size_bytes INTEGER NOT NULL,
+    hit_count INTEGER NOT NULL DEFAULT 0,
+    created_at TIMESTAMPTZ DEFAULT NOW(),
+    last_used_at TIMESTAMPTZ DEFAULT NOW(),
+    expires_at TIMESTAMPTZ NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS ai_response_cache_expires_idx ON ai_response_cache (expires_at);
+CREATE INDEX IF NOT EXISTS ai_response_cache_last_used_idx ON ai_response_cache (last_used_at DESC);
@@ -0,0 +1,27 @@
+-- Migration 009: batch article generation job queue
+
+-- Durable queue for batch article generation; workers claim rows with FOR UPDATE SKIP LOCKED
+CREATE TABLE IF NOT EXISTS generation_jobs (
+    id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    batch_name TEXT NOT NULL,
+    topic TEXT NOT NULL,
+    target_audience TEXT NOT NULL DEFAULT 'digital_nomads',
+    options JSONB NOT NULL DEFAULT '{}',
+    status TEXT NOT NULL DEFAULT 'queued' CHECK (status IN ('queued', 'running', 'succeeded', 'failed', 'cancelled')),
+    step TEXT,
+    checkpoint JSONB NOT NULL DEFAULT '{}',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL DEFAULT 5,
+    run_after TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    locked_by TEXT,
+    locked_at TIMESTAMPTZ,
+    last_error TEXT,
+    article_id UUID REFERENCES articles(id) ON DELETE SET NULL,
+    created_at TIMESTAMPTZ DEFAULT NOW(),
+    updated_at TIMESTAMPTZ DEFAULT NOW(),
+    finished_at TIMESTAMPTZ
+);
+
+CREATE INDEX IF NOT EXISTS generation_jobs_ready_idx ON generation_jobs (run_after, created_at) WHERE status = 'queued';
+CREATE INDEX IF NOT EXISTS generation_jobs_running_idx ON generation_jobs (locked_at) WHERE status = 'running';
+CREATE INDEX IF NOT EXISTS generation_jobs_batch_idx ON generation_jobs (batch_name, status);
@@ -0,0 +1,18 @@
+-- Migration 010: bulk AI review through the Message Batches API
+
+-- Scores are 1-10; DECIMAL(3,2) could not store 10 (widening the precision does not rewrite the table)
+ALTER TABLE articles ALTER COLUMN quality_score TYPE DECIMAL(4,2);
+
+-- Message batches submitted for bulk SEO/quality review; unapplied rows are resumed after a restart
+CREATE TABLE IF NOT EXISTS ai_batches (
+    id TEXT PRIMARY KEY,
+    status TEXT NOT NULL DEFAULT 'submitted' CHECK (status IN ('submitted', 'ended', 'applied')),
+    article_ids UUID[] NOT NULL,
+    request_count INTEGER NOT NULL,
+    request_counts JSONB,
+    submitted_at TIMESTAMPTZ DEFAULT NOW(),
+    ended_at TIMESTAMPTZ,
+    applied_at TIMESTAMPTZ
+);
+
+CREATE INDEX IF NOT EXISTS ai_batches_pending_idx ON ai_batches (submitted_at) WHERE status <> 'applied';
@@ -0,0 +1,22 @@
+-- Migration 011: link generated articles to their generation job
+-- A unique generation_job_id makes the worker's create step idempotent: a retried
+-- job finds the article its earlier attempt inserted instead of creating a copy.
+-- The job link moves out of attributes, which public APIs and exports serve as-is.
+
+ALTER TABLE articles ADD COLUMN IF NOT EXISTS generation_job_id UUID;
+
+-- Backfill from the old attributes key; where a job already produced duplicates, the oldest copy keeps the link
+UPDATE articles a
+SET generation_job_id = first_copy.job_id
+FROM (
+    SELECT DISTINCT ON (attributes->'generation_job'->>'id')
+        id, (attributes->'generation_job'->>'id')::uuid AS job_id
+    FROM articles
+    WHERE attributes ? 'generation_job'
+    ORDER BY attributes->'generation_job'->>'id', created_at, id
+) first_copy
+WHERE a.id = first_copy.id AND a.generation_job_id IS NULL;
+
+UPDATE articles SET attributes = attributes - 'generation_job' WHERE attributes ? 'generation_job';
+
+CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS articles_generation_job_idx ON articles (generation_job_id);
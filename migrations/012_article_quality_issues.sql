@@ -0,0 +1,10 @@
+-- Migration 012: quality issues in their own column
+-- AI review notes were stored in attributes, which the public API and exports
+-- serve unchanged. They move to articles.quality_issues (editor/admin only).
+
+ALTER TABLE articles ADD COLUMN IF NOT EXISTS quality_issues JSONB;
+
+UPDATE articles
+SET quality_issues = attributes->'quality_issues',
+    attributes = attributes - 'quality_issues'
+WHERE attributes ? 'quality_issues';
@@ -0,0 +1,37 @@
+-- Migration 013: tombstones for incremental exports
+-- Records when a published article is unpublished or deleted, so an incremental
+-- export (export.py --updated-since) can tell downstream sites to drop it.
+-- Republishing removes the tombstone; the article is exported again by updated_at.
+
+CREATE TABLE IF NOT EXISTS article_tombstones (
+    article_id UUID PRIMARY KEY,
+    removed_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS article_tombstones_removed_idx ON article_tombstones (removed_at, article_id);
+
+CREATE OR REPLACE FUNCTION record_article_tombstone()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF OLD.status = 'published' AND (TG_OP = 'DELETE' OR NEW.status IS DISTINCT FROM 'published') THEN
+        INSERT INTO article_tombstones (article_id, removed_at)
+        VALUES (OLD.id, NOW())
+        ON CONFLICT (article_id) DO UPDATE SET removed_at = EXCLUDED.removed_at;
+    ELSIF TG_OP = 'UPDATE' AND NEW.status = 'published' AND OLD.status IS DISTINCT FROM 'published' THEN
+        DELETE FROM article_tombstones WHERE article_id = NEW.id;
+    END IF;
+    RETURN NULL;
+END;
+$$ language 'plpgsql';
+
+DROP TRIGGER IF EXISTS article_tombstones_update ON articles;
+CREATE TRIGGER article_tombstones_update
+    AFTER UPDATE OF status ON articles
+    FOR EACH ROW
+    EXECUTE FUNCTION record_article_tombstone();
+
+DROP TRIGGER IF EXISTS article_tombstones_delete ON articles;
+CREATE TRIGGER article_tombstones_delete
+    AFTER DELETE ON articles
+    FOR EACH ROW
+    EXECUTE FUNCTION record_article_tombstone();
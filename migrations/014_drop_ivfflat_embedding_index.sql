@@ -0,0 +1,5 @@
+-- Migration 014: drop the ivfflat embedding index
+-- Run once benchmarks/bench_vector_index.py has confirmed the HNSW index from
+-- migration 004 (articles_embedding_hnsw_idx) meets recall and latency targets.
+
+DROP INDEX CONCURRENTLY IF EXISTS articles_embedding_idx;
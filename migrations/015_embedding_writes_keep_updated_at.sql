@@ -0,0 +1,21 @@
+-- Migration 015: embedding writes no longer bump updated_at
+-- updated_at drives public ETags, incremental exports and the related-articles
+-- watermark, so an embedding backfill used to make every article look edited.
+-- Embedding writes now set embedded_at instead, and the updated_at trigger skips
+-- updates that change the embedding without touching published fields.
+-- The related-articles refresh watches GREATEST(updated_at, embedded_at).
+
+ALTER TABLE articles ADD COLUMN IF NOT EXISTS embedded_at TIMESTAMPTZ;
+
+DROP TRIGGER IF EXISTS update_articles_updated_at ON articles;
+CREATE TRIGGER update_articles_updated_at
+    BEFORE UPDATE ON articles
+    FOR EACH ROW
+    WHEN (
+        OLD.content_embedding IS NOT DISTINCT FROM NEW.content_embedding
+        OR (OLD.title, OLD.content, OLD.status, OLD.attributes, OLD.content_html, OLD.published_at)
+           IS DISTINCT FROM (NEW.title, NEW.content, NEW.status, NEW.attributes, NEW.content_html, NEW.published_at)
+    )
+    EXECUTE FUNCTION update_updated_at_column();
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS articles_changed_idx ON articles ((GREATEST(updated_at, embedded_at)), id);
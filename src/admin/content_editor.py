@@ -4,6 +4,7 @@ Following documented live preview pattern with real-time updates
 """
 from nicegui import ui
 import asyncio
+import time
 from typing import Dict, Any, Optional
 import logging
 import json
@@ -11,9 +12,13 @@ import json
 from ..database.operations import ArticleOperations
 from ..ai_services.claude import claude_service
 from ..ai_services.replicate_service import replicate_service
+from ..utils.rendering import render_markdown
 
 logger = logging.getLogger(__name__)
 
+# Live preview refresh rate while AI text streams in (the textarea updates on every delta)
+PREVIEW_FPS = 4
+
 class ContentEditor:
     """Live content editor with real-time preview following documented pattern"""
     
@@ -33,6 +38,10 @@ class ContentEditor:
         
         # AI operation status
         self.ai_operation_status = None
+        
+        # Last preview render, reused while the content is unchanged (e.g. title edits)
+        self._preview_source = None
+        self._preview_html = ''
     
     @ui.page('/admin/create')
     async def create_article_page(self):
@@ -148,7 +157,8 @@ class ContentEditor:
     async def _load_article(self, article_id: str):
         """Load existing article for editing"""
         try:
-            article = await self.article_ops.get_article(article_id)
+            # Read from the primary: the editor usually lands here right after a save
+            article = await self.article_ops.get_article(article_id, use_primary=True)
             if not article:
                 ui.notification('Article not found', color='negative')
                 ui.navigate.to('/admin')
@@ -192,7 +202,11 @@ class ContentEditor:
                     ui.markdown(f'# {title}').classes('border-b pb-2 mb-4')
                 
                 if content:
-                    ui.markdown(content)
+                    # Same renderer as published HTML; only re-rendered when the content changed
+                    if content != self._preview_source:
+                        self._preview_html = render_markdown(content)
+                        self._preview_source = content
+                    ui.html(self._preview_html).classes('nicegui-markdown')
                 else:
                     ui.markdown('*Start typing to see live preview...*').classes('text-gray-500 italic')
                     
@@ -207,23 +221,42 @@ class ContentEditor:
                 return
             
             self.ai_operation_status.text = '🧠 Generating content with Claude...'
+            topic = self.title_input.value
             
-            # Generate content
-            result = await claude_service.generate_article_content(
-                topic=self.title_input.value,
+            # Stream the body into the editor; the preview re-renders at most PREVIEW_FPS times a second
+            content = ''
+            self.content_textarea.value = ''
+            last_preview = 0.0
+            async for delta in claude_service.stream_article_content(
+                topic=topic,
                 target_audience="digital_nomads",
                 word_count=1000
-            )
+            ):
+                content += delta
+                self.content_textarea.value = content
+                now = time.monotonic()
+                if now - last_preview >= 1 / PREVIEW_FPS:
+                    last_preview = now
+                    await self._update_preview()
+            
+            self.ai_operation_status.text = '🔍 Generating SEO metadata and quality score...'
+            result = await claude_service.complete_generated_article(content, topic, "digital_nomads")
             
             # Update form with generated content
             self.title_input.value = result['title']
             self.content_textarea.value = result['content']
             self.seo_description_input.value = result.get('seo_description', '')
+            seo_metadata = result.get('seo_metadata') or {}
+            if seo_metadata.get('seo_title'):
+                self.seo_title_input.value = seo_metadata['seo_title']
+            if seo_metadata.get('keywords') and not self.tags_input.value:
+                self.tags_input.value = ', '.join(seo_metadata['keywords'])
             
             # Update preview
             await self._update_preview()
             
-            self.ai_operation_status.text = f'✅ Generated {result["word_count"]} words'
+            score_text = f', quality {result["quality_score"]}/10' if result.get('quality_score') else ''
+            self.ai_operation_status.text = f'✅ Generated {result["word_count"]} words{score_text}'
             ui.notification('Content generated successfully!', color='positive')
             
         except Exception as e:
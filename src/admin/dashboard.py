@@ -18,8 +18,6 @@ class AdminDashboard:
     
     def __init__(self):
         self.article_ops = ArticleOperations()
-        self.stats_cache = None
-        self.cache_timestamp = None
         
     async def initialize(self):
         """Initialize dashboard and validate database"""
@@ -43,12 +41,14 @@ class AdminDashboard:
             with ui.row().classes('ml-auto'):
                 ui.button('Create Article', on_click=lambda: ui.navigate.to('/admin/create')).props('color=primary')
                 ui.button('Review Queue', on_click=lambda: ui.navigate.to('/admin/review')).props('color=secondary')
+                ui.button('Batch Generation', on_click=lambda: ui.navigate.to('/admin/jobs')).props('color=accent')
         
         # Left navigation drawer
         with ui.left_drawer():
             ui.nav_link('Dashboard', '/admin').classes('text-blue-500')
             ui.nav_link('Create Content', '/admin/create').classes('text-green-500')
             ui.nav_link('Review Queue', '/admin/review').classes('text-orange-500')
+            ui.nav_link('Batch Generation', '/admin/jobs').classes('text-blue-700')
             ui.nav_link('AI Tools', '/admin/ai').classes('text-purple-500')
             ui.nav_link('Search', '/admin/search').classes('text-gray-500')
             ui.separator()
@@ -65,7 +65,7 @@ class AdminDashboard:
         """Real-time metrics display"""
         ui.markdown('## Dashboard Overview')
         
-        # Get article statistics
+        # Get article statistics (cached; kept current by ArticleOperations writes)
         try:
             stats = await self.article_ops.get_article_stats()
             
@@ -100,7 +100,7 @@ class AdminDashboard:
         
         try:
             # Get recent articles
-            articles = await self.article_ops.list_articles(limit=10)
+            articles = await self.article_ops.list_articles(limit=10, projection='summary')
             
             if not articles:
                 ui.label('No articles found. Create your first article!').classes('text-gray-500 italic')
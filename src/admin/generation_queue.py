@@ -0,0 +1,215 @@
+"""
+Batch Generation Queue for Quest-CMS
+Queue many AI articles at once and follow their progress through the worker pool
+"""
+from nicegui import ui
+from typing import Dict, Any, Optional
+import logging
+
+from ..database.operations import GenerationJobOperations
+
+logger = logging.getLogger(__name__)
+
+# Seconds between progress refreshes while the page is open
+REFRESH_INTERVAL = 5.0
+
+
+class GenerationQueuePage:
+    """Admin page for batch generation jobs"""
+
+    def __init__(self):
+        self.selected_batch: Optional[str] = None
+
+        # UI component references
+        self.batch_name_input = None
+        self.topics_textarea = None
+        self.audience_select = None
+        self.status_select = None
+        self.image_checkbox = None
+        self.batches_container = None
+        self.jobs_container = None
+
+    @ui.page('/admin/jobs')
+    async def generation_queue_page(self):
+        """Queue form, per-batch progress and the jobs of the selected batch"""
+
+        # Header
+        with ui.header():
+            ui.label('Quest CMS - Batch Generation').classes('text-xl font-bold')
+            with ui.row().classes('ml-auto'):
+                ui.button('← Back to Dashboard', on_click=lambda: ui.navigate.to('/admin')).props('flat')
+                ui.button('🔄 Refresh', on_click=self._refresh).props('color=secondary')
+
+        with ui.row().classes('w-full p-4 gap-4 no-wrap'):
+
+            # Left: queue a new batch
+            with ui.card().classes('w-1/3 p-4'):
+                ui.markdown('### Queue Articles')
+                self.batch_name_input = ui.input('Batch name', placeholder='e.g. Quest Portugal launch').classes('w-full')
+                self.topics_textarea = ui.textarea(
+                    'Topics (one per line)',
+                    placeholder='Digital nomad visa in Portugal\nCoworking spaces in Lisbon'
+                ).classes('w-full').props('rows=12')
+                self.audience_select = ui.select(
+                    ['digital_nomads', 'remote_workers', 'entrepreneurs', 'travelers'],
+                    value='digital_nomads',
+                    label='Target audience'
+                ).classes('w-full')
+                self.status_select = ui.select(
+                    ['draft', 'review'], value='review', label='Create articles as'
+                ).classes('w-full')
+                self.image_checkbox = ui.checkbox('Generate featured images', value=True)
+                ui.button('Queue Batch', on_click=self._queue_batch).props('color=primary').classes('w-full mt-2')
+
+            # Right: progress
+            with ui.column().classes('w-2/3'):
+                ui.markdown('### Batches')
+                self.batches_container = ui.column().classes('w-full')
+                ui.markdown('### Jobs')
+                self.jobs_container = ui.column().classes('w-full')
+
+        await self._refresh()
+        ui.timer(REFRESH_INTERVAL, self._refresh)
+
+    async def _queue_batch(self):
+        """Queue one job per non-empty topic line"""
+        try:
+            batch_name = (self.batch_name_input.value or '').strip()
+            topics = [line.strip() for line in (self.topics_textarea.value or '').splitlines() if line.strip()]
+
+            if not batch_name or not topics:
+                ui.notification('Batch name and at least one topic are required', color='warning')
+                return
+
+            queued = await GenerationJobOperations.enqueue(
+                batch_name,
+                topics,
+                target_audience=self.audience_select.value,
+                options={
+                    'status': self.status_select.value,
+                    'generate_image': self.image_checkbox.value
+                }
+            )
+
+            self.topics_textarea.value = ''
+            self.selected_batch = batch_name
+            ui.notification(f'Queued {queued} articles in "{batch_name}"', color='positive')
+            await self._refresh()
+
+        except Exception as e:
+            logger.error(f"Failed to queue generation batch: {e}")
+            ui.notification(f'Failed to queue batch: {str(e)}', color='negative')
+
+    async def _refresh(self):
+        """Reload batch progress and the selected batch's jobs"""
+        try:
+            batches = await GenerationJobOperations.get_batch_progress()
+            if self.selected_batch is None and batches:
+                self.selected_batch = batches[0]['batch_name']
+
+            self.batches_container.clear()
+            with self.batches_container:
+                if not batches:
+                    ui.label('No batches queued yet.').classes('text-gray-500 italic')
+                for batch in batches:
+                    self._render_batch_card(batch)
+
+            await self._render_jobs()
+
+        except Exception as e:
+            logger.error(f"Failed to refresh generation queue: {e}")
+            ui.notification(f'Failed to load queue: {str(e)}', color='negative')
+
+    def _render_batch_card(self, batch: Dict[str, Any]):
+        """Progress bar and status counts for one batch"""
+        done = batch['succeeded'] + batch['failed'] + batch['cancelled']
+        selected = 'border-l-4 border-blue-500' if batch['batch_name'] == self.selected_batch else ''
+
+        with ui.card().classes(f'w-full mb-2 cursor-pointer {selected}').on(
+            'click', lambda b=batch['batch_name']: self._select_batch(b)
+        ):
+            with ui.row().classes('w-full items-center'):
+                ui.label(batch['batch_name']).classes('font-bold flex-1')
+                ui.label(f"{done}/{batch['total']} done").classes('text-sm text-gray-600')
+            ui.linear_progress(value=done / batch['total'] if batch['total'] else 0, show_value=False)
+            with ui.row().classes('w-full items-center gap-4 text-sm'):
+                ui.label(f"⏳ {batch['queued']} queued")
+                ui.label(f"⚙️ {batch['running']} running")
+                ui.label(f"✅ {batch['succeeded']} succeeded")
+                ui.label(f"❌ {batch['failed']} failed")
+                if batch['failed']:
+                    ui.button(
+                        'Retry failed', on_click=lambda b=batch['batch_name']: self._retry_failed(b)
+                    ).props('flat size=sm color=warning')
+                if batch['queued']:
+                    ui.button(
+                        'Cancel queued', on_click=lambda b=batch['batch_name']: self._cancel_queued(b)
+                    ).props('flat size=sm color=negative')
+
+    async def _render_jobs(self):
+        """Table of the selected batch's jobs"""
+        self.jobs_container.clear()
+        if not self.selected_batch:
+            return
+
+        jobs = await GenerationJobOperations.list_jobs(self.selected_batch)
+        columns = [
+            {'name': 'topic', 'label': 'Topic', 'field': 'topic', 'align': 'left'},
+            {'name': 'status', 'label': 'Status', 'field': 'status', 'align': 'center'},
+            {'name': 'step', 'label': 'Last Step', 'field': 'step', 'align': 'center'},
+            {'name': 'attempts', 'label': 'Attempts', 'field': 'attempts', 'align': 'center'},
+            {'name': 'last_error', 'label': 'Last Error', 'field': 'last_error', 'align': 'left'}
+        ]
+        rows = [{
+            'id': str(job['id']),
+            'article_id': str(job['article_id']) if job['article_id'] else '',
+            'topic': job['topic'][:60],
+            'status': self._format_status(job['status']),
+            'step': job['step'] or '—',
+            'attempts': f"{job['attempts']}/{job['max_attempts']}",
+            'last_error': (job['last_error'] or '')[:80]
+        } for job in jobs]
+
+        with self.jobs_container:
+            ui.label(self.selected_batch).classes('text-sm text-gray-600')
+            table = ui.table(columns=columns, rows=rows, pagination=25).classes('w-full')
+            table.on('rowClick', lambda e: self._open_article(e.args[1]))
+
+    async def _select_batch(self, batch_name: str):
+        self.selected_batch = batch_name
+        await self._refresh()
+
+    async def _retry_failed(self, batch_name: str):
+        try:
+            retried = await GenerationJobOperations.retry_failed(batch_name)
+            ui.notification(f'Requeued {retried} failed jobs', color='positive')
+            await self._refresh()
+        except Exception as e:
+            ui.notification(f'Retry failed: {str(e)}', color='negative')
+
+    async def _cancel_queued(self, batch_name: str):
+        try:
+            cancelled = await GenerationJobOperations.cancel_queued(batch_name)
+            ui.notification(f'Cancelled {cancelled} queued jobs', color='positive')
+            await self._refresh()
+        except Exception as e:
+            ui.notification(f'Cancel failed: {str(e)}', color='negative')
+
+    def _open_article(self, row: Dict[str, Any]):
+        """Open the created article in the editor"""
+        if row.get('article_id'):
+            ui.navigate.to(f"/admin/edit/{row['article_id']}")
+
+    def _format_status(self, status: str) -> str:
+        """Format job status with icons"""
+        status_formats = {
+            'queued': '⏳ Queued',
+            'running': '⚙️ Running',
+            'succeeded': '✅ Succeeded',
+            'failed': '❌ Failed',
+            'cancelled': '🚫 Cancelled'
+        }
+        return status_formats.get(status, status)
+
+# Global generation queue page instance
+generation_queue_page = GenerationQueuePage()
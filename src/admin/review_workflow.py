@@ -72,14 +72,14 @@ class ReviewWorkflow:
                         with self.content_display:
                             ui.markdown('*Select an article from the queue to begin review*').classes('text-gray-500 italic text-center mt-8')
     
-    async def _load_review_queue(self):
+    async def _load_review_queue(self, use_primary: bool = False):
         """Load articles pending review"""
         try:
             # Get articles with review status
-            review_articles = await self.article_ops.list_articles(status='review', limit=50)
+            review_articles = await self.article_ops.list_articles(status='review', limit=50, use_primary=use_primary)
             
             # Also include draft articles that are AI-generated
-            draft_articles = await self.article_ops.list_articles(status='draft', limit=50)
+            draft_articles = await self.article_ops.list_articles(status='draft', limit=50, use_primary=use_primary)
             ai_drafts = [a for a in draft_articles if a.get('ai_generated', False)]
             
             all_articles = review_articles + ai_drafts
@@ -88,7 +88,7 @@ class ReviewWorkflow:
             
             if not all_articles:
                 with self.article_list:
-                    ui.card().classes('p-4 text-center').style('border: 2px dashed #e0e0e0'):
+                    with ui.card().classes('p-4 text-center').style('border: 2px dashed #e0e0e0'):
                         ui.markdown('🎉 **No articles pending review!**')
                         ui.label('All content is up to date.').classes('text-gray-600')
                         ui.button('Create New Content', on_click=lambda: ui.navigate.to('/admin/create')).props('color=primary')
@@ -139,6 +139,13 @@ class ReviewWorkflow:
     async def _select_article_for_review(self, article: Dict[str, Any]):
         """Select article for detailed review"""
         try:
+            # Queue cards carry no content; load the full article only for the one under review
+            article = await self.article_ops.get_article(str(article['id']), use_primary=True)
+            if not article:
+                ui.notification('Article no longer exists', color='warning')
+                await self._refresh_queue()
+                return
+            
             self.current_article = article
             
             # Clear and populate content display
@@ -307,8 +314,8 @@ class ReviewWorkflow:
             ui.notification(f'Rejection failed: {str(e)}', color='negative')
     
     async def _refresh_queue(self):
-        """Refresh the review queue"""
-        await self._load_review_queue()
+        """Refresh the review queue (from the primary, so just-reviewed articles drop out)"""
+        await self._load_review_queue(use_primary=True)
     
     async def _filter_articles(self, filter_value):
         """Filter articles in review queue"""
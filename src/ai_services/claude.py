@@ -3,43 +3,208 @@ Claude AI content generation service
 Following documented AI integration patterns
 """
 import os
+import time
+import random
 import asyncio
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, List, Tuple, AsyncIterator, Callable, Awaitable
 import logging
-from anthropic import Anthropic
+
+import httpx
+from anthropic import AsyncAnthropic, RateLimitError
+from anthropic.types import Message
+
+from .rate_limit import RateLimiter
+from .response_cache import response_cache_from_env
+from .model_router import model_router_from_env
+from .tokens import estimate_tokens, truncate_to_tokens, split_sections, section_heading
 
 logger = logging.getLogger(__name__)
 
+# custom_id prefixes of bulk review requests
+BULK_SEO = 'seo'
+BULK_QUALITY = 'quality'
+
+# Token budgets: articles above a section budget are enhanced / scored per Markdown section
+MAX_OUTPUT_TOKENS = 4000
+ENHANCE_SECTION_TOKENS = 1500
+SCORE_SECTION_TOKENS = 2000
+
 class ClaudeService:
     """Claude AI service for content generation and enhancement"""
     
-    def __init__(self):
-        self.api_key = os.getenv("CLAUDE_API_KEY")
+    def __init__(self, api_key: Optional[str] = None, base_url: Optional[str] = None):
+        self.api_key = api_key or os.getenv("CLAUDE_API_KEY")
         if not self.api_key:
             raise ValueError("CLAUDE_API_KEY environment variable is required")
         
-        self.client = Anthropic(api_key=self.api_key)
+        # One pooled HTTP client for every call - connections are reused across requests
+        max_connections = int(os.getenv("CLAUDE_MAX_CONNECTIONS", 20))
+        self.http_client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections
+            ),
+            timeout=httpx.Timeout(float(os.getenv("CLAUDE_REQUEST_TIMEOUT", 600)), connect=10.0)
+        )
+        self.client = AsyncAnthropic(
+            api_key=self.api_key,
+            base_url=base_url or os.getenv("CLAUDE_API_BASE_URL") or None,
+            http_client=self.http_client,
+            max_retries=int(os.getenv("CLAUDE_MAX_RETRIES", 2))
+        )
         self.primary_model = os.getenv("CLAUDE_MODEL_PRIMARY", "claude-3-sonnet-20240229")
         self.fast_model = os.getenv("CLAUDE_MODEL_FAST", "claude-3-haiku-20240307")
         
-        # Rate limiting semaphore - MANDATORY per guardrails
-        self.operation_semaphore = asyncio.Semaphore(3)
+        # Rate limiting - MANDATORY per guardrails (requests and tokens per minute)
+        self.rate_limiter = RateLimiter(
+            requests_per_minute=float(os.getenv("CLAUDE_REQUESTS_PER_MINUTE", 50)),
+            tokens_per_minute=float(os.getenv("CLAUDE_TOKENS_PER_MINUTE", 40000))
+        )
+        
+        # Persistent response cache for repeatable calls (enhance, score, SEO)
+        self.response_cache = response_cache_from_env()
+        
+        # Per call type primary/fast model choice from observed latency, tokens and quality
+        self.router = model_router_from_env(self.primary_model, self.fast_model)
+    
+    async def close(self):
+        """Close pooled HTTP connections"""
+        await self.client.close()
     
     async def validate_service(self) -> bool:
         """Validate Claude API accessibility - MANDATORY per guardrails"""
         try:
-            async with self.operation_semaphore:
-                response = await asyncio.to_thread(
-                    self.client.messages.create,
-                    model=self.fast_model,
-                    max_tokens=10,
-                    messages=[{"role": "user", "content": "Test"}]
-                )
-                return bool(response.content[0].text)
+            response = await self._create_message(self.fast_model, 10, "Test")
+            return bool(response.content[0].text)
         except Exception as e:
             logger.error(f"Claude API validation failed: {e}")
             raise ValueError(f"Claude API validation failed: {e}")
     
+    @staticmethod
+    def _output_budget(text: str) -> int:
+        """max_tokens for rewriting text: room to grow by half, never above MAX_OUTPUT_TOKENS"""
+        return min(MAX_OUTPUT_TOKENS, estimate_tokens(text) * 3 // 2 + 256)
+    
+    async def _create_message(
+        self,
+        model: str,
+        max_tokens: int,
+        prompt: str,
+        task: Optional[str] = None
+    ) -> Message:
+        """
+        Single entry point for Messages API calls
+        Reserves rate-limit capacity (prompt estimate + max_tokens) before the call,
+        then syncs the limiter from response headers and refunds unused tokens.
+        With a task (call type), latency and token usage are recorded for routing.
+        """
+        estimated = estimate_tokens(prompt) + max_tokens
+        await self.rate_limiter.acquire(estimated)
+        
+        started = time.perf_counter()
+        try:
+            raw = await self.client.messages.with_raw_response.create(
+                model=model,
+                max_tokens=max_tokens,
+                messages=[{"role": "user", "content": prompt}]
+            )
+        except RateLimitError as e:
+            self.rate_limiter.record_rate_limited(e.response.headers)
+            self.rate_limiter.settle(estimated, 0)
+            raise
+        except Exception:
+            self.rate_limiter.settle(estimated, 0)
+            if task:
+                self.router.record_call(task, model, time.perf_counter() - started, error=True)
+            raise
+        
+        self.rate_limiter.update_from_headers(raw.headers)
+        response = raw.parse()
+        self.rate_limiter.settle(estimated, response.usage.input_tokens + response.usage.output_tokens)
+        if task:
+            self.router.record_call(
+                task, model, time.perf_counter() - started,
+                response.usage.input_tokens, response.usage.output_tokens
+            )
+        return response
+    
+    async def _cached_completion(
+        self,
+        method: str,
+        model: str,
+        max_tokens: int,
+        prompt: str,
+        bypass_cache: bool = False
+    ) -> Tuple[str, bool]:
+        """
+        (response text, served from cache) - from the persistent cache, or from the API (then cached)
+        bypass_cache=True always calls the API and refreshes the cached entry.
+        """
+        if bypass_cache:
+            self.response_cache.record_bypass(method)
+        else:
+            cached = await self.response_cache.get(method, model, max_tokens, prompt)
+            if cached is not None:
+                return cached, True
+        
+        response = await self._create_message(model, max_tokens, prompt, task=method)
+        text = response.content[0].text
+        await self.response_cache.put(method, model, max_tokens, prompt, text)
+        return text, False
+    
+    async def _routed_completion(
+        self,
+        method: str,
+        max_tokens: int,
+        prompt: str,
+        quality: Callable[[str, str], Awaitable[Optional[float]]],
+        bypass_cache: bool = False
+    ) -> str:
+        """
+        _cached_completion on the model the router picks for this call type
+        quality(text, model) rates the result 0-10 (None = not rated); a fast-model
+        result rated below the routing threshold is redone on the primary model.
+        Cache hits are still checked but not recorded - they were rated when produced.
+        """
+        model = self.router.choose(method)
+        text, cached = await self._cached_completion(method, model, max_tokens, prompt, bypass_cache)
+        
+        score = await quality(text, model)
+        if score is not None and self.router.should_fall_back(method, model, score, record=not cached):
+            text, cached = await self._cached_completion(method, self.primary_model, max_tokens, prompt, bypass_cache)
+            if not cached:
+                primary_score = await quality(text, self.primary_model)
+                if primary_score is not None:
+                    self.router.record_quality(method, self.primary_model, primary_score)
+        return text
+    
+    async def _stream_message(self, model: str, max_tokens: int, prompt: str) -> AsyncIterator[str]:
+        """Streaming counterpart of _create_message: yields text deltas under the same limiter"""
+        prompt_tokens = estimate_tokens(prompt)
+        estimated = prompt_tokens + max_tokens
+        await self.rate_limiter.acquire(estimated)
+        
+        # Until the final usage arrives, charge the prompt plus what has streamed so far
+        streamed_chars = 0
+        used = None
+        try:
+            async with self.client.messages.stream(
+                model=model,
+                max_tokens=max_tokens,
+                messages=[{"role": "user", "content": prompt}]
+            ) as stream:
+                self.rate_limiter.update_from_headers(stream.response.headers)
+                async for text in stream.text_stream:
+                    streamed_chars += len(text)
+                    yield text
+                final = await stream.get_final_message()
+                used = final.usage.input_tokens + final.usage.output_tokens
+        except RateLimitError as e:
+            self.rate_limiter.record_rate_limited(e.response.headers)
+            raise
+        finally:
+            self.rate_limiter.settle(estimated, used if used is not None else prompt_tokens + streamed_chars // 4)
+    
     async def generate_article_content(
         self,
         topic: str,
@@ -49,72 +214,160 @@ class ClaudeService:
     ) -> Dict[str, Any]:
         """
         Generate article content following PROVEN PATTERN from documentation
+        Pipeline: body first, then SEO description, SEO metadata and quality scoring
+        concurrently - each is an independent call gated only by the shared rate limiter.
         """
         try:
-            async with self.operation_semaphore:
-                prompt = self._build_content_prompt(topic, target_audience, word_count, additional_requirements)
-                
-                response = await asyncio.to_thread(
-                    self.client.messages.create,
-                    model=self.primary_model,
-                    max_tokens=4000,
-                    messages=[{"role": "user", "content": prompt}]
+            prompt = self._build_content_prompt(topic, target_audience, word_count, additional_requirements)
+            task = 'generate_article_content'
+            
+            model = self.router.choose(task)
+            response = await self._create_message(model, 4000, prompt, task=task)
+            result = await self.complete_generated_article(
+                response.content[0].text, topic, target_audience, model_used=model
+            )
+            
+            # The article is scored anyway, so every generation feeds the router
+            if result['quality_score'] is not None and self.router.should_fall_back(task, model, result['quality_score']):
+                response = await self._create_message(self.primary_model, 4000, prompt, task=task)
+                result = await self.complete_generated_article(
+                    response.content[0].text, topic, target_audience, model_used=self.primary_model
                 )
-                
-                content = response.content[0].text
-                
-                # Extract title from content (first H1 heading)
-                title = self._extract_title_from_content(content)
-                
-                # Generate SEO description
-                seo_description = await self._generate_seo_description(title, content)
-                
-                result = {
-                    'title': title,
-                    'content': content,
-                    'seo_description': seo_description,
-                    'word_count': len(content.split()),
-                    'topic': topic,
-                    'target_audience': target_audience,
-                    'model_used': self.primary_model
-                }
-                
-                logger.info(f"Generated article: {title} ({result['word_count']} words)")
-                return result
-                
+                if result['quality_score'] is not None:
+                    self.router.record_quality(task, self.primary_model, result['quality_score'])
+            
+            return result
+            
         except Exception as e:
             logger.error(f"Content generation failed for topic '{topic}': {e}")
             raise ValueError(f"Content generation failed: {str(e)}")
     
-    async def enhance_content(self, content: str, enhancement_type: str = "general") -> str:
-        """Enhance existing content with AI"""
+    async def stream_article_content(
+        self,
+        topic: str,
+        target_audience: str = "digital_nomads",
+        word_count: int = 1000,
+        additional_requirements: Optional[str] = None
+    ) -> AsyncIterator[str]:
+        """
+        Streaming variant of generate_article_content: yields body text deltas as they arrive
+        Pass the assembled text to complete_generated_article for title, SEO and scoring.
+        Always uses the primary model - a streamed draft cannot fall back after the fact.
+        """
         try:
-            async with self.operation_semaphore:
-                enhancement_prompts = {
-                    "general": "Enhance this article content to make it more engaging, informative, and well-structured. Maintain the core message but improve readability, flow, and impact.",
-                    "seo": "Optimize this content for SEO while maintaining readability. Improve headers, add relevant keywords naturally, and enhance structure for search engines.",
-                    "readability": "Improve the readability and clarity of this content. Make it more accessible to a broader audience while maintaining its informativeness.",
-                    "engagement": "Make this content more engaging and compelling. Add storytelling elements, better examples, and more persuasive language."
-                }
-                
-                prompt = f"{enhancement_prompts.get(enhancement_type, enhancement_prompts['general'])}\n\nContent to enhance:\n\n{content}"
-                
-                response = await asyncio.to_thread(
-                    self.client.messages.create,
-                    model=self.primary_model,
-                    max_tokens=4000,
-                    messages=[{"role": "user", "content": prompt}]
+            prompt = self._build_content_prompt(topic, target_audience, word_count, additional_requirements)
+            
+            async for delta in self._stream_message(self.primary_model, 4000, prompt):
+                yield delta
+            
+        except Exception as e:
+            logger.error(f"Streaming content generation failed for topic '{topic}': {e}")
+            raise ValueError(f"Content generation failed: {str(e)}")
+    
+    async def complete_generated_article(
+        self,
+        content: str,
+        topic: str,
+        target_audience: str = "digital_nomads",
+        model_used: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Second pipeline stage: title, SEO description, SEO metadata and quality score for a body"""
+        # Extract title from content (first H1 heading)
+        title = self._extract_title_from_content(content)
+        
+        # Post-processing fan-out (each step has its own fallback, so none can fail the article)
+        seo_description, seo_metadata, quality = await asyncio.gather(
+            self._generate_seo_description(title, content),
+            self.generate_seo_metadata(title, content),
+            self._score_generated_content(content)
+        )
+        
+        result = {
+            'title': title,
+            'content': content,
+            'seo_description': seo_description,
+            'seo_metadata': seo_metadata,
+            'quality_score': quality['quality_score'] if quality else None,
+            'quality_issues': quality['issues'] if quality else [],
+            'word_count': len(content.split()),
+            'topic': topic,
+            'target_audience': target_audience,
+            'model_used': model_used or self.primary_model
+        }
+        
+        logger.info(f"Generated article: {title} ({result['word_count']} words)")
+        return result
+    
+    async def enhance_content(
+        self,
+        content: str,
+        enhancement_type: str = "general",
+        bypass_cache: bool = False
+    ) -> str:
+        """
+        Enhance existing content with AI (cached per content and enhancement type)
+        Articles above ENHANCE_SECTION_TOKENS are split on Markdown headers and the
+        sections enhanced concurrently (shared rate limiter), then stitched in order -
+        nothing is cut off by the output limit, and only edited sections miss the cache.
+        """
+        try:
+            enhancement_prompts = {
+                "general": "Enhance this article content to make it more engaging, informative, and well-structured. Maintain the core message but improve readability, flow, and impact.",
+                "seo": "Optimize this content for SEO while maintaining readability. Improve headers, add relevant keywords naturally, and enhance structure for search engines.",
+                "readability": "Improve the readability and clarity of this content. Make it more accessible to a broader audience while maintaining its informativeness.",
+                "engagement": "Make this content more engaging and compelling. Add storytelling elements, better examples, and more persuasive language."
+            }
+            
+            instruction = enhancement_prompts.get(enhancement_type, enhancement_prompts['general'])
+            
+            sections = split_sections(content, ENHANCE_SECTION_TOKENS)
+            if len(sections) == 1:
+                prompt = f"{instruction}\n\nContent to enhance:\n\n{content}"
+                enhanced_content = await self._routed_completion(
+                    'enhance_content', self._output_budget(content), prompt,
+                    lambda text, model: self._rate_fast_enhancement(text, model, content, sample_score=True),
+                    bypass_cache
                 )
-                
-                enhanced_content = response.content[0].text
-                logger.info(f"Enhanced content using {enhancement_type} enhancement")
-                return enhanced_content
-                
+            else:
+                title = self._extract_title_from_content(content)
+                results = await asyncio.gather(
+                    *(self._enhance_section(instruction, title, section, bypass_cache) for section in sections),
+                    return_exceptions=True
+                )
+                failed = [result for result in results if isinstance(result, Exception)]
+                if len(failed) == len(sections):
+                    raise failed[0]
+                if failed:
+                    logger.warning(f"{len(failed)}/{len(sections)} sections kept unenhanced: {failed[0]}")
+                # A failed section keeps its original text rather than failing the whole article
+                enhanced_content = "\n\n".join(
+                    (section if isinstance(result, Exception) else result).strip()
+                    for section, result in zip(sections, results)
+                ) + "\n"
+            
+            logger.info(f"Enhanced content using {enhancement_type} enhancement ({len(sections)} sections)")
+            return enhanced_content
+            
         except Exception as e:
             logger.error(f"Content enhancement failed: {e}")
             raise ValueError(f"Content enhancement failed: {str(e)}")
     
-    async def validate_content_quality(self, content: str) -> Dict[str, Any]:
+    async def _enhance_section(self, instruction: str, title: str, section: str, bypass_cache: bool) -> str:
+        """One section of a long article, enhanced on its own"""
+        prompt = f"""{instruction}
+
+This is one section of a longer article titled "{title}". Enhance only this section: keep its headers and Markdown structure, do not add a title, introduction or conclusion of your own, and reply with the rewritten section only.
+
+Section to enhance:
+
+{section}"""
+        return await self._routed_completion(
+            'enhance_content', self._output_budget(section), prompt,
+            lambda text, model: self._rate_fast_enhancement(text, model, section, sample_score=False),
+            bypass_cache
+        )
+    
+    async def validate_content_quality(self, content: str, bypass_cache: bool = False) -> Dict[str, Any]:
         """
         Validate AI-generated content quality - MANDATORY per guardrails
         """
@@ -128,10 +381,73 @@ class ClaudeService:
                 raise ValueError("Content must have proper header structure")
             
             # AI quality validation
-            async with self.operation_semaphore:
-                prompt = f"""Rate this content quality 1-10 and identify any issues:
+            quality = await self.score_content_quality(content, bypass_cache)
+            score = quality['quality_score']
+            issues = quality['issues']
+            
+            if score < 7:
+                raise ValueError(f"Content quality too low: {score}/10. Issues: {', '.join(issues)}")
+            
+            validation_result = {
+                'quality_score': score,
+                'word_count': word_count,
+                'issues': issues,
+                'passed': True
+            }
+            
+            logger.info(f"Content validation passed with score {score}/10")
+            return validation_result
+            
+        except ValueError as e:
+            # Re-raise validation errors
+            raise e
+        except Exception as e:
+            logger.error(f"Content validation failed: {e}")
+            raise ValueError(f"Content validation failed: {str(e)}")
+    
+    async def score_content_quality(self, content: str, bypass_cache: bool = False) -> Dict[str, Any]:
+        """
+        AI quality score (1-10) and issues, without pass/fail thresholds
+        The whole article is read: above SCORE_SECTION_TOKENS, sections are scored
+        concurrently and combined into a length-weighted score, issues prefixed by section.
+        """
+        sections = split_sections(content, SCORE_SECTION_TOKENS)
+        if len(sections) == 1:
+            return await self._score_section(content, bypass_cache)
+        
+        qualities = await asyncio.gather(*(self._score_section(section, bypass_cache) for section in sections))
+        
+        # Unparseable replies score 0 - leave them out of the average unless nothing parsed
+        weighted = [
+            (quality['quality_score'], estimate_tokens(section))
+            for section, quality in zip(sections, qualities) if quality['quality_score'] > 0
+        ]
+        score = round(sum(s * w for s, w in weighted) / sum(w for _, w in weighted)) if weighted else 0
+        
+        issues = []
+        for section, quality in zip(sections, qualities):
+            heading = section_heading(section)
+            for issue in quality['issues']:
+                if issue.strip('[]. ').lower() in ('', 'none', 'n/a'):
+                    continue
+                labelled = f"{heading}: {issue}" if heading else issue
+                if labelled not in issues:
+                    issues.append(labelled)
+        
+        return {'quality_score': score, 'issues': issues}
+    
+    async def _score_section(self, content: str, bypass_cache: bool) -> Dict[str, Any]:
+        response_text = await self._routed_completion(
+            'validate_content_quality', 500, self._quality_prompt(content), self._rate_quality_reply, bypass_cache
+        )
+        return self.parse_quality_response(response_text)
+    
+    @staticmethod
+    def _quality_prompt(content: str) -> str:
+        excerpt = truncate_to_tokens(content, SCORE_SECTION_TOKENS)
+        return f"""Rate this content quality 1-10 and identify any issues:
                 
-{content[:500]}...
+{excerpt}{'...' if len(excerpt) < len(content) else ''}
 
 Check for:
 - Clarity and readability
@@ -140,55 +456,50 @@ Check for:
 - SEO optimization
 
 Respond with: SCORE: X, ISSUES: [list]"""
-                
-                response = await asyncio.to_thread(
-                    self.client.messages.create,
-                    model=self.fast_model,
-                    max_tokens=500,
-                    messages=[{"role": "user", "content": prompt}]
-                )
-                
-                response_text = response.content[0].text
-                
-                # Parse score
-                score = 0
-                issues = []
-                
-                if "SCORE: " in response_text:
-                    try:
-                        score = int(response_text.split("SCORE: ")[1].split(",")[0])
-                    except (ValueError, IndexError):
-                        score = 5  # Default neutral score
-                
-                if "ISSUES: " in response_text:
-                    issues_text = response_text.split("ISSUES: ")[1]
-                    issues = [issue.strip() for issue in issues_text.split(",") if issue.strip()]
-                
-                if score < 7:
-                    raise ValueError(f"Content quality too low: {score}/10. Issues: {', '.join(issues)}")
-                
-                validation_result = {
-                    'quality_score': score,
-                    'word_count': word_count,
-                    'issues': issues,
-                    'passed': True
-                }
-                
-                logger.info(f"Content validation passed with score {score}/10")
-                return validation_result
-                
-        except ValueError as e:
-            # Re-raise validation errors
-            raise e
+    
+    @staticmethod
+    def parse_quality_response(response_text: str) -> Dict[str, Any]:
+        """{'quality_score', 'issues'} from a SCORE: X, ISSUES: [...] reply"""
+        # Parse score
+        score = 0
+        issues = []
+        
+        if "SCORE: " in response_text:
+            try:
+                score = int(response_text.split("SCORE: ")[1].split(",")[0])
+            except (ValueError, IndexError):
+                score = 5  # Default neutral score
+        
+        if "ISSUES: " in response_text:
+            issues_text = response_text.split("ISSUES: ")[1]
+            issues = [issue.strip() for issue in issues_text.split(",") if issue.strip()]
+        
+        return {'quality_score': score, 'issues': issues}
+    
+    async def _score_generated_content(self, content: str) -> Optional[Dict[str, Any]]:
+        """Quality score for a fresh generation; None if scoring fails (reviewers score later)"""
+        try:
+            return await self.score_content_quality(content)
         except Exception as e:
-            logger.error(f"Content validation failed: {e}")
-            raise ValueError(f"Content validation failed: {str(e)}")
+            logger.warning(f"Quality scoring of generated content failed: {e}")
+            return None
     
-    async def generate_seo_metadata(self, title: str, content: str) -> Dict[str, str]:
+    async def generate_seo_metadata(self, title: str, content: str, bypass_cache: bool = False) -> Dict[str, str]:
         """Generate SEO title and description"""
         try:
-            async with self.operation_semaphore:
-                prompt = f"""Generate SEO metadata for this article:
+            response_text = await self._routed_completion(
+                'generate_seo_metadata', 300, self._seo_metadata_prompt(title, content),
+                self._rate_seo_metadata, bypass_cache
+            )
+            return self.parse_seo_metadata(response_text)
+            
+        except Exception as e:
+            logger.error(f"SEO metadata generation failed: {e}")
+            return {'seo_title': title, 'meta_description': content[:155], 'keywords': []}
+    
+    @staticmethod
+    def _seo_metadata_prompt(title: str, content: str) -> str:
+        return f"""Generate SEO metadata for this article:
 
 Title: {title}
 Content: {content[:800]}...
@@ -202,34 +513,23 @@ Format:
 SEO_TITLE: [title]
 META_DESCRIPTION: [description]
 KEYWORDS: [keyword1, keyword2, keyword3]"""
-                
-                response = await asyncio.to_thread(
-                    self.client.messages.create,
-                    model=self.fast_model,
-                    max_tokens=300,
-                    messages=[{"role": "user", "content": prompt}]
-                )
-                
-                response_text = response.content[0].text
-                
-                # Parse response
-                seo_data = {}
-                
-                if "SEO_TITLE: " in response_text:
-                    seo_data['seo_title'] = response_text.split("SEO_TITLE: ")[1].split("\n")[0].strip()
-                
-                if "META_DESCRIPTION: " in response_text:
-                    seo_data['meta_description'] = response_text.split("META_DESCRIPTION: ")[1].split("\n")[0].strip()
-                
-                if "KEYWORDS: " in response_text:
-                    keywords_text = response_text.split("KEYWORDS: ")[1].split("\n")[0].strip()
-                    seo_data['keywords'] = [k.strip() for k in keywords_text.split(",")]
-                
-                return seo_data
-                
-        except Exception as e:
-            logger.error(f"SEO metadata generation failed: {e}")
-            return {'seo_title': title, 'meta_description': content[:155], 'keywords': []}
+    
+    @staticmethod
+    def parse_seo_metadata(response_text: str) -> Dict[str, Any]:
+        """seo_title / meta_description / keywords from a SEO_TITLE:... reply (missing keys omitted)"""
+        seo_data = {}
+        
+        if "SEO_TITLE: " in response_text:
+            seo_data['seo_title'] = response_text.split("SEO_TITLE: ")[1].split("\n")[0].strip()
+        
+        if "META_DESCRIPTION: " in response_text:
+            seo_data['meta_description'] = response_text.split("META_DESCRIPTION: ")[1].split("\n")[0].strip()
+        
+        if "KEYWORDS: " in response_text:
+            keywords_text = response_text.split("KEYWORDS: ")[1].split("\n")[0].strip()
+            seo_data['keywords'] = [k.strip() for k in keywords_text.split(",")]
+        
+        return seo_data
     
     def _build_content_prompt(
         self, 
@@ -271,38 +571,168 @@ Target audience: {target_audience}
         first_line = lines[0].strip() if lines else "Untitled Article"
         return first_line.replace('#', '').strip()
     
-    async def _generate_seo_description(self, title: str, content: str) -> str:
+    async def _generate_seo_description(self, title: str, content: str, bypass_cache: bool = False) -> str:
         """Generate SEO description for article"""
         try:
-            async with self.operation_semaphore:
-                prompt = f"""Write a compelling SEO meta description (150-155 characters) for this article:
+            prompt = f"""Write a compelling SEO meta description (150-155 characters) for this article:
 
 Title: {title}
 Content preview: {content[:300]}...
 
 Make it compelling, include a call-to-action, and stay under 155 characters."""
-                
-                response = await asyncio.to_thread(
-                    self.client.messages.create,
-                    model=self.fast_model,
-                    max_tokens=100,
-                    messages=[{"role": "user", "content": prompt}]
-                )
-                
-                description = response.content[0].text.strip()
-                
-                # Ensure it's under 155 characters
-                if len(description) > 155:
-                    description = description[:152] + "..."
-                
-                return description
-                
+            
+            description = (await self._routed_completion(
+                '_generate_seo_description', 100, prompt, self._rate_seo_description, bypass_cache
+            )).strip()
+            
+            # Ensure it's under 155 characters
+            if len(description) > 155:
+                description = description[:152] + "..."
+            
+            return description
+            
         except Exception as e:
             logger.error(f"SEO description generation failed: {e}")
             # Fallback: create simple description from content
             words = content.split()[:25]
             fallback = " ".join(words)
             return fallback[:152] + "..." if len(fallback) > 152 else fallback
+    
+    # Routing quality signals (0-10). Format checks are free. Enhancements are checked locally
+    # against their source; a real scoring call costs as much as the enhancement itself, so
+    # only explore_rate of whole-article fast-model results pay for one (never per section).
+    
+    async def _rate_fast_enhancement(self, text: str, model: str, source: str, sample_score: bool) -> Optional[float]:
+        """
+        Fast-model enhancements only (primary results are not redone)
+        Local check: the rewrite kept most of the source's length and all its headers -
+        catches truncation and summarising, not weak prose. sample_score swaps in a
+        paid score_content_quality call for explore_rate of results.
+        """
+        if model != self.fast_model:
+            return None
+        if sample_score and random.random() < self.router.explore_rate:
+            try:
+                return float((await self.score_content_quality(text))['quality_score'])
+            except Exception as e:
+                logger.warning(f"Scoring fast-model enhancement failed: {e}")
+        
+        source_words = len(source.split())
+        if not text.strip() or not source_words:
+            return 0.0 if source_words else None
+        length_ratio = len(text.split()) / source_words
+        headers_kept = (
+            sum(1 for line in text.splitlines() if line.startswith('#'))
+            >= sum(1 for line in source.splitlines() if line.startswith('#'))
+        )
+        return (
+            (6.0 if length_ratio >= 0.8 else 3.0 if length_ratio >= 0.5 else 0.0)
+            + (4.0 if headers_kept else 0.0)
+        )
+    
+    @staticmethod
+    async def _rate_quality_reply(text: str, model: str) -> float:
+        """Full marks for a parseable SCORE in range, nothing otherwise"""
+        try:
+            score = int(text.split("SCORE: ")[1].split(",")[0])
+        except (ValueError, IndexError):
+            return 0.0
+        return 10.0 if 1 <= score <= 10 else 0.0
+    
+    async def _rate_seo_metadata(self, text: str, model: str) -> float:
+        seo = self.parse_seo_metadata(text)
+        keywords = seo.get('keywords') or []
+        return (
+            (4.0 if 0 < len(seo.get('seo_title', '')) <= 70 else 0.0)
+            + (3.0 if 0 < len(seo.get('meta_description', '')) <= 170 else 0.0)
+            + (3.0 if 3 <= len(keywords) <= 6 else 1.5 if keywords else 0.0)
+        )
+    
+    @staticmethod
+    async def _rate_seo_description(text: str, model: str) -> float:
+        """The prompt's constraint: non-empty and within 160 characters (longer ones get cut)"""
+        length = len(text.strip())
+        if not length:
+            return 0.0
+        return 10.0 if length <= 160 else 5.0
+    
+    # Bulk mode (Message Batches API): asynchronous, half-price, outside the per-minute limits.
+    # custom_id is "<kind>-<article id>" so results map back without extra bookkeeping.
+    
+    def bulk_review_requests(self, article: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Batch requests for one article, same prompts as the live calls
+        Only what the article is missing: SEO metadata when needs_seo, a quality score
+        when needs_quality (both default to True when the keys are absent).
+        """
+        article_id = str(article['id'])
+        requests = []
+        if article.get('needs_seo', True):
+            requests.append({
+                'custom_id': f"{BULK_SEO}-{article_id}",
+                'params': {
+                    'model': self.fast_model,
+                    'max_tokens': 300,
+                    'messages': [{'role': 'user', 'content': self._seo_metadata_prompt(article['title'], article['content'])}]
+                }
+            })
+        if article.get('needs_quality', True):
+            requests.append({
+                'custom_id': f"{BULK_QUALITY}-{article_id}",
+                'params': {
+                    'model': self.fast_model,
+                    'max_tokens': 500,
+                    'messages': [{'role': 'user', 'content': self._quality_prompt(article['content'])}]
+                }
+            })
+        return requests
+    
+    @staticmethod
+    def _batch_status(batch) -> Dict[str, Any]:
+        return {
+            'id': batch.id,
+            'processing_status': batch.processing_status,
+            'request_counts': batch.request_counts.model_dump(),
+            'ended_at': batch.ended_at
+        }
+    
+    async def submit_message_batch(self, requests: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Create a message batch; returns its id and status"""
+        try:
+            batch = await self.client.messages.batches.create(requests=requests)
+            logger.info(f"Submitted message batch {batch.id} with {len(requests)} requests")
+            return self._batch_status(batch)
+            
+        except Exception as e:
+            logger.error(f"Message batch submission failed: {e}")
+            raise ValueError(f"Message batch submission failed: {str(e)}")
+    
+    async def get_message_batch(self, batch_id: str) -> Dict[str, Any]:
+        """Current processing status and request counts of a batch"""
+        try:
+            return self._batch_status(await self.client.messages.batches.retrieve(batch_id))
+            
+        except Exception as e:
+            logger.error(f"Message batch {batch_id} lookup failed: {e}")
+            raise ValueError(f"Message batch lookup failed: {str(e)}")
+    
+    async def message_batch_results(self, batch_id: str) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream an ended batch's results as {'custom_id', 'text', 'error'}
+        text is None for errored, canceled and expired requests.
+        """
+        try:
+            results = await self.client.messages.batches.results(batch_id)
+            async for entry in results:
+                if entry.result.type == 'succeeded':
+                    yield {'custom_id': entry.custom_id, 'text': entry.result.message.content[0].text, 'error': None}
+                else:
+                    error = getattr(entry.result, 'error', None)
+                    yield {'custom_id': entry.custom_id, 'text': None, 'error': str(error) if error else entry.result.type}
+                    
+        except Exception as e:
+            logger.error(f"Reading message batch {batch_id} results failed: {e}")
+            raise ValueError(f"Message batch results failed: {str(e)}")
 
 # Global Claude service instance
 claude_service = ClaudeService()
\ No newline at end of file
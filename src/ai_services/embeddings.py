@@ -0,0 +1,91 @@
+"""
+Embedding providers for Quest-CMS
+Pluggable text -> vector(1536) providers used for similarity search
+"""
+import os
+import re
+import math
+import asyncio
+import hashlib
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, List
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Must match articles.content_embedding vector(1536)
+EMBEDDING_DIMENSIONS = 1536
+
+
+class EmbeddingProvider(ABC):
+    """Base class for embedding providers"""
+
+    name = "base"
+    dimensions = EMBEDDING_DIMENSIONS
+
+    @abstractmethod
+    async def embed(self, texts: List[str]) -> List[List[float]]:
+        """Return one embedding per input text"""
+
+
+class LocalHashEmbeddingProvider(EmbeddingProvider):
+    """
+    Deterministic, dependency-free embeddings using feature hashing
+    Words and word pairs are hashed into signed buckets and L2-normalized, so texts
+    sharing vocabulary land close together. Suitable for tests and local development.
+    """
+
+    name = "local"
+
+    def __init__(self, dimensions: int = EMBEDDING_DIMENSIONS):
+        self.dimensions = dimensions
+
+    async def embed(self, texts: List[str]) -> List[List[float]]:
+        """Embed texts off the event loop (hashing is CPU-bound)"""
+        return await asyncio.to_thread(lambda: [self._embed_one(text) for text in texts])
+
+    def _embed_one(self, text: str) -> List[float]:
+        vector = [0.0] * self.dimensions
+        tokens = re.findall(r"\w+", text.lower())
+        features = tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+
+        for feature in features:
+            digest = hashlib.blake2b(feature.encode(), digest_size=8).digest()
+            value = int.from_bytes(digest, 'little')
+            index = value % self.dimensions
+            sign = 1.0 if (value >> 63) & 1 else -1.0
+            vector[index] += sign
+
+        norm = math.sqrt(sum(component * component for component in vector))
+        if norm == 0:
+            return vector
+        return [component / norm for component in vector]
+
+
+# Provider registry - register additional providers (e.g. a hosted embedding API) by name
+EMBEDDING_PROVIDERS: Dict[str, Callable[[], EmbeddingProvider]] = {
+    'local': LocalHashEmbeddingProvider,
+}
+
+
+def register_embedding_provider(name: str, factory: Callable[[], EmbeddingProvider]):
+    """Make a provider selectable through EMBEDDING_PROVIDER"""
+    EMBEDDING_PROVIDERS[name] = factory
+
+
+def get_embedding_provider(name: str = None) -> EmbeddingProvider:
+    """Instantiate the configured embedding provider"""
+    name = name or os.getenv("EMBEDDING_PROVIDER", "local")
+    try:
+        provider = EMBEDDING_PROVIDERS[name]()
+    except KeyError:
+        raise ValueError(f"Unknown embedding provider '{name}' (available: {', '.join(EMBEDDING_PROVIDERS)})")
+
+    if provider.dimensions != EMBEDDING_DIMENSIONS:
+        raise ValueError(f"Embedding provider '{name}' produces {provider.dimensions} dimensions, expected {EMBEDDING_DIMENSIONS}")
+    return provider
+
+
+def article_embedding_text(title: str, content: str) -> str:
+    """Text embedded for an article: the title carries the topic, the body the detail"""
+    return f"{title}\n\n{content}"
@@ -0,0 +1,188 @@
+"""
+Adaptive model routing for Claude calls
+Chooses between the primary and fast model per call type from observed quality
+"""
+import os
+import random
+from typing import Optional, Dict, Any
+import logging
+
+logger = logging.getLogger(__name__)
+
+PRIMARY = 'primary'
+FAST = 'fast'
+
+# Call types and the tier they use until there is evidence either way
+TASK_DEFAULTS = {
+    'generate_article_content': PRIMARY,
+    'enhance_content': PRIMARY,
+    'validate_content_quality': FAST,
+    'generate_seo_metadata': FAST,
+    '_generate_seo_description': FAST,
+}
+
+
+class _ModelStats:
+    """Running latency, token and quality figures for one (call type, model) pair"""
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.total_latency = 0.0
+        self.input_tokens = 0
+        self.output_tokens = 0
+        self.quality_samples = 0
+        self.quality_ewma: Optional[float] = None
+        self.low_quality = 0
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            'calls': self.calls,
+            'errors': self.errors,
+            'avg_latency_ms': round(self.total_latency / self.calls * 1000, 1) if self.calls else None,
+            'input_tokens': self.input_tokens,
+            'output_tokens': self.output_tokens,
+            'avg_output_tokens': round(self.output_tokens / self.calls) if self.calls else None,
+            'quality': round(self.quality_ewma, 2) if self.quality_ewma is not None else None,
+            'quality_samples': self.quality_samples,
+            'low_quality': self.low_quality
+        }
+
+
+class ModelRouter:
+    """
+    Per-call-type choice between primary_model and fast_model
+    The fast model is used for a call type once its quality (an EWMA of downstream
+    scores, 0-10) has at least `min_samples` observations at or above
+    `quality_threshold`; until then, or when it drops below, the call type uses
+    its default tier. While on the primary model, `explore_rate` of calls still go
+    to the fast model so the evidence keeps updating. A fast-model result scoring
+    below the threshold is redone on the primary model (should_fall_back).
+    """
+
+    def __init__(
+        self,
+        primary_model: str,
+        fast_model: str,
+        quality_threshold: float = 7.0,
+        min_samples: int = 20,
+        explore_rate: float = 0.05,
+        smoothing: float = 0.1,
+        enabled: bool = True
+    ):
+        self.models = {PRIMARY: primary_model, FAST: fast_model}
+        self.quality_threshold = quality_threshold
+        self.min_samples = min_samples
+        self.explore_rate = explore_rate
+        self.smoothing = smoothing
+        self.enabled = enabled
+        self._stats: Dict[str, Dict[str, _ModelStats]] = {}
+        self._decisions: Dict[str, Dict[str, int]] = {}
+
+    def _task_stats(self, task: str, tier: str) -> _ModelStats:
+        return self._stats.setdefault(task, {PRIMARY: _ModelStats(), FAST: _ModelStats()})[tier]
+
+    def _count(self, task: str, decision: str):
+        decisions = self._decisions.setdefault(task, {'primary': 0, 'fast': 0, 'explore': 0, 'fallback': 0})
+        decisions[decision] += 1
+
+    def _tier(self, model: str) -> Optional[str]:
+        for tier, name in self.models.items():
+            if name == model:
+                return tier
+        return None
+
+    def fast_is_good_enough(self, task: str) -> Optional[bool]:
+        """True/False once the fast model has enough quality samples for this call type, else None"""
+        stats = self._task_stats(task, FAST)
+        if stats.quality_samples < self.min_samples:
+            return None
+        return stats.quality_ewma >= self.quality_threshold
+
+    def choose(self, task: str) -> str:
+        """Model to use for the next call of this type"""
+        default = TASK_DEFAULTS.get(task, PRIMARY)
+        if not self.enabled or self.models[PRIMARY] == self.models[FAST]:
+            return self.models[default]
+
+        verdict = self.fast_is_good_enough(task)
+        tier = default if verdict is None else (FAST if verdict else PRIMARY)
+
+        if tier == PRIMARY and random.random() < self.explore_rate:
+            self._count(task, 'explore')
+            return self.models[FAST]
+
+        self._count(task, tier)
+        return self.models[tier]
+
+    def record_call(self, task: str, model: str, latency: float, input_tokens: int = 0, output_tokens: int = 0, error: bool = False):
+        """Latency and token usage of one API call"""
+        tier = self._tier(model)
+        if tier is None:
+            return
+        stats = self._task_stats(task, tier)
+        stats.calls += 1
+        stats.total_latency += latency
+        stats.input_tokens += input_tokens
+        stats.output_tokens += output_tokens
+        if error:
+            stats.errors += 1
+
+    def record_quality(self, task: str, model: str, score: float):
+        """Downstream quality (0-10) of a result produced by `model`"""
+        tier = self._tier(model)
+        if tier is None:
+            return
+        stats = self._task_stats(task, tier)
+        stats.quality_samples += 1
+        stats.quality_ewma = score if stats.quality_ewma is None else (
+            (1 - self.smoothing) * stats.quality_ewma + self.smoothing * score
+        )
+        if score < self.quality_threshold:
+            stats.low_quality += 1
+
+    def should_fall_back(self, task: str, model: str, score: float, record: bool = True) -> bool:
+        """
+        Record a result's quality; True when it came from the fast model and needs redoing on primary
+        record=False checks without adding a sample (e.g. a cached result rated when first produced).
+        """
+        if record:
+            self.record_quality(task, model, score)
+        if self.enabled and model == self.models[FAST] != self.models[PRIMARY] and score < self.quality_threshold:
+            self._count(task, 'fallback')
+            logger.info(f"{task}: fast model scored {score:.1f} < {self.quality_threshold} - retrying on primary")
+            return True
+        return False
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Routing decisions and per-model figures for every call type seen so far"""
+        tasks = {}
+        for task in sorted(set(self._stats) | set(self._decisions)):
+            verdict = self.fast_is_good_enough(task)
+            tasks[task] = {
+                'default': TASK_DEFAULTS.get(task, PRIMARY),
+                'route': TASK_DEFAULTS.get(task, PRIMARY) if verdict is None else (FAST if verdict else PRIMARY),
+                'decisions': self._decisions.get(task, {}),
+                PRIMARY: self._task_stats(task, PRIMARY).snapshot(),
+                FAST: self._task_stats(task, FAST).snapshot()
+            }
+        return {
+            'enabled': self.enabled,
+            'models': dict(self.models),
+            'quality_threshold': self.quality_threshold,
+            'min_samples': self.min_samples,
+            'explore_rate': self.explore_rate,
+            'tasks': tasks
+        }
+
+
+def model_router_from_env(primary_model: str, fast_model: str) -> ModelRouter:
+    """Router configured from CLAUDE_ROUTING_* environment variables"""
+    return ModelRouter(
+        primary_model,
+        fast_model,
+        quality_threshold=float(os.getenv("CLAUDE_ROUTING_QUALITY_THRESHOLD", 7)),
+        min_samples=int(os.getenv("CLAUDE_ROUTING_MIN_SAMPLES", 20)),
+        explore_rate=float(os.getenv("CLAUDE_ROUTING_EXPLORE_RATE", 0.05)),
+        enabled=os.getenv("CLAUDE_ROUTING_ENABLED", "true").lower() == "true"
+    )
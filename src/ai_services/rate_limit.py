@@ -0,0 +1,177 @@
+"""
+Client-side rate limiting for the Claude API
+Token buckets for requests-per-minute and tokens-per-minute, corrected from
+the anthropic-ratelimit-* response headers
+"""
+import time
+import asyncio
+from datetime import datetime
+from typing import Optional, Dict, Any, Mapping
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """
+    Continuously refilling bucket; capacity is the per-minute limit
+    The level may go negative after a request turns out to cost more than
+    reserved - later callers then wait for the debt to refill.
+    """
+
+    def __init__(self, per_minute: float):
+        self.capacity = float(per_minute)
+        self.level = float(per_minute)
+        self._updated = time.monotonic()
+
+    @property
+    def rate(self) -> float:
+        return self.capacity / 60.0
+
+    def _refill(self):
+        now = time.monotonic()
+        self.level = min(self.capacity, self.level + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def wait_time(self, amount: float) -> float:
+        """Seconds until `amount` can be taken (0 when available now)"""
+        self._refill()
+        if self.level >= amount:
+            return 0.0
+        return (amount - self.level) / self.rate
+
+    def take(self, amount: float):
+        self._refill()
+        self.level -= amount
+
+    def give_back(self, amount: float):
+        self._refill()
+        self.level = min(self.capacity, self.level + amount)
+
+    def sync(self, limit: Optional[float], remaining: Optional[float]):
+        """Adopt the server's view: its limit, and its remaining count when lower than ours"""
+        self._refill()
+        if limit:
+            self.capacity = float(limit)
+        if remaining is not None and remaining < self.level:
+            self.level = float(remaining)
+
+
+class RateLimiter:
+    """
+    Requests-per-minute and tokens-per-minute limiter shared by all Claude calls
+    acquire() reserves one request and the estimated tokens (prompt + max_tokens)
+    before a call; settle() refunds the difference once actual usage is known.
+    Waiters are served in arrival order.
+    """
+
+    def __init__(self, requests_per_minute: float, tokens_per_minute: float):
+        self.requests = TokenBucket(requests_per_minute)
+        self.tokens = TokenBucket(tokens_per_minute)
+        self._lock = asyncio.Lock()
+        # Hard pause after a 429 or an exhausted server-side limit
+        self._blocked_until = 0.0
+
+        self.acquired = 0
+        self.waits = 0
+        self.total_wait_seconds = 0.0
+        self.rate_limited = 0
+
+    async def acquire(self, estimated_tokens: int):
+        """Wait until a request of estimated_tokens fits both buckets, then reserve it"""
+        # A single oversized request must still be able to run once the bucket is full
+        amount = min(estimated_tokens, self.tokens.capacity)
+        started = time.monotonic()
+
+        async with self._lock:
+            while True:
+                wait = max(
+                    self.requests.wait_time(1),
+                    self.tokens.wait_time(amount),
+                    self._blocked_until - time.monotonic()
+                )
+                if wait <= 0:
+                    break
+                await asyncio.sleep(wait)
+
+            self.requests.take(1)
+            self.tokens.take(amount)
+
+        waited = time.monotonic() - started
+        self.acquired += 1
+        if waited > 0.001:
+            self.waits += 1
+            self.total_wait_seconds += waited
+
+    def settle(self, estimated_tokens: int, actual_tokens: int):
+        """Correct the token reservation with the usage reported by the API"""
+        reserved = min(estimated_tokens, self.tokens.capacity)
+        if actual_tokens < reserved:
+            self.tokens.give_back(reserved - actual_tokens)
+        elif actual_tokens > reserved:
+            self.tokens.take(actual_tokens - reserved)
+
+    def update_from_headers(self, headers: Mapping[str, str]):
+        """
+        Apply anthropic-ratelimit-* headers so limits shared with other processes
+        (or changed server-side) are respected
+        """
+        self.requests.sync(
+            _header_number(headers, 'anthropic-ratelimit-requests-limit'),
+            _header_number(headers, 'anthropic-ratelimit-requests-remaining')
+        )
+        self.tokens.sync(
+            _header_number(headers, 'anthropic-ratelimit-tokens-limit'),
+            _header_number(headers, 'anthropic-ratelimit-tokens-remaining')
+        )
+
+        for kind in ('requests', 'tokens'):
+            if _header_number(headers, f'anthropic-ratelimit-{kind}-remaining') == 0:
+                reset = _header_reset(headers.get(f'anthropic-ratelimit-{kind}-reset'))
+                if reset:
+                    self._block_for(reset)
+
+    def record_rate_limited(self, headers: Mapping[str, str]):
+        """A 429 came back: pause everyone for retry-after (or a short default)"""
+        self.rate_limited += 1
+        self.update_from_headers(headers)
+        retry_after = _header_number(headers, 'retry-after')
+        self._block_for(retry_after if retry_after is not None else 5.0)
+        logger.warning(f"Claude API rate limited - pausing requests for {retry_after or 5.0}s")
+
+    def _block_for(self, seconds: float):
+        self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Bucket levels and wait counters"""
+        return {
+            'requests_per_minute': self.requests.capacity,
+            'tokens_per_minute': self.tokens.capacity,
+            'requests_available': round(self.requests.level, 1),
+            'tokens_available': round(self.tokens.level),
+            'acquired': self.acquired,
+            'waits': self.waits,
+            'total_wait_seconds': round(self.total_wait_seconds, 2),
+            'rate_limited': self.rate_limited
+        }
+
+
+def _header_number(headers: Mapping[str, str], name: str) -> Optional[float]:
+    value = headers.get(name)
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+def _header_reset(value: Optional[str]) -> Optional[float]:
+    """Seconds until an RFC 3339 reset timestamp"""
+    if not value:
+        return None
+    try:
+        reset_at = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        return None
+    return max(0.0, reset_at.timestamp() - time.time())
@@ -0,0 +1,111 @@
+"""
+Persistent response cache for Claude calls
+Content-addressed by method, model, parameters and prompt; stored in Postgres
+"""
+import os
+import hashlib
+import json
+from typing import Optional, Dict, Any
+import logging
+
+from ..database.connection import db_manager
+from ..database.operations import AIResponseCacheOperations
+
+logger = logging.getLogger(__name__)
+
+# Bump to orphan every cached entry (e.g. after changing how responses are parsed)
+CACHE_VERSION = 1
+
+
+class ResponseCache:
+    """
+    Claude response cache with TTL and a total size budget
+    Lookups are skipped (counted as misses) when the cache is disabled or the
+    database pool is not initialized, so ClaudeService works without Postgres.
+    Eviction runs every `evict_every` writes.
+    """
+
+    def __init__(self, ttl_seconds: float, max_bytes: int, enabled: bool = True, evict_every: int = 100):
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.enabled = enabled
+        self.evict_every = evict_every
+        self._writes = 0
+        self._counters: Dict[str, Dict[str, int]] = {}
+
+    @property
+    def available(self) -> bool:
+        return self.enabled and db_manager.pool is not None
+
+    @staticmethod
+    def make_key(method: str, model: str, max_tokens: int, prompt: str) -> str:
+        """sha256 over everything that determines the response"""
+        material = json.dumps([CACHE_VERSION, method, model, max_tokens, prompt], ensure_ascii=False)
+        return hashlib.sha256(material.encode('utf-8')).hexdigest()
+
+    def _count(self, method: str, counter: str):
+        counters = self._counters.setdefault(method, {'hits': 0, 'misses': 0, 'bypassed': 0, 'errors': 0})
+        counters[counter] += 1
+
+    async def get(self, method: str, model: str, max_tokens: int, prompt: str) -> Optional[str]:
+        """Cached response text, or None on a miss"""
+        if not self.available:
+            self._count(method, 'misses')
+            return None
+
+        try:
+            cached = await AIResponseCacheOperations.get(self.make_key(method, model, max_tokens, prompt))
+        except ValueError:
+            self._count(method, 'errors')
+            self._count(method, 'misses')
+            return None
+
+        self._count(method, 'hits' if cached is not None else 'misses')
+        return cached['text'] if cached is not None else None
+
+    def record_bypass(self, method: str):
+        self._count(method, 'bypassed')
+
+    async def put(self, method: str, model: str, max_tokens: int, prompt: str, text: str):
+        """Store a response; failures are logged and otherwise ignored"""
+        if not self.available:
+            return
+
+        try:
+            await AIResponseCacheOperations.put(
+                self.make_key(method, model, max_tokens, prompt),
+                method,
+                model,
+                {'text': text},
+                len(text.encode('utf-8')),
+                self.ttl_seconds
+            )
+            self._writes += 1
+            if self._writes % self.evict_every == 0:
+                evicted = await AIResponseCacheOperations.evict(self.max_bytes)
+                if evicted:
+                    logger.info(f"AI response cache evicted {evicted} entries")
+        except ValueError:
+            self._count(method, 'errors')
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Per-method hit/miss/bypass counters and hit rates"""
+        methods = {}
+        for method, counters in self._counters.items():
+            lookups = counters['hits'] + counters['misses']
+            methods[method] = dict(counters, hit_rate=round(counters['hits'] / lookups, 3) if lookups else 0.0)
+        return {
+            'enabled': self.enabled,
+            'ttl_seconds': self.ttl_seconds,
+            'max_bytes': self.max_bytes,
+            'methods': methods
+        }
+
+
+def response_cache_from_env() -> ResponseCache:
+    """Cache configured from CLAUDE_CACHE_* environment variables"""
+    return ResponseCache(
+        ttl_seconds=float(os.getenv("CLAUDE_CACHE_TTL", 7 * 24 * 3600)),
+        max_bytes=int(os.getenv("CLAUDE_CACHE_MAX_BYTES", 256 * 1024 * 1024)),
+        enabled=os.getenv("CLAUDE_CACHE_ENABLED", "true").lower() == "true"
+    )
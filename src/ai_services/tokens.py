@@ -0,0 +1,118 @@
+"""
+Local token estimation and Markdown chunking for Claude prompts
+No tokenizer dependency: estimates are deliberately a little high so rate-limit
+reservations and output budgets err on the safe side.
+"""
+import re
+from typing import List
+
+# Words, numbers and single punctuation marks; whitespace is folded into its neighbours
+_PIECES = re.compile(r"[A-Za-z]+|\d+|[^\sA-Za-z\d]")
+
+# ATX header line (# .. ######) - the start of a new section
+_HEADER = re.compile(r"^#{1,6}\s")
+_FENCE = re.compile(r"^(```|~~~)")
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Approximate Claude token count
+    Short words are one token, longer words roughly one per 6 characters, digits
+    about one per 3, punctuation one each. Typically within ~10% (over) for English prose.
+    """
+    tokens = 0
+    for piece in _PIECES.findall(text):
+        if piece[0].isalpha():
+            tokens += 1 + (len(piece) - 1) // 6
+        elif piece[0].isdigit():
+            tokens += 1 + (len(piece) - 1) // 3
+        else:
+            tokens += 1
+    return tokens + 1
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """Longest prefix within max_tokens, cut at a paragraph, line or word boundary"""
+    if estimate_tokens(text) <= max_tokens:
+        return text
+
+    # Binary search on characters, then back off to the nearest natural boundary
+    low, high = 0, len(text)
+    while low < high:
+        middle = (low + high + 1) // 2
+        if estimate_tokens(text[:middle]) <= max_tokens:
+            low = middle
+        else:
+            high = middle - 1
+    prefix = text[:low]
+
+    for boundary in ('\n\n', '\n', ' '):
+        cut = prefix.rfind(boundary)
+        if cut > len(prefix) // 2:
+            return prefix[:cut]
+    return prefix
+
+
+def _header_sections(markdown: str) -> List[str]:
+    """Split before every header line outside fenced code; pieces concatenate back to the input"""
+    sections: List[str] = []
+    current: List[str] = []
+    in_fence = False
+    for line in markdown.splitlines(keepends=True):
+        if _FENCE.match(line.lstrip()):
+            in_fence = not in_fence
+        elif not in_fence and _HEADER.match(line) and current:
+            sections.append(''.join(current))
+            current = []
+        current.append(line)
+    if current:
+        sections.append(''.join(current))
+    return sections
+
+
+def _split_oversized(section: str, max_tokens: int) -> List[str]:
+    """Break a section above the budget on blank lines (paragraphs), hard-cutting only giant paragraphs"""
+    pieces: List[str] = []
+    current = ''
+    for paragraph in re.split(r'(?<=\n\n)', section):
+        if current and estimate_tokens(current + paragraph) > max_tokens:
+            pieces.append(current)
+            current = ''
+        while estimate_tokens(paragraph) > max_tokens:
+            head = truncate_to_tokens(paragraph, max_tokens) or paragraph[:max_tokens * 4]
+            pieces.append(head)
+            paragraph = paragraph[len(head):]
+        current += paragraph
+    if current:
+        pieces.append(current)
+    return pieces
+
+
+def split_sections(markdown: str, max_tokens: int) -> List[str]:
+    """
+    Chunk an article on Markdown headers into pieces of at most ~max_tokens
+    Adjacent small sections are merged so short articles stay one chunk; oversized
+    sections are split on paragraph boundaries. ''.join(result) == markdown.
+    """
+    if estimate_tokens(markdown) <= max_tokens:
+        return [markdown]
+
+    chunks: List[str] = []
+    current = ''
+    for section in _header_sections(markdown):
+        for piece in (_split_oversized(section, max_tokens) if estimate_tokens(section) > max_tokens else [section]):
+            if current and estimate_tokens(current + piece) > max_tokens:
+                chunks.append(current)
+                current = ''
+            current += piece
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def section_heading(section: str) -> str:
+    """Text of a chunk's first header line ('' if it has none)"""
+    for line in section.splitlines():
+        if _HEADER.match(line):
+            return line.lstrip('#').strip()
+    return ''
@@ -0,0 +1 @@
+# Public API module
@@ -0,0 +1,182 @@
+"""
+Public read-only content API for Quest sites
+JSON endpoints for published articles with ETag / Last-Modified validators
+"""
+import uuid
+import asyncio
+import hashlib
+from datetime import datetime
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Optional, Dict, Any, Iterable
+import logging
+
+from fastapi import APIRouter, Query, Request, Response
+
+from ..database.operations import ArticleOperations
+from ..database.cache import article_cache
+from ..utils.serialization import json_dumps_bytes
+from ..utils.rendering import render_markdown
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix='/api/v1', tags=['public'])
+
+# Sites may keep a copy but must revalidate it on every use
+CACHE_CONTROL = 'public, no-cache'
+
+
+def _etag(*parts: Any) -> str:
+    """Strong ETag over the given version components"""
+    digest = hashlib.blake2b(repr(parts).encode(), digest_size=16).hexdigest()
+    return f'"{digest}"'
+
+
+def _http_date(value: datetime) -> str:
+    return format_datetime(value.replace(microsecond=0), usegmt=True)
+
+
+def _not_modified(request: Request, etag: str, last_modified: Optional[datetime]) -> bool:
+    """
+    Conditional GET check (RFC 9110): If-None-Match wins over If-Modified-Since
+    """
+    if_none_match = request.headers.get('if-none-match')
+    if if_none_match is not None:
+        if if_none_match.strip() == '*':
+            return True
+        candidates = {tag.strip().removeprefix('W/') for tag in if_none_match.split(',')}
+        return etag in candidates
+
+    if_modified_since = request.headers.get('if-modified-since')
+    if if_modified_since and last_modified is not None:
+        try:
+            return last_modified.replace(microsecond=0) <= parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+    return False
+
+
+def _validator_headers(etag: str, last_modified: Optional[datetime]) -> Dict[str, str]:
+    headers = {'ETag': etag, 'Cache-Control': CACHE_CONTROL}
+    if last_modified is not None:
+        headers['Last-Modified'] = _http_date(last_modified)
+    return headers
+
+
+def _respond(request: Request, payload: Any, etag: str, last_modified: Optional[datetime]) -> Response:
+    """304 when the client's copy is current, otherwise the JSON body with validators"""
+    headers = _validator_headers(etag, last_modified)
+    if _not_modified(request, etag, last_modified):
+        return Response(status_code=304, headers=headers)
+    return Response(content=json_dumps_bytes(payload), media_type='application/json', headers=headers)
+
+
+def _error(status_code: int, message: str) -> Response:
+    return Response(
+        content=json_dumps_bytes({'error': message}),
+        status_code=status_code,
+        media_type='application/json'
+    )
+
+
+def _results_version(rows: Iterable[Dict[str, Any]]) -> Optional[datetime]:
+    return max((row['updated_at'] for row in rows if row.get('updated_at')), default=None)
+
+
+@router.get('/articles')
+async def list_articles(
+    request: Request,
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = None
+):
+    """Published articles, newest first, with keyset pagination"""
+    try:
+        if cursor:
+            ArticleOperations._decode_cursor(cursor)
+    except ValueError as e:
+        return _error(400, str(e))
+
+    try:
+        # Validate against the collection version first so unchanged polls skip the listing query
+        version = await ArticleOperations.get_published_collection_version()
+        etag = _etag('articles', version['last_modified'], version['total'], limit, cursor)
+        if _not_modified(request, etag, version['last_modified']):
+            return Response(status_code=304, headers=_validator_headers(etag, version['last_modified']))
+
+        page = await ArticleOperations.list_articles_page(
+            status='published', limit=limit, cursor=cursor, projection='card'
+        )
+        return _respond(request, page, etag, version['last_modified'])
+
+    except ValueError as e:
+        logger.error(f"Public article listing failed: {e}")
+        return _error(503, 'Article listing unavailable')
+
+
+def _cached_response(request: Request, entry: Dict[str, Any]) -> Response:
+    headers = _validator_headers(entry['etag'], entry['updated_at'])
+    if _not_modified(request, entry['etag'], entry['updated_at']):
+        return Response(status_code=304, headers=headers)
+    return Response(content=entry['body'], media_type='application/json', headers=headers)
+
+
+@router.get('/articles/{article_id}')
+async def get_article(request: Request, article_id: str):
+    """A single published article (served from article_cache when warm)"""
+    try:
+        article_id = str(uuid.UUID(article_id))
+    except ValueError:
+        return _error(404, 'Article not found')
+
+    entry = article_cache.get(article_id)
+    if entry is not None:
+        return _cached_response(request, entry)
+
+    try:
+        generation = article_cache.generation
+        updated_at = await ArticleOperations.get_published_article_version(article_id)
+        if updated_at is None:
+            return _error(404, 'Article not found')
+
+        etag = _etag('article', article_id, updated_at)
+        if _not_modified(request, etag, updated_at):
+            return Response(status_code=304, headers=_validator_headers(etag, updated_at))
+
+        # Fill from the primary: a lagging replica could otherwise repopulate the cache
+        # with the version an article_changes NOTIFY has just invalidated
+        article = await ArticleOperations.get_published_article(article_id, use_primary=True)
+        if article is None:
+            return _error(404, 'Article not found')
+        if article['content_html'] is None:
+            # Not rendered yet (loaded before render-on-write) - see manage.py render-html
+            article['content_html'] = await asyncio.to_thread(render_markdown, article['content'])
+
+        entry = {
+            'etag': _etag('article', article_id, article['updated_at']),
+            'updated_at': article['updated_at'],
+            'body': json_dumps_bytes(article)
+        }
+        article_cache.set(article_id, entry, entry['body'], generation)
+        return _cached_response(request, entry)
+
+    except ValueError as e:
+        logger.error(f"Public article retrieval failed for {article_id}: {e}")
+        return _error(503, 'Article retrieval unavailable')
+
+
+@router.get('/search')
+async def search(
+    request: Request,
+    q: str = Query(..., min_length=1, max_length=200),
+    limit: int = Query(20, ge=1, le=100)
+):
+    """Full-text search over published articles (served from the search cache when warm)"""
+    try:
+        results = await ArticleOperations.search_articles_bm25(
+            q, limit=limit, status_filter='published', projection='card'
+        )
+        etag = _etag('search', q, limit, [(str(row['id']), row['updated_at']) for row in results])
+        return _respond(request, {'query': q, 'results': results}, etag, _results_version(results))
+
+    except ValueError as e:
+        logger.error(f"Public search failed for '{q}': {e}")
+        return _error(503, 'Search unavailable')
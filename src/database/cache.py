@@ -0,0 +1,217 @@
+"""
+In-process caches for Quest-CMS database reads
+Kept next to ArticleOperations so writes can keep them coherent
+"""
+import os
+import time
+from collections import OrderedDict
+from typing import Optional, Dict, Any, List, Tuple
+
+
+class StatsCache:
+    """
+    Article counts per status with a TTL
+    Writes adjust the cached counts in place, so under steady traffic the
+    dashboard only goes to the database once per TTL window.
+    """
+
+    def __init__(self, ttl_seconds: float):
+        self.ttl_seconds = ttl_seconds
+        self._stats: Optional[Dict[str, int]] = None
+        self._loaded_at = 0.0
+
+    def get(self) -> Optional[Dict[str, int]]:
+        """Return a copy of the cached stats, or None when empty or expired"""
+        if self._stats is None or time.monotonic() - self._loaded_at > self.ttl_seconds:
+            return None
+        return dict(self._stats)
+
+    def set(self, stats: Dict[str, int]):
+        """Store freshly computed stats"""
+        self._stats = dict(stats)
+        self._loaded_at = time.monotonic()
+
+    def invalidate(self):
+        """Drop cached stats so the next read recomputes them"""
+        self._stats = None
+
+    def adjust(self, old_status: Optional[str] = None, new_status: Optional[str] = None, count: int = 1):
+        """Apply a status transition to the cached counts (no-op when nothing is cached)"""
+        if self._stats is None or old_status == new_status:
+            return
+
+        if old_status is not None:
+            self._stats[old_status] = self._stats.get(old_status, 0) - count
+            self._stats['total'] -= count
+        if new_status is not None:
+            self._stats[new_status] = self._stats.get(new_status, 0) + count
+            self._stats['total'] += count
+
+
+class SearchCache:
+    """
+    LRU + TTL cache for search results keyed by normalized query
+    Writes bump a generation counter instead of walking the cache; entries from an
+    older generation are treated as misses and replaced on the next lookup.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.generation = 0
+        self._entries: "OrderedDict[Tuple, Tuple[int, float, List[Dict[str, Any]]]]" = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.stale = 0
+
+    @staticmethod
+    def make_key(query: str, status_filter: Optional[str], limit: int, projection: str) -> Tuple:
+        """Normalize case and whitespace so trivially different queries share an entry"""
+        return (' '.join(query.lower().split()), status_filter, limit, projection)
+
+    def get(self, key: Tuple) -> Optional[List[Dict[str, Any]]]:
+        """Return cached results, or None on a miss"""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        generation, stored_at, results = entry
+        if generation != self.generation or time.monotonic() - stored_at > self.ttl_seconds:
+            del self._entries[key]
+            self.stale += 1
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        # Copy rows so callers can't mutate the cached entry
+        return [dict(row) for row in results]
+
+    def set(self, key: Tuple, results: List[Dict[str, Any]], generation: int):
+        """
+        Store results read during `generation`, evicting the least recently used entry
+        Results from a query that raced with a write are dropped rather than cached.
+        """
+        if self.max_entries <= 0 or generation != self.generation:
+            return
+        self._entries[key] = (generation, time.monotonic(), [dict(row) for row in results])
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self):
+        """Invalidate every cached result in O(1)"""
+        self.generation += 1
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Hit/miss/eviction counters for sizing the cache"""
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self._entries),
+            'max_entries': self.max_entries,
+            'ttl_seconds': self.ttl_seconds,
+            'generation': self.generation,
+            'hits': self.hits,
+            'misses': self.misses,
+            'stale': self.stale,
+            'evictions': self.evictions,
+            'hit_rate': round(self.hits / lookups, 3) if lookups else 0.0
+        }
+
+
+class ArticleCache:
+    """
+    Size-bounded LRU cache of rendered published articles, keyed by article id
+    Capacity is counted in bytes of the stored body, so a few long articles can't
+    crowd out memory the way an entry-count limit would allow. Entries are dropped
+    on NOTIFY from the articles triggers (see handle_notification); a generation
+    counter stops a read that raced with an invalidation from repopulating the cache.
+    """
+
+    # Rough per-entry bookkeeping cost (dict slot, tuple, key string)
+    ENTRY_OVERHEAD = 200
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.generation = 0
+        self.size_bytes = 0
+        self._entries: "OrderedDict[str, Tuple[int, Dict[str, Any]]]" = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(self, article_id: str) -> Optional[Dict[str, Any]]:
+        """Return the cached entry, or None on a miss"""
+        entry = self._entries.get(article_id)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(article_id)
+        self.hits += 1
+        return entry[1]
+
+    def set(self, article_id: str, value: Dict[str, Any], body: bytes, generation: int):
+        """
+        Store a rendered article: body is the serialized response, value its validators
+        Dropped when an invalidation happened after `generation` was read, or when
+        the body alone would take more than an eighth of the cache.
+        """
+        size = len(body) + self.ENTRY_OVERHEAD
+        if generation != self.generation or size > self.max_bytes // 8:
+            return
+
+        self._discard(article_id)
+        self._entries[article_id] = (size, dict(value, body=body))
+        self.size_bytes += size
+        while self.size_bytes > self.max_bytes:
+            _, (evicted_size, _) = self._entries.popitem(last=False)
+            self.size_bytes -= evicted_size
+            self.evictions += 1
+
+    def _discard(self, article_id: str):
+        entry = self._entries.pop(article_id, None)
+        if entry is not None:
+            self.size_bytes -= entry[0]
+
+    def invalidate(self, article_id: Optional[str] = None):
+        """Drop one article, or everything when article_id is None"""
+        self.generation += 1
+        self.invalidations += 1
+        if article_id is None:
+            self._entries.clear()
+            self.size_bytes = 0
+        else:
+            self._discard(article_id)
+
+    def handle_notification(self, payload: str):
+        """article_changes NOTIFY handler: payload is an article id, or '*' for everything"""
+        self.invalidate(None if payload == '*' else payload)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Occupancy and hit-rate counters for sizing the cache"""
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self._entries),
+            'size_bytes': self.size_bytes,
+            'max_bytes': self.max_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'invalidations': self.invalidations,
+            'hit_rate': round(self.hits / lookups, 3) if lookups else 0.0
+        }
+
+
+# Shared cache instances
+stats_cache = StatsCache(ttl_seconds=float(os.getenv("STATS_CACHE_TTL", 300)))
+search_cache = SearchCache(
+    max_entries=int(os.getenv("SEARCH_CACHE_SIZE", 1000)),
+    ttl_seconds=float(os.getenv("SEARCH_CACHE_TTL", 60))
+)
+article_cache = ArticleCache(max_bytes=int(os.getenv("ARTICLE_CACHE_MAX_BYTES", 64 * 1024 * 1024)))
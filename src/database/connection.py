@@ -3,12 +3,18 @@ Database connection and pool management for Quest-CMS
 Following documented database-first pattern with Neon PostgreSQL
 """
 import asyncpg
+import asyncio
 import os
 import json
-from typing import Optional, Dict, Any, List
+import time
+from contextlib import asynccontextmanager
+from typing import Optional, Dict, Any, List, Tuple, AsyncIterator, Callable
 import logging
 from datetime import datetime
 
+from .metrics import PoolMetrics
+from ..utils.serialization import json_dumps_bytes, json_loads
+
 logger = logging.getLogger(__name__)
 
 class DatabaseManager:
@@ -18,37 +24,253 @@ class DatabaseManager:
         self.pool: Optional[asyncpg.Pool] = None
         self.connection_string = os.getenv("NEON_CONNECTION_STRING")
         
+        # Optional read replica - SELECT-only traffic is routed here when set
+        self.replica_pool: Optional[asyncpg.Pool] = None
+        self.replica_connection_string = os.getenv("NEON_READ_REPLICA_CONNECTION_STRING")
+        
+        # Named registry of fixed queries: name -> (sql, returns_rows, read_only)
+        self.statements: Dict[str, tuple] = {}
+        
         if not self.connection_string:
             raise ValueError("NEON_CONNECTION_STRING environment variable is required")
+        
+        # Pool sizing and timeouts - environment-based configuration
+        self.pool_max_size = int(os.getenv("DB_POOL_MAX_SIZE", self._default_max_pool_size()))
+        self.pool_min_size = min(int(os.getenv("DB_POOL_MIN_SIZE", 2)), self.pool_max_size)
+        self.max_inactive_connection_lifetime = float(os.getenv("DB_POOL_MAX_INACTIVE_LIFETIME", 300))
+        self.statement_cache_size = int(os.getenv("DB_STATEMENT_CACHE_SIZE", 100))
+        self.acquire_timeout = float(os.getenv("DB_POOL_ACQUIRE_TIMEOUT", 10))
+        self.command_timeout = float(os.getenv("DB_COMMAND_TIMEOUT", 30))
+        
+        self.metrics = PoolMetrics()
+        self.replica_metrics = PoolMetrics()
+        
+        # Dedicated LISTEN connection (outside the pool): channel -> callbacks(payload)
+        self.listener_connection: Optional[asyncpg.Connection] = None
+        self.listeners: Dict[str, List[Callable[[str], None]]] = {}
+        self._listener_reconnect: Optional[asyncio.Task] = None
+        self._closing = False
+    
+    @staticmethod
+    def _default_max_pool_size() -> int:
+        """Auto-size the pool from available cores: (cores * 2) + 1, at least 5"""
+        return max(5, (os.cpu_count() or 1) * 2 + 1)
     
     async def initialize(self):
         """Initialize database connection pool"""
         try:
-            self.pool = await asyncpg.create_pool(
-                self.connection_string,
-                min_size=1,
-                max_size=5,
-                command_timeout=30
+            self.pool = await self._create_pool(self.connection_string)
+            logger.info(
+                f"Database pool sized min={self.pool_min_size} max={self.pool_max_size} "
+                f"acquire_timeout={self.acquire_timeout}s"
             )
             
             # Validate connection and schema
             await self.validate_database_health()
             logger.info("Database connection pool initialized successfully")
             
+            if self.replica_connection_string:
+                self.replica_pool = await self._create_pool(self.replica_connection_string)
+                await self.validate_database_health(read_only=True)
+                logger.info("Read replica connection pool initialized successfully")
+            
         except Exception as e:
             logger.error(f"Failed to initialize database: {e}")
             raise ValueError(f"Database initialization failed: {e}")
     
+    async def _create_pool(self, dsn: str) -> asyncpg.Pool:
+        """Create a connection pool with the configured sizing"""
+        return await asyncpg.create_pool(
+            dsn,
+            min_size=self.pool_min_size,
+            max_size=self.pool_max_size,
+            max_inactive_connection_lifetime=self.max_inactive_connection_lifetime,
+            statement_cache_size=self.statement_cache_size,
+            command_timeout=self.command_timeout,
+            init=self._init_connection
+        )
+    
+    async def _init_connection(self, conn: asyncpg.Connection):
+        """
+        Per-connection setup: decode JSON/JSONB straight to Python objects
+        Binary format keeps COPY working and avoids a json.loads/dumps round trip in callers.
+        """
+        await conn.set_type_codec(
+            'jsonb',
+            encoder=lambda value: b'\x01' + json_dumps_bytes(value),
+            decoder=lambda data: json_loads(data[1:]),
+            schema='pg_catalog',
+            format='binary'
+        )
+        await conn.set_type_codec(
+            'json',
+            encoder=json_dumps_bytes,
+            decoder=json_loads,
+            schema='pg_catalog',
+            format='binary'
+        )
+    
+    @asynccontextmanager
+    async def acquire(self, read_only: bool = False) -> AsyncIterator[asyncpg.Connection]:
+        """
+        Acquire a pooled connection, recording wait time
+        read_only=True uses the replica pool when one is configured.
+        """
+        pool, metrics = self._pool_for(read_only)
+        
+        start = time.perf_counter()
+        try:
+            conn = await pool.acquire(timeout=self.acquire_timeout)
+        except asyncio.TimeoutError:
+            metrics.record_acquire_timeout()
+            logger.error(f"Timed out after {self.acquire_timeout}s waiting for a database connection")
+            raise ValueError("Database pool exhausted: timed out waiting for a connection")
+        metrics.record_acquire(time.perf_counter() - start)
+        
+        try:
+            yield conn
+        finally:
+            await pool.release(conn)
+    
+    def _pool_for(self, read_only: bool) -> Tuple[asyncpg.Pool, PoolMetrics]:
+        if read_only and self.replica_pool:
+            return self.replica_pool, self.replica_metrics
+        return self.pool, self.metrics
+    
+    def record_query(self, read_only: bool):
+        """Count one statement against the pool that acquire(read_only) would use"""
+        self._pool_for(read_only)[1].record_query()
+    
+    @asynccontextmanager
+    async def advisory_lock(self, name: str) -> AsyncIterator[bool]:
+        """
+        Try to take a session-level advisory lock on the primary
+        Yields True when this process holds the lock, False when another one does.
+        Used so only one app replica runs a given background job at a time.
+        """
+        async with self.acquire() as conn:
+            locked = await conn.fetchval("SELECT pg_try_advisory_lock(hashtext($1))", name)
+            try:
+                yield locked
+            finally:
+                if locked:
+                    await conn.execute("SELECT pg_advisory_unlock(hashtext($1))", name)
+    
+    @staticmethod
+    def _is_read_only(query: str) -> bool:
+        """SELECT statements that take no row locks can be served by a replica"""
+        normalized = query.strip().upper()
+        return normalized.startswith('SELECT') and ' FOR UPDATE' not in normalized and ' FOR SHARE' not in normalized
+    
+    def get_pool_metrics(self) -> Dict[str, Any]:
+        """Live pool occupancy, acquire wait histogram and throughput"""
+        return {
+            'primary': self.metrics.snapshot(self.pool),
+            'replica': self.replica_metrics.snapshot(self.replica_pool) if self.replica_pool else None
+        }
+    
+    def register_statement(self, name: str, query: str):
+        """
+        Register a fixed query under a name
+        The SQL text never varies, so asyncpg's per-connection statement cache
+        keeps it prepared server-side and only Bind/Execute go over the wire.
+        """
+        returns_rows = query.strip().upper().startswith('SELECT')
+        self.statements[name] = (query, returns_rows, self._is_read_only(query))
+    
+    async def execute_prepared(self, name: str, *args, use_primary: bool = False) -> Any:
+        """
+        Execute a registered statement by name
+        Reads go to the replica unless use_primary=True (read-your-writes).
+        """
+        try:
+            query, returns_rows, read_only = self.statements[name]
+        except KeyError:
+            raise ValueError(f"Unknown prepared statement: {name}")
+        
+        async with self.acquire(read_only=read_only and not use_primary) as conn:
+            self.record_query(read_only and not use_primary)
+            try:
+                if returns_rows:
+                    return await conn.fetch(query, *args)
+                return await conn.fetchval(query, *args)
+            except Exception as e:
+                logger.error(f"Prepared statement {name} failed: {e}")
+                raise ValueError(f"Database operation failed: {str(e)}")
+    
+    async def listen(self, channel: str, callback: Callable[[str], None]):
+        """
+        Subscribe to NOTIFY on a channel of the primary
+        callback(payload) runs on the event loop for every notification. After a lost
+        connection is re-established it is called with '*', since notifications sent
+        while disconnected are gone.
+        """
+        self.listeners.setdefault(channel, []).append(callback)
+        if self.listener_connection is None:
+            await self._connect_listener()
+        else:
+            await self.listener_connection.add_listener(channel, self._dispatch_notification)
+    
+    async def _connect_listener(self):
+        """Open the LISTEN connection and subscribe every registered channel"""
+        self.listener_connection = await asyncpg.connect(self.connection_string)
+        self.listener_connection.add_termination_listener(self._on_listener_terminated)
+        for channel in self.listeners:
+            await self.listener_connection.add_listener(channel, self._dispatch_notification)
+        logger.info(f"Listening for notifications on: {', '.join(self.listeners)}")
+    
+    def _dispatch_notification(self, connection, pid: int, channel: str, payload: str):
+        for callback in self.listeners.get(channel, []):
+            try:
+                callback(payload)
+            except Exception as e:
+                logger.error(f"Notification handler for {channel} failed: {e}")
+    
+    def _on_listener_terminated(self, connection):
+        if self._closing or self._listener_reconnect is not None:
+            return
+        logger.warning("LISTEN connection lost - reconnecting")
+        self.listener_connection = None
+        self._listener_reconnect = asyncio.create_task(self._reconnect_listener())
+    
+    async def _reconnect_listener(self):
+        """Reconnect with capped backoff, then tell every listener to assume everything changed"""
+        delay = 1.0
+        try:
+            while not self._closing:
+                try:
+                    await self._connect_listener()
+                    break
+                except Exception as e:
+                    logger.error(f"LISTEN reconnect failed, retrying in {delay:.0f}s: {e}")
+                    await asyncio.sleep(delay)
+                    delay = min(delay * 2, 60.0)
+            else:
+                return
+            for channel in self.listeners:
+                self._dispatch_notification(self.listener_connection, 0, channel, '*')
+        finally:
+            self._listener_reconnect = None
+    
     async def close(self):
         """Close database connection pool"""
+        self._closing = True
+        if self._listener_reconnect:
+            self._listener_reconnect.cancel()
+        if self.listener_connection:
+            await self.listener_connection.close()
+            self.listener_connection = None
         if self.pool:
             await self.pool.close()
             logger.info("Database connection pool closed")
+        if self.replica_pool:
+            await self.replica_pool.close()
+            logger.info("Read replica connection pool closed")
     
-    async def validate_database_health(self):
+    async def validate_database_health(self, read_only: bool = False):
         """Validate database connectivity and schema - MANDATORY per guardrails"""
         try:
-            async with self.pool.acquire() as conn:
+            async with self.acquire(read_only=read_only) as conn:
                 # Verify schema exists
                 schema_check = await conn.fetchval("""
                     SELECT EXISTS (
@@ -64,12 +286,12 @@ class DatabaseManager:
                 index_check = await conn.fetchval("""
                     SELECT EXISTS (
                         SELECT 1 FROM pg_indexes 
-                        WHERE indexname = 'articles_search_idx'
+                        WHERE indexname = 'articles_search_vector_idx'
                     )
                 """)
                 
                 if not index_check:
-                    raise ValueError("Search index missing - run schema migration")
+                    raise ValueError("Search index missing - run migrations/003_weighted_search_vector.sql")
                 
                 logger.info("Database health check passed")
                 return True
@@ -78,9 +300,15 @@ class DatabaseManager:
             logger.error(f"Database health check failed: {e}")
             raise ValueError(f"Database health check failed: {e}")
     
-    async def execute_query(self, query: str, *args) -> Any:
-        """Execute database query with connection pooling - MANDATORY pattern"""
-        async with self.pool.acquire() as conn:
+    async def execute_query(self, query: str, *args, use_primary: bool = False) -> Any:
+        """
+        Execute database query with connection pooling - MANDATORY pattern
+        SELECT-only queries go to the read replica when configured; pass
+        use_primary=True to read your own writes.
+        """
+        read_only = self._is_read_only(query)
+        async with self.acquire(read_only=read_only and not use_primary) as conn:
+            self.record_query(read_only and not use_primary)
             try:
                 if query.strip().upper().startswith('SELECT'):
                     return await conn.fetch(query, *args)
@@ -92,10 +320,11 @@ class DatabaseManager:
     
     async def execute_transaction(self, queries: List[tuple]) -> List[Any]:
         """Execute multiple queries in a transaction"""
-        async with self.pool.acquire() as conn:
+        async with self.acquire() as conn:
             async with conn.transaction():
                 results = []
                 for query, args in queries:
+                    self.record_query(False)
                     try:
                         if query.strip().upper().startswith('SELECT'):
                             result = await conn.fetch(query, *args)
@@ -107,5 +336,15 @@ class DatabaseManager:
                         raise ValueError(f"Transaction failed: {str(e)}")
                 return results
 
+    async def copy_records(self, table: str, columns: List[str], records: List[tuple]) -> None:
+        """Stream records into a table using the binary COPY protocol"""
+        async with self.acquire() as conn:
+            self.record_query(False)
+            try:
+                await conn.copy_records_to_table(table, records=records, columns=columns)
+            except Exception as e:
+                logger.error(f"COPY into {table} failed: {e}")
+                raise ValueError(f"Bulk copy failed: {str(e)}")
+
 # Global database manager instance
 db_manager = DatabaseManager()
\ No newline at end of file
@@ -0,0 +1,88 @@
+"""
+Connection pool metrics for Quest-CMS
+Tracks acquire wait times and query throughput so the pool can be sized from data
+"""
+import time
+from collections import deque
+from typing import Dict, Any, Optional
+
+import asyncpg
+
+
+class PoolMetrics:
+    """Acquire wait-time histogram and rolling queries-per-second for one pool"""
+
+    # Upper bounds (milliseconds) of the acquire wait histogram buckets
+    WAIT_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+    def __init__(self, qps_window_seconds: int = 60):
+        self.qps_window_seconds = qps_window_seconds
+        self.wait_buckets = [0] * (len(self.WAIT_BUCKETS_MS) + 1)
+        self.acquire_count = 0
+        self.acquire_timeouts = 0
+        self.total_wait_ms = 0.0
+        self.max_wait_ms = 0.0
+        self.query_count = 0
+        # (second, count) pairs for the rolling QPS window
+        self._query_seconds: deque = deque()
+
+    def record_acquire(self, wait_seconds: float):
+        """Record how long a caller waited for a connection"""
+        wait_ms = wait_seconds * 1000
+        self.acquire_count += 1
+        self.total_wait_ms += wait_ms
+        self.max_wait_ms = max(self.max_wait_ms, wait_ms)
+
+        for index, bound in enumerate(self.WAIT_BUCKETS_MS):
+            if wait_ms <= bound:
+                self.wait_buckets[index] += 1
+                return
+        self.wait_buckets[-1] += 1
+
+    def record_acquire_timeout(self):
+        """Record a caller that gave up waiting for a connection"""
+        self.acquire_timeouts += 1
+
+    def record_query(self):
+        """Count one executed statement (called per statement, not per connection checkout)"""
+        self.query_count += 1
+        now = int(time.monotonic())
+        if self._query_seconds and self._query_seconds[-1][0] == now:
+            self._query_seconds[-1][1] += 1
+        else:
+            self._query_seconds.append([now, 1])
+        self._expire(now)
+
+    def queries_per_second(self) -> float:
+        """Average queries per second over the rolling window"""
+        self._expire(int(time.monotonic()))
+        total = sum(count for _, count in self._query_seconds)
+        return round(total / self.qps_window_seconds, 2)
+
+    def _expire(self, now: int):
+        """Drop per-second counters that left the window"""
+        while self._query_seconds and self._query_seconds[0][0] <= now - self.qps_window_seconds:
+            self._query_seconds.popleft()
+
+    def snapshot(self, pool: Optional[asyncpg.Pool]) -> Dict[str, Any]:
+        """Current pool occupancy plus accumulated counters"""
+        size = pool.get_size() if pool else 0
+        idle = pool.get_idle_size() if pool else 0
+
+        histogram = {f"le_{bound}ms": count for bound, count in zip(self.WAIT_BUCKETS_MS, self.wait_buckets)}
+        histogram['gt_5000ms'] = self.wait_buckets[-1]
+
+        return {
+            'size': size,
+            'min_size': pool.get_min_size() if pool else 0,
+            'max_size': pool.get_max_size() if pool else 0,
+            'in_use': size - idle,
+            'idle': idle,
+            'acquire_count': self.acquire_count,
+            'acquire_timeouts': self.acquire_timeouts,
+            'acquire_wait_avg_ms': round(self.total_wait_ms / self.acquire_count, 3) if self.acquire_count else 0.0,
+            'acquire_wait_max_ms': round(self.max_wait_ms, 3),
+            'acquire_wait_histogram': histogram,
+            'query_count': self.query_count,
+            'queries_per_second': self.queries_per_second()
+        }
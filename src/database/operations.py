@@ -3,14 +3,863 @@ Database operations for Quest-CMS following proven database-first patterns
 """
 import json
 import uuid
-from typing import Optional, Dict, Any, List
-from datetime import datetime
+import base64
+import asyncio
+from typing import Optional, Dict, Any, List, Tuple, Iterable, AsyncIterator
+from datetime import datetime, timezone
 import logging
 
 from .connection import db_manager
+from .cache import stats_cache, search_cache, article_cache
+from ..utils.rendering import RENDERER_VERSION, content_hash, render_markdown
 
 logger = logging.getLogger(__name__)
 
+# Column sets for read APIs - callers only transfer the columns they render
+#   summary: scalar columns for tables and public listings
+#   card:    summary plus attributes, for review-queue and search-result cards
+#   full:    everything, for editors and detail pages
+#   public:  published content without review/prompt internals, for exports and external sites
+ARTICLE_PROJECTIONS = {
+    'summary': (
+        'id', 'title', 'status',
+        'created_at', 'updated_at', 'published_at',
+        'ai_generated', 'quality_score'
+    ),
+    'card': (
+        'id', 'title', 'status', 'attributes',
+        'created_at', 'updated_at', 'published_at',
+        'ai_generated', 'ai_model', 'quality_score'
+    ),
+    'full': (
+        'id', 'title', 'content', 'status', 'attributes',
+        'created_at', 'updated_at', 'published_at',
+        'reviewed_by', 'review_notes',
+        'ai_generated', 'ai_model', 'generation_prompt', 'quality_score', 'quality_issues'
+    ),
+    'public': (
+        'id', 'title', 'content', 'content_html', 'attributes',
+        'created_at', 'updated_at', 'published_at',
+        'ai_generated', 'ai_model', 'quality_score'
+    )
+}
+
+def _projection_columns(projection: str, table_alias: Optional[str] = None) -> str:
+    """SQL column list for a named projection"""
+    try:
+        columns = ARTICLE_PROJECTIONS[projection]
+    except KeyError:
+        raise ValueError(f"Unknown projection '{projection}' (expected one of {', '.join(ARTICLE_PROJECTIONS)})")
+    if table_alias:
+        columns = [f"{table_alias}.{column}" for column in columns]
+    return ', '.join(columns)
+
+def _vector_literal(values: List[float]) -> str:
+    """pgvector text representation of an embedding"""
+    return '[' + ','.join(repr(float(value)) for value in values) + ']'
+
+# Fixed queries, registered by name so each pooled connection keeps them prepared
+db_manager.register_statement('create_article', """
+    INSERT INTO articles (
+        title, 
+        content, 
+        attributes,
+        status,
+        content_html,
+        content_html_hash
+    ) VALUES (
+        $1, $2, $3, $4, $5, $6
+    )
+    RETURNING id
+""")
+
+for _projection in ARTICLE_PROJECTIONS:
+    db_manager.register_statement(f'get_article_{_projection}', f"""
+        SELECT {_projection_columns(_projection)}
+        FROM articles 
+        WHERE id = $1
+    """)
+    
+    db_manager.register_statement(f'list_articles_{_projection}', f"""
+        SELECT {_projection_columns(_projection)}
+        FROM articles 
+        ORDER BY created_at DESC
+        LIMIT $1 OFFSET $2
+    """)
+    
+    db_manager.register_statement(f'list_articles_by_status_{_projection}', f"""
+        SELECT {_projection_columns(_projection)}
+        FROM articles 
+        WHERE status = $1
+        ORDER BY created_at DESC
+        LIMIT $2 OFFSET $3
+    """)
+
+db_manager.register_statement('delete_article', """
+    DELETE FROM articles 
+    WHERE id = $1
+    RETURNING status
+""")
+
+db_manager.register_statement('article_stats', """
+    SELECT status, count
+    FROM article_counts
+""")
+
+db_manager.register_statement('article_count_drift', """
+    SELECT 
+        COALESCE(actual.status, stored.status) AS article_status,
+        COALESCE(stored.count, 0) AS stored_count,
+        COALESCE(actual.count, 0) AS actual_count
+    FROM (
+        SELECT status, COUNT(*) AS count
+        FROM articles
+        WHERE status IS NOT NULL
+        GROUP BY status
+    ) actual
+    FULL OUTER JOIN article_counts stored ON stored.status = actual.status
+    WHERE COALESCE(stored.count, 0) <> COALESCE(actual.count, 0)
+""")
+
+db_manager.register_statement('rebuild_article_counts', """
+    SELECT article_status, stored_count, actual_count
+    FROM rebuild_article_counts()
+""")
+
+db_manager.register_statement('article_embedding', """
+    SELECT content_embedding::text AS embedding
+    FROM articles
+    WHERE id = $1
+""")
+
+db_manager.register_statement('upsert_embeddings', """
+    WITH updated AS (
+        UPDATE articles AS a
+        SET content_embedding = batch.embedding::vector, embedded_at = NOW()
+        FROM unnest($1::uuid[], $2::text[]) AS batch(id, embedding)
+        WHERE a.id = batch.id
+        RETURNING a.id
+    )
+    SELECT COUNT(*) FROM updated
+""")
+
+db_manager.register_statement('articles_missing_embeddings', """
+    SELECT id, title, content
+    FROM articles
+    WHERE content_embedding IS NULL
+      AND id > $1
+    ORDER BY id
+    LIMIT $2
+""")
+
+db_manager.register_statement('related_articles', f"""
+    SELECT 
+        {_projection_columns('card', 'a')},
+        r.rank AS related_rank,
+        r.similarity
+    FROM related_articles r
+    JOIN articles a ON a.id = r.related_id
+    WHERE r.article_id = $1
+      AND a.status = 'published'
+    ORDER BY r.rank
+    LIMIT $2
+""")
+
+# Content or embedding changes (embedding writes leave updated_at alone); uses articles_changed_idx
+db_manager.register_statement('changed_articles', """
+    SELECT id, GREATEST(updated_at, embedded_at) AS changed_at
+    FROM articles
+    WHERE (GREATEST(updated_at, embedded_at), id) > ($1, $2)
+    ORDER BY GREATEST(updated_at, embedded_at), id
+    LIMIT $3
+""")
+
+db_manager.register_statement('articles_citing_related', """
+    SELECT DISTINCT article_id
+    FROM related_articles
+    WHERE related_id = ANY($1::uuid[])
+""")
+
+# Reverse kNN candidates: published articles among each changed article's $2 nearest
+# neighbours whose stored list it now belongs in (closer than their weakest entry, or
+# their list is short). Same HNSW query shape as compute_related_articles.
+db_manager.register_statement('articles_entered_by', """
+    SELECT DISTINCT candidate.id
+    FROM articles src
+    CROSS JOIN LATERAL (
+        SELECT c.id, 1 - (c.content_embedding <=> src.content_embedding) AS similarity
+        FROM articles c
+        WHERE c.status = 'published'
+          AND c.content_embedding IS NOT NULL
+          AND c.id <> src.id
+        ORDER BY c.content_embedding <=> src.content_embedding
+        LIMIT $2
+    ) candidate
+    CROSS JOIN LATERAL (
+        SELECT COUNT(*) AS listed, MIN(r.similarity) AS weakest
+        FROM related_articles r
+        WHERE r.article_id = candidate.id
+    ) stored
+    WHERE src.id = ANY($1::uuid[])
+      AND src.status = 'published'
+      AND src.content_embedding IS NOT NULL
+      AND (stored.listed < $3 OR candidate.similarity > stored.weakest)
+""")
+
+db_manager.register_statement('clear_related_articles', """
+    DELETE FROM related_articles
+    WHERE article_id = ANY($1::uuid[])
+""")
+
+db_manager.register_statement('compute_related_articles', """
+    INSERT INTO related_articles (article_id, related_id, rank, similarity)
+    SELECT src.id, neighbour.id, neighbour.rank, neighbour.similarity
+    FROM articles src
+    CROSS JOIN LATERAL (
+        SELECT 
+            candidate.id,
+            1 - candidate.distance AS similarity,
+            row_number() OVER (ORDER BY candidate.distance) AS rank
+        FROM (
+            SELECT c.id, c.content_embedding <=> src.content_embedding AS distance
+            FROM articles c
+            WHERE c.status = 'published'
+              AND c.content_embedding IS NOT NULL
+              AND c.id <> src.id
+            ORDER BY c.content_embedding <=> src.content_embedding
+            LIMIT $2
+        ) candidate
+    ) neighbour
+    WHERE src.id = ANY($1::uuid[])
+      AND src.status = 'published'
+      AND src.content_embedding IS NOT NULL
+""")
+
+db_manager.register_statement('get_job_state', """
+    SELECT state
+    FROM job_state
+    WHERE job_name = $1
+""")
+
+db_manager.register_statement('set_job_state', """
+    INSERT INTO job_state (job_name, state, updated_at)
+    VALUES ($1, $2, NOW())
+    ON CONFLICT (job_name) DO UPDATE SET state = EXCLUDED.state, updated_at = NOW()
+""")
+
+# Render-on-write: stored HTML is current when content_html_hash = md5(RENDERER_VERSION || content)
+db_manager.register_statement('article_html_hash', """
+    SELECT content_html_hash
+    FROM articles
+    WHERE id = $1
+""")
+
+db_manager.register_statement('stale_article_content', """
+    SELECT content
+    FROM articles
+    WHERE id = $1
+      AND content_html_hash IS DISTINCT FROM md5($2 || content)
+""")
+
+db_manager.register_statement('articles_needing_render', """
+    SELECT id, content
+    FROM articles
+    WHERE status = 'published'
+      AND content_html_hash IS DISTINCT FROM md5($1 || content)
+      AND id > $2
+    ORDER BY id
+    LIMIT $3
+""")
+
+# Guarded on the hash so a render of content edited in the meantime is not stored
+db_manager.register_statement('store_rendered_html', """
+    WITH rendered AS (
+        UPDATE articles
+        SET content_html = r.html, content_html_hash = r.hash
+        FROM unnest($1::uuid[], $2::text[], $3::text[]) AS r(id, html, hash)
+        WHERE articles.id = r.id
+          AND md5($4 || articles.content) = r.hash
+        RETURNING 1
+    )
+    SELECT COUNT(*) FROM rendered
+""")
+
+db_manager.register_statement('get_published_article', f"""
+    SELECT {_projection_columns('public')}
+    FROM articles
+    WHERE id = $1 AND status = 'published'
+""")
+
+# Cheap validators for conditional GETs: answer 304s without loading content
+db_manager.register_statement('published_article_version', """
+    SELECT updated_at
+    FROM articles
+    WHERE id = $1 AND status = 'published'
+""")
+
+db_manager.register_statement('published_collection_version', """
+    SELECT
+        (SELECT MAX(updated_at) FROM articles WHERE status = 'published') AS last_modified,
+        (SELECT count FROM article_counts WHERE status = 'published') AS total
+""")
+
+db_manager.register_statement('article_tombstones_since', """
+    SELECT article_id, removed_at
+    FROM article_tombstones
+    WHERE removed_at > $1
+    ORDER BY removed_at, article_id
+""")
+
+db_manager.register_statement('mark_ai_generated', """
+    UPDATE articles 
+    SET 
+        ai_generated = $1,
+        ai_model = $2,
+        generation_prompt = $3
+    WHERE id = $4
+    RETURNING id
+""")
+
+db_manager.register_statement('mark_ai_generated_with_score', """
+    UPDATE articles 
+    SET 
+        ai_generated = $1,
+        ai_model = $2,
+        generation_prompt = $3,
+        quality_score = $5
+    WHERE id = $4
+    RETURNING id
+""")
+
+# Generated articles carry their job id; a retried job's insert is a no-op and the first copy is looked up
+db_manager.register_statement('create_generated_article', """
+    INSERT INTO articles (
+        title, content, attributes, status, content_html, content_html_hash,
+        ai_generated, ai_model, generation_prompt, quality_score, quality_issues, generation_job_id
+    ) VALUES (
+        $1, $2, $3, $4, $5, $6, true, $7, $8, $9, $11, $10
+    )
+    ON CONFLICT (generation_job_id) DO NOTHING
+    RETURNING id
+""")
+
+db_manager.register_statement('article_for_generation_job', """
+    SELECT id FROM articles WHERE generation_job_id = $1
+""")
+
+db_manager.register_statement('get_ai_response', """
+    UPDATE ai_response_cache
+    SET hit_count = hit_count + 1, last_used_at = NOW()
+    WHERE cache_key = $1 AND expires_at > NOW()
+    RETURNING response
+""")
+
+db_manager.register_statement('put_ai_response', """
+    INSERT INTO ai_response_cache (cache_key, method, model, response, size_bytes, expires_at)
+    VALUES ($1, $2, $3, $4, $5, NOW() + make_interval(secs => $6))
+    ON CONFLICT (cache_key) DO UPDATE SET
+        response = EXCLUDED.response,
+        size_bytes = EXCLUDED.size_bytes,
+        last_used_at = NOW(),
+        expires_at = EXCLUDED.expires_at
+""")
+
+# Expired rows first, then least recently used rows beyond the size budget
+db_manager.register_statement('evict_ai_responses', """
+    WITH expired AS (
+        DELETE FROM ai_response_cache
+        WHERE expires_at <= NOW()
+        RETURNING 1
+    ),
+    ranked AS (
+        SELECT cache_key, SUM(size_bytes) OVER (ORDER BY last_used_at DESC, cache_key) AS running_bytes
+        FROM ai_response_cache
+        WHERE expires_at > NOW()
+    ),
+    evicted AS (
+        DELETE FROM ai_response_cache c
+        USING ranked r
+        WHERE c.cache_key = r.cache_key AND r.running_bytes > $1
+        RETURNING 1
+    )
+    SELECT (SELECT COUNT(*) FROM expired) + (SELECT COUNT(*) FROM evicted)
+""")
+
+# Claim the oldest runnable job; concurrent workers skip rows another transaction holds
+db_manager.register_statement('claim_generation_job', """
+    WITH next_job AS (
+        SELECT id FROM generation_jobs
+        WHERE status = 'queued' AND run_after <= NOW()
+        ORDER BY run_after, created_at
+        LIMIT 1
+        FOR UPDATE SKIP LOCKED
+    )
+    UPDATE generation_jobs j
+    SET status = 'running', attempts = j.attempts + 1, locked_by = $1, locked_at = NOW(), updated_at = NOW()
+    FROM next_job
+    WHERE j.id = next_job.id
+    RETURNING j.id
+""")
+
+db_manager.register_statement('get_generation_job', """
+    SELECT id, batch_name, topic, target_audience, options, status, step, checkpoint,
+           attempts, max_attempts, last_error, article_id
+    FROM generation_jobs
+    WHERE id = $1
+""")
+
+# Checkpoints and heartbeats only land while the worker still owns the job
+db_manager.register_statement('checkpoint_generation_job', """
+    UPDATE generation_jobs
+    SET step = $2, checkpoint = $3, locked_at = NOW(), updated_at = NOW()
+    WHERE id = $1 AND status = 'running' AND locked_by = $4
+    RETURNING id
+""")
+
+db_manager.register_statement('heartbeat_generation_job', """
+    UPDATE generation_jobs
+    SET locked_at = NOW()
+    WHERE id = $1 AND status = 'running' AND locked_by = $2
+    RETURNING id
+""")
+
+db_manager.register_statement('complete_generation_job', """
+    UPDATE generation_jobs
+    SET status = 'succeeded', step = 'created', article_id = $2, last_error = NULL,
+        locked_by = NULL, locked_at = NULL, updated_at = NOW(), finished_at = NOW()
+    WHERE id = $1 AND status = 'running' AND locked_by = $3
+    RETURNING id
+""")
+
+# Back to the queue after $3 seconds, or failed once max_attempts is used up
+db_manager.register_statement('retry_generation_job', """
+    UPDATE generation_jobs
+    SET status = CASE WHEN attempts >= max_attempts THEN 'failed' ELSE 'queued' END,
+        run_after = NOW() + make_interval(secs => $3),
+        last_error = $2,
+        locked_by = NULL, locked_at = NULL, updated_at = NOW(),
+        finished_at = CASE WHEN attempts >= max_attempts THEN NOW() END
+    WHERE id = $1 AND status = 'running' AND locked_by = $4
+    RETURNING status
+""")
+
+# Hand an interrupted job back without charging it an attempt (worker shutdown)
+db_manager.register_statement('release_generation_job', """
+    UPDATE generation_jobs
+    SET status = 'queued', attempts = GREATEST(attempts - 1, 0),
+        locked_by = NULL, locked_at = NULL, updated_at = NOW()
+    WHERE id = $1 AND status = 'running' AND locked_by = $2
+    RETURNING id
+""")
+
+# Jobs whose worker stopped heartbeating (crashed or killed process)
+db_manager.register_statement('requeue_stale_generation_jobs', """
+    WITH stale AS (
+        UPDATE generation_jobs
+        SET status = CASE WHEN attempts >= max_attempts THEN 'failed' ELSE 'queued' END,
+            last_error = 'Worker lease expired (' || COALESCE(locked_by, 'unknown') || ')',
+            locked_by = NULL, locked_at = NULL, updated_at = NOW(),
+            finished_at = CASE WHEN attempts >= max_attempts THEN NOW() END
+        WHERE status = 'running' AND locked_at < NOW() - make_interval(secs => $1)
+        RETURNING 1
+    )
+    SELECT COUNT(*) FROM stale
+""")
+
+db_manager.register_statement('generation_batch_progress', """
+    SELECT
+        batch_name,
+        COUNT(*) AS total,
+        COUNT(*) FILTER (WHERE status = 'queued') AS queued,
+        COUNT(*) FILTER (WHERE status = 'running') AS running,
+        COUNT(*) FILTER (WHERE status = 'succeeded') AS succeeded,
+        COUNT(*) FILTER (WHERE status = 'failed') AS failed,
+        COUNT(*) FILTER (WHERE status = 'cancelled') AS cancelled,
+        MIN(created_at) AS created_at,
+        MAX(updated_at) AS updated_at
+    FROM generation_jobs
+    GROUP BY batch_name
+    ORDER BY MIN(created_at) DESC
+    LIMIT $1
+""")
+
+db_manager.register_statement('list_generation_jobs', """
+    SELECT id, batch_name, topic, status, step, attempts, max_attempts, last_error,
+           article_id, run_after, locked_by, updated_at
+    FROM generation_jobs
+    WHERE batch_name = $1
+    ORDER BY created_at, id
+    LIMIT $2
+""")
+
+db_manager.register_statement('retry_failed_generation_jobs', """
+    WITH retried AS (
+        UPDATE generation_jobs
+        SET status = 'queued', attempts = 0, run_after = NOW(), last_error = NULL,
+            updated_at = NOW(), finished_at = NULL
+        WHERE batch_name = $1 AND status = 'failed'
+        RETURNING 1
+    )
+    SELECT COUNT(*) FROM retried
+""")
+
+db_manager.register_statement('cancel_queued_generation_jobs', """
+    WITH cancelled AS (
+        UPDATE generation_jobs
+        SET status = 'cancelled', updated_at = NOW(), finished_at = NOW()
+        WHERE batch_name = $1 AND status = 'queued'
+        RETURNING 1
+    )
+    SELECT COUNT(*) FROM cancelled
+""")
+
+# Articles lacking SEO fields or a quality score, skipping those already in an unapplied batch
+db_manager.register_statement('articles_needing_ai_review', """
+    SELECT a.id, a.title, a.content,
+           a.quality_score IS NULL AS needs_quality,
+           (COALESCE(a.attributes->>'seo_title', '') = ''
+            OR COALESCE(a.attributes->>'seo_description', '') = '') AS needs_seo
+    FROM articles a
+    WHERE ($1::text IS NULL OR a.status = $1)
+      AND ($4::jsonb IS NULL OR a.attributes @> $4)
+      AND a.id > $2
+      AND (
+          a.quality_score IS NULL
+          OR COALESCE(a.attributes->>'seo_title', '') = ''
+          OR COALESCE(a.attributes->>'seo_description', '') = ''
+      )
+      AND NOT EXISTS (
+          SELECT 1 FROM ai_batches b
+          WHERE b.status <> 'applied' AND a.id = ANY(b.article_ids)
+      )
+    ORDER BY a.id
+    LIMIT $3
+""")
+
+# Bulk write-back of batch results: `fill` keys only land where the article has no value yet
+# (editor-entered SEO fields win); a score and its issues only land on articles without a score
+db_manager.register_statement('apply_ai_review', """
+    WITH updated AS (
+        UPDATE articles AS a
+        SET attributes = COALESCE(a.attributes, '{}'::jsonb)
+                || COALESCE((
+                    SELECT jsonb_object_agg(f.key, f.value)
+                    FROM jsonb_each(batch.fill) AS f
+                    WHERE COALESCE(a.attributes->>f.key, '') IN ('', '[]')
+                ), '{}'::jsonb),
+            quality_issues = CASE WHEN a.quality_score IS NULL AND batch.quality_score IS NOT NULL
+                                  THEN batch.quality_issues ELSE a.quality_issues END,
+            quality_score = COALESCE(a.quality_score, batch.quality_score)
+        FROM unnest($1::uuid[], $2::jsonb[], $3::jsonb[], $4::numeric[])
+            AS batch(id, fill, quality_issues, quality_score)
+        WHERE a.id = batch.id
+        RETURNING a.id
+    )
+    SELECT COUNT(*) FROM updated
+""")
+
+db_manager.register_statement('record_ai_batch', """
+    INSERT INTO ai_batches (id, article_ids, request_count)
+    VALUES ($1, $2, $3)
+    RETURNING id
+""")
+
+db_manager.register_statement('pending_ai_batches', """
+    SELECT id, status, article_ids, request_count, submitted_at
+    FROM ai_batches
+    WHERE status <> 'applied'
+    ORDER BY submitted_at
+""")
+
+db_manager.register_statement('update_ai_batch', """
+    UPDATE ai_batches
+    SET status = $2,
+        request_counts = COALESCE($3, request_counts),
+        ended_at = CASE WHEN $2 = 'ended' THEN COALESCE(ended_at, NOW()) ELSE ended_at END,
+        applied_at = CASE WHEN $2 = 'applied' THEN NOW() ELSE applied_at END
+    WHERE id = $1
+    RETURNING id
+""")
+
+class AIResponseCacheOperations:
+    """Persistent Claude response cache rows"""
+    
+    @staticmethod
+    async def get(cache_key: str) -> Optional[Dict[str, Any]]:
+        """Unexpired cached response (recording the hit), or None"""
+        try:
+            return await db_manager.execute_prepared('get_ai_response', cache_key)
+            
+        except Exception as e:
+            logger.error(f"Failed to read AI response cache: {e}")
+            raise ValueError(f"AI cache read failed: {str(e)}")
+    
+    @staticmethod
+    async def put(
+        cache_key: str,
+        method: str,
+        model: str,
+        response: Dict[str, Any],
+        size_bytes: int,
+        ttl_seconds: float
+    ) -> None:
+        """Insert or refresh a cached response"""
+        try:
+            await db_manager.execute_prepared(
+                'put_ai_response', cache_key, method, model, response, size_bytes, ttl_seconds
+            )
+            
+        except Exception as e:
+            logger.error(f"Failed to write AI response cache: {e}")
+            raise ValueError(f"AI cache write failed: {str(e)}")
+    
+    @staticmethod
+    async def evict(max_bytes: int) -> int:
+        """Delete expired entries and the least recently used ones over max_bytes"""
+        try:
+            return await db_manager.execute_prepared('evict_ai_responses', max_bytes)
+            
+        except Exception as e:
+            logger.error(f"Failed to evict AI response cache: {e}")
+            raise ValueError(f"AI cache eviction failed: {str(e)}")
+
+class JobStateOperations:
+    """Persistent state (watermarks, cursors) for background jobs"""
+    
+    @staticmethod
+    async def get_state(job_name: str) -> Dict[str, Any]:
+        """Load a job's saved state ({} when it has never run)"""
+        try:
+            result = await db_manager.execute_prepared('get_job_state', job_name, use_primary=True)
+            return dict(result[0]['state']) if result else {}
+            
+        except Exception as e:
+            logger.error(f"Failed to load state for job {job_name}: {e}")
+            raise ValueError(f"Job state retrieval failed: {str(e)}")
+    
+    @staticmethod
+    async def set_state(job_name: str, state: Dict[str, Any]) -> None:
+        """Persist a job's state"""
+        try:
+            await db_manager.execute_prepared('set_job_state', job_name, state)
+            
+        except Exception as e:
+            logger.error(f"Failed to save state for job {job_name}: {e}")
+            raise ValueError(f"Job state update failed: {str(e)}")
+
+class GenerationJobOperations:
+    """Durable batch generation queue (see src/jobs/generation_queue.py for the workers)"""
+    
+    NOTIFY_CHANNEL = 'generation_jobs'
+    
+    @staticmethod
+    async def enqueue(
+        batch_name: str,
+        topics: List[str],
+        target_audience: str = 'digital_nomads',
+        options: Optional[Dict[str, Any]] = None,
+        max_attempts: int = 5
+    ) -> int:
+        """Queue one job per topic and wake idle workers; returns the number queued"""
+        topics = [topic.strip() for topic in topics if topic and topic.strip()]
+        if not topics:
+            raise ValueError("At least one topic is required")
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        
+        try:
+            # NOTIFY is delivered on commit, so workers never wake before the rows are visible
+            results = await db_manager.execute_transaction([
+                ("""
+                    WITH queued AS (
+                        INSERT INTO generation_jobs (batch_name, topic, target_audience, options, max_attempts)
+                        SELECT $1, topic, $3, $4, $5 FROM unnest($2::text[]) AS topic
+                        RETURNING 1
+                    )
+                    SELECT COUNT(*) FROM queued
+                """, [batch_name, topics, target_audience, options or {}, max_attempts]),
+                ("SELECT pg_notify($1, $2)", [GenerationJobOperations.NOTIFY_CHANNEL, batch_name])
+            ])
+            queued = results[0]
+            logger.info(f"Queued {queued} generation jobs in batch '{batch_name}'")
+            return queued
+            
+        except Exception as e:
+            logger.error(f"Failed to queue generation batch '{batch_name}': {e}")
+            raise ValueError(f"Generation job enqueue failed: {str(e)}")
+    
+    @staticmethod
+    async def claim(worker_id: str) -> Optional[Dict[str, Any]]:
+        """Lock the next runnable job for this worker, or None when the queue is empty"""
+        try:
+            job_id = await db_manager.execute_prepared('claim_generation_job', worker_id)
+            if job_id is None:
+                return None
+            result = await db_manager.execute_prepared('get_generation_job', job_id, use_primary=True)
+            return dict(result[0]) if result else None
+            
+        except Exception as e:
+            logger.error(f"Failed to claim generation job: {e}")
+            raise ValueError(f"Generation job claim failed: {str(e)}")
+    
+    @staticmethod
+    async def checkpoint(job_id: str, step: str, checkpoint: Dict[str, Any], worker_id: str) -> bool:
+        """Persist a completed step's output; False when the job is no longer ours"""
+        try:
+            result = await db_manager.execute_prepared(
+                'checkpoint_generation_job', uuid.UUID(str(job_id)), step, checkpoint, worker_id
+            )
+            return result is not None
+            
+        except Exception as e:
+            logger.error(f"Failed to checkpoint generation job {job_id}: {e}")
+            raise ValueError(f"Generation job checkpoint failed: {str(e)}")
+    
+    @staticmethod
+    async def heartbeat(job_id: str, worker_id: str) -> bool:
+        """Extend the worker's lease; False when the job is no longer ours"""
+        try:
+            result = await db_manager.execute_prepared(
+                'heartbeat_generation_job', uuid.UUID(str(job_id)), worker_id
+            )
+            return result is not None
+            
+        except Exception as e:
+            logger.error(f"Failed to heartbeat generation job {job_id}: {e}")
+            raise ValueError(f"Generation job heartbeat failed: {str(e)}")
+    
+    @staticmethod
+    async def complete(job_id: str, article_id: str, worker_id: str) -> bool:
+        """Mark a job succeeded with the article it created"""
+        try:
+            result = await db_manager.execute_prepared(
+                'complete_generation_job', uuid.UUID(str(job_id)), uuid.UUID(article_id), worker_id
+            )
+            return result is not None
+            
+        except Exception as e:
+            logger.error(f"Failed to complete generation job {job_id}: {e}")
+            raise ValueError(f"Generation job completion failed: {str(e)}")
+    
+    @staticmethod
+    async def retry(job_id: str, error: str, delay_seconds: float, worker_id: str) -> Optional[str]:
+        """Requeue a failed attempt after a delay; returns the new status ('queued' or 'failed')"""
+        try:
+            return await db_manager.execute_prepared(
+                'retry_generation_job', uuid.UUID(str(job_id)), error[:2000], delay_seconds, worker_id
+            )
+            
+        except Exception as e:
+            logger.error(f"Failed to reschedule generation job {job_id}: {e}")
+            raise ValueError(f"Generation job retry failed: {str(e)}")
+    
+    @staticmethod
+    async def release(job_id: str, worker_id: str) -> bool:
+        """Return an interrupted job to the queue without using up an attempt"""
+        try:
+            result = await db_manager.execute_prepared(
+                'release_generation_job', uuid.UUID(str(job_id)), worker_id
+            )
+            return result is not None
+            
+        except Exception as e:
+            logger.error(f"Failed to release generation job {job_id}: {e}")
+            raise ValueError(f"Generation job release failed: {str(e)}")
+    
+    @staticmethod
+    async def requeue_stale(lease_seconds: float) -> int:
+        """Requeue running jobs whose worker has not heartbeated within the lease"""
+        try:
+            return await db_manager.execute_prepared('requeue_stale_generation_jobs', lease_seconds)
+            
+        except Exception as e:
+            logger.error(f"Failed to requeue stale generation jobs: {e}")
+            raise ValueError(f"Generation job recovery failed: {str(e)}")
+    
+    @staticmethod
+    async def get_batch_progress(limit: int = 20) -> List[Dict[str, Any]]:
+        """Per-batch status counts, newest batch first"""
+        try:
+            result = await db_manager.execute_prepared('generation_batch_progress', limit, use_primary=True)
+            return [dict(row) for row in result]
+            
+        except Exception as e:
+            logger.error(f"Failed to load generation batch progress: {e}")
+            raise ValueError(f"Generation progress retrieval failed: {str(e)}")
+    
+    @staticmethod
+    async def list_jobs(batch_name: str, limit: int = 500) -> List[Dict[str, Any]]:
+        """Jobs of one batch in queue order"""
+        try:
+            result = await db_manager.execute_prepared('list_generation_jobs', batch_name, limit, use_primary=True)
+            return [dict(row) for row in result]
+            
+        except Exception as e:
+            logger.error(f"Failed to list generation jobs for '{batch_name}': {e}")
+            raise ValueError(f"Generation job listing failed: {str(e)}")
+    
+    @staticmethod
+    async def retry_failed(batch_name: str) -> int:
+        """Requeue every failed job of a batch with a fresh attempt budget"""
+        try:
+            retried = await db_manager.execute_prepared('retry_failed_generation_jobs', batch_name)
+            if retried:
+                await db_manager.execute_query(
+                    "SELECT pg_notify($1, $2)", GenerationJobOperations.NOTIFY_CHANNEL, batch_name,
+                    use_primary=True
+                )
+            return retried
+            
+        except Exception as e:
+            logger.error(f"Failed to retry generation batch '{batch_name}': {e}")
+            raise ValueError(f"Generation job retry failed: {str(e)}")
+    
+    @staticmethod
+    async def cancel_queued(batch_name: str) -> int:
+        """Cancel the jobs of a batch that have not started yet"""
+        try:
+            return await db_manager.execute_prepared('cancel_queued_generation_jobs', batch_name)
+            
+        except Exception as e:
+            logger.error(f"Failed to cancel generation batch '{batch_name}': {e}")
+            raise ValueError(f"Generation job cancellation failed: {str(e)}")
+
+class AIBatchOperations:
+    """Message batches submitted for bulk AI review (see src/jobs/bulk_ai_review.py)"""
+    
+    @staticmethod
+    async def record_submitted(batch_id: str, article_ids: List[str], request_count: int) -> None:
+        """Remember a submitted batch so it is collected even if this process dies"""
+        try:
+            await db_manager.execute_prepared(
+                'record_ai_batch', batch_id, [uuid.UUID(str(article_id)) for article_id in article_ids], request_count
+            )
+            
+        except Exception as e:
+            logger.error(f"Failed to record message batch {batch_id}: {e}")
+            raise ValueError(f"AI batch recording failed: {str(e)}")
+    
+    @staticmethod
+    async def list_pending() -> List[Dict[str, Any]]:
+        """Batches not yet written back, oldest first"""
+        try:
+            results = await db_manager.execute_prepared('pending_ai_batches', use_primary=True)
+            return [dict(row) for row in results]
+            
+        except Exception as e:
+            logger.error(f"Failed to list pending message batches: {e}")
+            raise ValueError(f"AI batch listing failed: {str(e)}")
+    
+    @staticmethod
+    async def set_status(batch_id: str, status: str, request_counts: Optional[Dict[str, int]] = None) -> None:
+        """Move a batch to 'ended' or 'applied'"""
+        try:
+            await db_manager.execute_prepared('update_ai_batch', batch_id, status, request_counts)
+            
+        except Exception as e:
+            logger.error(f"Failed to update message batch {batch_id}: {e}")
+            raise ValueError(f"AI batch update failed: {str(e)}")
+
 class ArticleOperations:
     """Article database operations following documented patterns"""
     
@@ -29,18 +878,18 @@ class ArticleOperations:
             attributes = {}
         
         try:
-            article_id = await db_manager.execute_query("""
-                INSERT INTO articles (
-                    title, 
-                    content, 
-                    attributes,
-                    status
-                ) VALUES (
-                    $1, $2, $3, $4
-                )
-                RETURNING id
-            """, title, content, json.dumps(attributes), status)
+            # Published articles are rendered up front; drafts are rendered when updated or published
+            html, html_hash = None, None
+            if status == 'published':
+                html = await asyncio.to_thread(render_markdown, content)
+                html_hash = content_hash(content)
+            
+            article_id = await db_manager.execute_prepared(
+                'create_article', title, content, attributes, status, html, html_hash
+            )
             
+            stats_cache.adjust(new_status=status)
+            search_cache.invalidate()
             logger.info(f"Article created with ID: {article_id}")
             # Article immediately available via PostgREST API:
             # GET /articles?id=eq.{article_id}
@@ -51,25 +900,117 @@ class ArticleOperations:
             raise ValueError(f"Article creation failed: {str(e)}")
     
     @staticmethod
-    async def get_article(article_id: str) -> Optional[Dict[str, Any]]:
-        """Get article by ID"""
+    async def create_generated_article(
+        generation_job_id: str,
+        title: str,
+        content: str,
+        attributes: Dict[str, Any],
+        status: str,
+        ai_model: str,
+        generation_prompt: str,
+        quality_score: Optional[float] = None,
+        quality_issues: Optional[List[str]] = None
+    ) -> str:
+        """
+        Create a batch-generated article with its AI metadata in one statement
+        Idempotent per generation job: if an earlier attempt already inserted the
+        article (and crashed before checkpointing), that article's id is returned.
+        """
         try:
-            result = await db_manager.execute_query("""
-                SELECT 
-                    id, title, content, status, attributes,
-                    created_at, updated_at, published_at,
-                    reviewed_by, review_notes,
-                    ai_generated, ai_model, generation_prompt, quality_score
-                FROM articles 
-                WHERE id = $1
-            """, uuid.UUID(article_id))
+            html, html_hash = None, None
+            if status == 'published':
+                html = await asyncio.to_thread(render_markdown, content)
+                html_hash = content_hash(content)
+            
+            job_id = uuid.UUID(str(generation_job_id))
+            article_id = await db_manager.execute_prepared(
+                'create_generated_article', title, content, attributes, status, html, html_hash,
+                ai_model, generation_prompt, quality_score, job_id, quality_issues
+            )
+            if article_id is None:
+                existing = await db_manager.execute_prepared('article_for_generation_job', job_id, use_primary=True)
+                logger.info(f"Generation job {generation_job_id} already created article {existing[0]['id']}")
+                return str(existing[0]['id'])
+            
+            stats_cache.adjust(new_status=status)
+            search_cache.invalidate()
+            logger.info(f"Article created with ID: {article_id} (generation job {generation_job_id})")
+            return str(article_id)
+            
+        except Exception as e:
+            logger.error(f"Failed to create article for generation job {generation_job_id}: {e}")
+            raise ValueError(f"Article creation failed: {str(e)}")
+    
+    @staticmethod
+    async def bulk_create_articles(
+        articles: Iterable[Dict[str, Any]],
+        chunk_size: int = 1000
+    ) -> List[str]:
+        """
+        Bulk-create articles using COPY instead of one INSERT per row
+        Each item needs 'title' and 'content'; 'attributes' and 'status' are optional.
+        Ids are generated client-side so they can be returned without a round trip.
+        Published rows are rendered per chunk (off the event loop), as create_article_with_search does.
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        
+        columns = ['id', 'title', 'content', 'attributes', 'status', 'content_html', 'content_html_hash']
+        article_ids: List[str] = []
+        chunk: List[tuple] = []
+        
+        def render_published(records: List[tuple]) -> List[tuple]:
+            return [
+                record + ((render_markdown(record[2]), content_hash(record[2])) if record[4] == 'published' else (None, None))
+                for record in records
+            ]
+        
+        async def flush():
+            await db_manager.copy_records('articles', columns, await asyncio.to_thread(render_published, chunk))
+            article_ids.extend(str(record[0]) for record in chunk)
+            for status in {record[4] for record in chunk}:
+                stats_cache.adjust(new_status=status, count=sum(1 for record in chunk if record[4] == status))
+            search_cache.invalidate()
+            chunk.clear()
+        
+        try:
+            for article in articles:
+                chunk.append((
+                    uuid.uuid4(),
+                    article['title'],
+                    article['content'],
+                    article.get('attributes') or {},
+                    article.get('status', 'draft')
+                ))
+                if len(chunk) >= chunk_size:
+                    await flush()
+            
+            if chunk:
+                await flush()
+            
+            logger.info(f"Bulk created {len(article_ids)} articles")
+            return article_ids
+            
+        except Exception as e:
+            logger.error(f"Bulk article creation failed after {len(article_ids)} rows: {e}")
+            raise ValueError(f"Bulk article creation failed: {str(e)}")
+    
+    @staticmethod
+    async def get_article(
+        article_id: str,
+        use_primary: bool = False,
+        projection: str = 'full'
+    ) -> Optional[Dict[str, Any]]:
+        """Get article by ID (use_primary=True to read your own writes)"""
+        try:
+            _projection_columns(projection)
+            result = await db_manager.execute_prepared(
+                f'get_article_{projection}', uuid.UUID(article_id), use_primary=use_primary
+            )
             
             if result:
-                article = dict(result[0])
-                # Parse JSON attributes
-                if article['attributes']:
-                    article['attributes'] = json.loads(article['attributes']) if isinstance(article['attributes'], str) else article['attributes']
-                return article
+                # JSONB attributes are decoded by the connection codec
+                return dict(result[0])
             return None
             
         except Exception as e:
@@ -80,46 +1021,52 @@ class ArticleOperations:
     async def search_articles_bm25(
         query: str, 
         limit: int = 20,
-        status_filter: Optional[str] = None
+        status_filter: Optional[str] = None,
+        projection: str = 'card'
     ) -> List[Dict[str, Any]]:
         """
         Full-text search with BM25 ranking
         Following PROVEN PATTERN from documentation
+        Results render as cards with a snippet, so content is not returned unless projection='full'.
+        Repeated searches are served from search_cache until the next write.
         """
+        cache_key = search_cache.make_key(query, status_filter, limit, projection)
+        cached = search_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        generation = search_cache.generation
+        
         try:
-            base_query = """
-                SELECT 
-                    id, title, content, status, attributes,
-                    created_at, published_at,
-                    ts_rank_cd(title_search || content_search, websearch_to_tsquery($1)) as rank,
-                    ts_headline('english', content, websearch_to_tsquery($1), 'MaxWords=20') as snippet
-                FROM articles
-                WHERE 
-                    title_search @@ websearch_to_tsquery($1) 
-                    OR content_search @@ websearch_to_tsquery($1)
-            """
-            
-            params = [query]
-            
+            # Rank on the indexed search_vector in an inner query; ts_headline
+            # (the expensive part) only runs on the final top-N rows
+            params: List[Any] = [query]
+            status_clause = ""
             if status_filter:
-                base_query += " AND status = $2"
                 params.append(status_filter)
-                base_query += " ORDER BY rank DESC LIMIT $3"
-                params.append(limit)
-            else:
-                base_query += " ORDER BY rank DESC LIMIT $2"
-                params.append(limit)
+                status_clause = f"AND status = ${len(params)}"
+            params.append(limit)
             
-            results = await db_manager.execute_query(base_query, *params)
+            base_query = f"""
+                SELECT 
+                    {_projection_columns(projection, 'a')},
+                    ranked.rank,
+                    ts_headline('english', a.content, ranked.query, 'MaxWords=20') as snippet
+                FROM (
+                    SELECT id, ts_rank_cd(search_vector, query) as rank, query
+                    FROM articles, websearch_to_tsquery('english', $1) AS query
+                    WHERE search_vector @@ query
+                    {status_clause}
+                    ORDER BY rank DESC
+                    LIMIT ${len(params)}
+                ) ranked
+                JOIN articles a ON a.id = ranked.id
+                ORDER BY ranked.rank DESC
+            """
             
-            articles = []
-            for row in results:
-                article = dict(row)
-                # Parse JSON attributes
-                if article['attributes']:
-                    article['attributes'] = json.loads(article['attributes']) if isinstance(article['attributes'], str) else article['attributes']
-                articles.append(article)
+            results = await db_manager.execute_query(base_query, *params)
             
+            articles = [dict(row) for row in results]
+            search_cache.set(cache_key, articles, generation)
             return articles
             
         except Exception as e:
@@ -130,50 +1077,97 @@ class ArticleOperations:
     async def list_articles(
         status: Optional[str] = None,
         limit: int = 50,
-        offset: int = 0
+        offset: int = 0,
+        use_primary: bool = False,
+        projection: str = 'card'
     ) -> List[Dict[str, Any]]:
         """List articles with optional status filter"""
         try:
+            _projection_columns(projection)
             if status:
-                query = """
-                    SELECT 
-                        id, title, status, attributes,
-                        created_at, updated_at, published_at,
-                        ai_generated, quality_score
-                    FROM articles 
-                    WHERE status = $1
-                    ORDER BY created_at DESC
-                    LIMIT $2 OFFSET $3
-                """
-                params = [status, limit, offset]
+                results = await db_manager.execute_prepared(
+                    f'list_articles_by_status_{projection}', status, limit, offset, use_primary=use_primary
+                )
             else:
-                query = """
-                    SELECT 
-                        id, title, status, attributes,
-                        created_at, updated_at, published_at,
-                        ai_generated, quality_score
-                    FROM articles 
-                    ORDER BY created_at DESC
-                    LIMIT $1 OFFSET $2
-                """
-                params = [limit, offset]
+                results = await db_manager.execute_prepared(
+                    f'list_articles_{projection}', limit, offset, use_primary=use_primary
+                )
             
-            results = await db_manager.execute_query(query, *params)
+            return [dict(row) for row in results]
             
-            articles = []
-            for row in results:
-                article = dict(row)
-                # Parse JSON attributes
-                if article['attributes']:
-                    article['attributes'] = json.loads(article['attributes']) if isinstance(article['attributes'], str) else article['attributes']
-                articles.append(article)
+        except Exception as e:
+            logger.error(f"Failed to list articles: {e}")
+            raise ValueError(f"Article listing failed: {str(e)}")
+    
+    @staticmethod
+    async def list_articles_page(
+        status: Optional[str] = None,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        use_primary: bool = False,
+        projection: str = 'card'
+    ) -> Dict[str, Any]:
+        """
+        List articles with keyset (cursor) pagination
+        Seeks on (created_at, id) so deep pages cost the same as the first one.
+        Returns {'articles': [...], 'next_cursor': str | None}
+        """
+        try:
+            conditions = []
+            params: List[Any] = []
             
-            return articles
+            if status:
+                params.append(status)
+                conditions.append(f"status = ${len(params)}")
+            
+            if cursor:
+                cursor_created_at, cursor_id = ArticleOperations._decode_cursor(cursor)
+                params.extend([cursor_created_at, cursor_id])
+                conditions.append(f"(created_at, id) < (${len(params) - 1}, ${len(params)})")
+            
+            where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+            
+            # Fetch one extra row to know whether another page exists
+            params.append(limit + 1)
+            query = f"""
+                SELECT {_projection_columns(projection)}
+                FROM articles 
+                {where_clause}
+                ORDER BY created_at DESC, id DESC
+                LIMIT ${len(params)}
+            """
+            
+            results = await db_manager.execute_query(query, *params, use_primary=use_primary)
+            
+            articles = [dict(row) for row in results[:limit]]
+            
+            next_cursor = None
+            if len(results) > limit and articles:
+                last = articles[-1]
+                next_cursor = ArticleOperations._encode_cursor(last['created_at'], last['id'])
+            
+            return {'articles': articles, 'next_cursor': next_cursor}
             
         except Exception as e:
-            logger.error(f"Failed to list articles: {e}")
+            logger.error(f"Failed to list articles page: {e}")
             raise ValueError(f"Article listing failed: {str(e)}")
     
+    @staticmethod
+    def _encode_cursor(created_at: datetime, article_id: Any) -> str:
+        """Encode an opaque pagination cursor from (created_at, id)"""
+        raw = json.dumps([created_at.isoformat(), str(article_id)])
+        return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+    
+    @staticmethod
+    def _decode_cursor(cursor: str) -> Tuple[datetime, uuid.UUID]:
+        """Decode an opaque pagination cursor into (created_at, id)"""
+        try:
+            padded = cursor + '=' * (-len(cursor) % 4)
+            created_at, article_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+            return datetime.fromisoformat(created_at), uuid.UUID(article_id)
+        except Exception:
+            raise ValueError("Invalid pagination cursor")
+    
     @staticmethod
     async def update_article(
         article_id: str,
@@ -201,6 +1195,18 @@ class ArticleOperations:
                 params.append(content)
                 param_count += 1
             
+            if title is not None or content is not None:
+                # Stale embedding: cleared so the embedding backfill recomputes it
+                update_fields.append("content_embedding = NULL")
+            
+            rendered = await ArticleOperations._render_if_changed(article_id, content, status)
+            if rendered is not None:
+                html, html_hash = rendered
+                update_fields.append(f"content_html = ${param_count}")
+                update_fields.append(f"content_html_hash = ${param_count + 1}")
+                params.extend([html, html_hash])
+                param_count += 2
+            
             if status is not None:
                 update_fields.append(f"status = ${param_count}")
                 params.append(status)
@@ -212,7 +1218,7 @@ class ArticleOperations:
             
             if attributes is not None:
                 update_fields.append(f"attributes = ${param_count}")
-                params.append(json.dumps(attributes))
+                params.append(attributes)
                 param_count += 1
             
             if reviewed_by is not None:
@@ -236,31 +1242,121 @@ class ArticleOperations:
             # Add article ID as last parameter
             params.append(uuid.UUID(article_id))
             
-            query = f"""
-                UPDATE articles 
-                SET {', '.join(update_fields)}
-                WHERE id = ${param_count}
-                RETURNING id
-            """
+            if status is not None:
+                # Return the previous status so cached stats can be adjusted in place
+                query = f"""
+                    UPDATE articles 
+                    SET {', '.join(update_fields)}
+                    FROM (
+                        SELECT id, status AS previous_status
+                        FROM articles
+                        WHERE id = ${param_count}
+                        FOR UPDATE
+                    ) AS previous
+                    WHERE articles.id = previous.id
+                    RETURNING previous.previous_status
+                """
+            else:
+                query = f"""
+                    UPDATE articles 
+                    SET {', '.join(update_fields)}
+                    WHERE id = ${param_count}
+                    RETURNING id
+                """
             
             result = await db_manager.execute_query(query, *params)
+            
+            if result is not None:
+                search_cache.invalidate()
+                # Other replicas drop their copy on the article_changes NOTIFY
+                article_cache.invalidate(article_id)
+                if status is not None:
+                    stats_cache.adjust(old_status=result, new_status=status)
             return result is not None
             
         except Exception as e:
             logger.error(f"Failed to update article {article_id}: {e}")
             raise ValueError(f"Article update failed: {str(e)}")
     
+    @staticmethod
+    async def _render_if_changed(
+        article_id: str,
+        content: Optional[str],
+        status: Optional[str]
+    ) -> Optional[Tuple[str, str]]:
+        """
+        (html, hash) when the stored render is out of date, otherwise None
+        New content is compared by hash before rendering; publishing without new
+        content renders the stored content only if its HTML is missing or stale.
+        """
+        if content is not None:
+            html_hash = content_hash(content)
+            result = await db_manager.execute_prepared(
+                'article_html_hash', uuid.UUID(article_id), use_primary=True
+            )
+            if result and result[0]['content_html_hash'] == html_hash:
+                return None
+        elif status == 'published':
+            result = await db_manager.execute_prepared(
+                'stale_article_content', uuid.UUID(article_id), RENDERER_VERSION, use_primary=True
+            )
+            if not result:
+                return None
+            content = result[0]['content']
+            html_hash = content_hash(content)
+        else:
+            return None
+        
+        return await asyncio.to_thread(render_markdown, content), html_hash
+    
+    @staticmethod
+    async def render_stale_articles(batch_size: int = 200) -> int:
+        """
+        Render HTML for published articles whose stored render is missing or stale
+        (rows loaded before bulk ingest rendered, or every article after RENDERER_VERSION changes).
+        Returns the number of articles updated.
+        """
+        rendered = 0
+        after = uuid.UUID(int=0)
+        try:
+            while True:
+                rows = await db_manager.execute_prepared(
+                    'articles_needing_render', RENDERER_VERSION, after, batch_size, use_primary=True
+                )
+                if not rows:
+                    break
+                after = rows[-1]['id']
+                
+                contents = [row['content'] for row in rows]
+                htmls = await asyncio.to_thread(lambda: [render_markdown(text) for text in contents])
+                rendered += await db_manager.execute_prepared(
+                    'store_rendered_html',
+                    [row['id'] for row in rows],
+                    htmls,
+                    [content_hash(text) for text in contents],
+                    RENDERER_VERSION
+                )
+                logger.info(f"Rendered HTML for {rendered} articles so far")
+            
+            if rendered:
+                article_cache.invalidate()
+            return rendered
+            
+        except Exception as e:
+            logger.error(f"Failed to render stale articles: {e}")
+            raise ValueError(f"HTML render failed: {str(e)}")
+    
     @staticmethod
     async def delete_article(article_id: str) -> bool:
         """Delete article by ID"""
         try:
-            result = await db_manager.execute_query("""
-                DELETE FROM articles 
-                WHERE id = $1
-                RETURNING id
-            """, uuid.UUID(article_id))
+            previous_status = await db_manager.execute_prepared('delete_article', uuid.UUID(article_id))
             
-            return result is not None
+            if previous_status is not None:
+                stats_cache.adjust(old_status=previous_status)
+                search_cache.invalidate()
+                article_cache.invalidate(article_id)
+            return previous_status is not None
             
         except Exception as e:
             logger.error(f"Failed to delete article {article_id}: {e}")
@@ -268,15 +1364,13 @@ class ArticleOperations:
     
     @staticmethod
     async def get_article_stats() -> Dict[str, int]:
-        """Get article statistics for dashboard"""
+        """Get article statistics for dashboard (served from stats_cache when fresh)"""
+        cached = stats_cache.get()
+        if cached is not None:
+            return cached
+        
         try:
-            results = await db_manager.execute_query("""
-                SELECT 
-                    status,
-                    COUNT(*) as count
-                FROM articles 
-                GROUP BY status
-            """)
+            results = await db_manager.execute_prepared('article_stats')
             
             stats = {
                 'total': 0,
@@ -290,12 +1384,393 @@ class ArticleOperations:
                 stats[row['status']] = row['count']
                 stats['total'] += row['count']
             
+            stats_cache.set(stats)
             return stats
             
         except Exception as e:
             logger.error(f"Failed to get article stats: {e}")
             raise ValueError(f"Stats retrieval failed: {str(e)}")
     
+    @staticmethod
+    async def upsert_embeddings(embeddings: Dict[str, List[float]]) -> int:
+        """
+        Store content embeddings for many articles in one statement
+        embeddings maps article id -> vector(1536) values. Returns rows updated.
+        """
+        if not embeddings:
+            return 0
+        
+        try:
+            ids = [uuid.UUID(str(article_id)) for article_id in embeddings]
+            vectors = [_vector_literal(values) for values in embeddings.values()]
+            
+            updated = await db_manager.execute_prepared('upsert_embeddings', ids, vectors)
+            
+            search_cache.invalidate()
+            return updated
+            
+        except Exception as e:
+            logger.error(f"Failed to upsert {len(embeddings)} embeddings: {e}")
+            raise ValueError(f"Embedding upsert failed: {str(e)}")
+    
+    @staticmethod
+    async def list_articles_missing_embeddings(
+        limit: int = 100,
+        after_id: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Articles without an embedding, in id order so a backfill can page through them"""
+        try:
+            after = uuid.UUID(after_id) if after_id else uuid.UUID(int=0)
+            # Read from the primary so rows embedded moments ago are not handed out again
+            results = await db_manager.execute_prepared(
+                'articles_missing_embeddings', after, limit, use_primary=True
+            )
+            return [dict(row) for row in results]
+            
+        except Exception as e:
+            logger.error(f"Failed to list articles missing embeddings: {e}")
+            raise ValueError(f"Embedding listing failed: {str(e)}")
+    
+    @staticmethod
+    async def find_similar(
+        article_id: str,
+        k: int = 10,
+        status_filter: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Nearest neighbours of an article by cosine similarity of content embeddings"""
+        try:
+            result = await db_manager.execute_prepared('article_embedding', uuid.UUID(article_id))
+            if not result or result[0]['embedding'] is None:
+                return []
+            
+            return await ArticleOperations.find_similar_to_embedding(
+                result[0]['embedding'], k=k, status_filter=status_filter, exclude_id=article_id
+            )
+            
+        except Exception as e:
+            logger.error(f"Similarity search failed for article {article_id}: {e}")
+            raise ValueError(f"Similarity search failed: {str(e)}")
+    
+    @staticmethod
+    async def find_similar_to_embedding(
+        embedding: Any,
+        k: int = 10,
+        status_filter: Optional[str] = None,
+        exclude_id: Optional[str] = None,
+        projection: str = 'card'
+    ) -> List[Dict[str, Any]]:
+        """
+        Nearest neighbours of an embedding (list of floats or pgvector text)
+        ORDER BY distance to a bound parameter so the HNSW index drives the scan.
+        """
+        try:
+            vector = embedding if isinstance(embedding, str) else _vector_literal(embedding)
+            params: List[Any] = [vector]
+            conditions = ["content_embedding IS NOT NULL"]
+            
+            if exclude_id:
+                params.append(uuid.UUID(str(exclude_id)))
+                conditions.append(f"id <> ${len(params)}")
+            if status_filter:
+                params.append(status_filter)
+                conditions.append(f"status = ${len(params)}")
+            params.append(k)
+            
+            query = f"""
+                SELECT 
+                    {_projection_columns(projection)},
+                    1 - (content_embedding <=> $1::vector) AS similarity
+                FROM articles
+                WHERE {' AND '.join(conditions)}
+                ORDER BY content_embedding <=> $1::vector
+                LIMIT ${len(params)}
+            """
+            
+            results = await db_manager.execute_query(query, *params)
+            return [dict(row) for row in results]
+            
+        except Exception as e:
+            logger.error(f"Embedding similarity search failed: {e}")
+            raise ValueError(f"Similarity search failed: {str(e)}")
+    
+    @staticmethod
+    async def hybrid_search(
+        query: str,
+        query_embedding: List[float],
+        limit: int = 10,
+        status_filter: Optional[str] = None,
+        candidates: int = 50,
+        rrf_k: int = 60
+    ) -> List[Dict[str, Any]]:
+        """
+        Lexical + vector search fused with reciprocal-rank fusion
+        Both candidate queries run concurrently on separate pooled connections.
+        Each result carries rrf_score plus per-source rank and score (None when absent).
+        """
+        try:
+            lexical, semantic = await asyncio.gather(
+                ArticleOperations.search_articles_bm25(query, limit=candidates, status_filter=status_filter),
+                ArticleOperations.find_similar_to_embedding(query_embedding, k=candidates, status_filter=status_filter)
+            )
+            
+            fused: Dict[str, Dict[str, Any]] = {}
+            
+            def merge(rows: List[Dict[str, Any]], source: str, score_column: str):
+                for position, row in enumerate(rows, start=1):
+                    article = dict(row)
+                    score = article.pop(score_column)
+                    entry = fused.setdefault(str(article['id']), {
+                        **article,
+                        'snippet': None,
+                        'rrf_score': 0.0,
+                        'lexical_rank': None,
+                        'lexical_score': None,
+                        'vector_rank': None,
+                        'vector_score': None
+                    })
+                    entry.update({k: v for k, v in article.items() if v is not None})
+                    entry[f'{source}_rank'] = position
+                    entry[f'{source}_score'] = score
+                    entry['rrf_score'] += 1.0 / (rrf_k + position)
+            
+            merge(lexical, 'lexical', 'rank')
+            merge(semantic, 'vector', 'similarity')
+            
+            results = sorted(fused.values(), key=lambda entry: entry['rrf_score'], reverse=True)
+            return results[:limit]
+            
+        except Exception as e:
+            logger.error(f"Hybrid search failed for query '{query}': {e}")
+            raise ValueError(f"Hybrid search failed: {str(e)}")
+    
+    @staticmethod
+    async def get_published_article(article_id: str, use_primary: bool = False) -> Optional[Dict[str, Any]]:
+        """Published article by id in the public projection (None if missing or unpublished)"""
+        try:
+            result = await db_manager.execute_prepared(
+                'get_published_article', uuid.UUID(article_id), use_primary=use_primary
+            )
+            return dict(result[0]) if result else None
+            
+        except Exception as e:
+            logger.error(f"Failed to get published article {article_id}: {e}")
+            raise ValueError(f"Article retrieval failed: {str(e)}")
+    
+    @staticmethod
+    async def get_published_article_version(article_id: str) -> Optional[datetime]:
+        """updated_at of a published article, without reading its content"""
+        try:
+            result = await db_manager.execute_prepared('published_article_version', uuid.UUID(article_id))
+            return result[0]['updated_at'] if result else None
+            
+        except Exception as e:
+            logger.error(f"Failed to get version of article {article_id}: {e}")
+            raise ValueError(f"Article version lookup failed: {str(e)}")
+    
+    @staticmethod
+    async def get_published_collection_version() -> Dict[str, Any]:
+        """
+        Newest published updated_at and the published count
+        Together they change whenever a published article is edited, added or removed.
+        """
+        try:
+            result = await db_manager.execute_prepared('published_collection_version')
+            return dict(result[0])
+            
+        except Exception as e:
+            logger.error(f"Failed to get published collection version: {e}")
+            raise ValueError(f"Collection version lookup failed: {str(e)}")
+    
+    @staticmethod
+    async def stream_published_articles(
+        updated_since: Optional[datetime] = None,
+        chunk_size: int = 1000,
+        projection: str = 'public',
+        with_html_hash: bool = False
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Published articles in (updated_at, id) order, yielded chunk by chunk
+        Uses a server-side cursor inside a read-only REPEATABLE READ transaction on the
+        replica, so memory stays at one chunk and the export sees a single snapshot.
+        with_html_hash adds content_html_hash so callers can spot stale renders.
+        """
+        query = f"""
+            SELECT {_projection_columns(projection)}{', content_html_hash' if with_html_hash else ''}
+            FROM articles
+            WHERE status = 'published'
+              AND updated_at > $1
+            ORDER BY updated_at, id
+        """
+        since = updated_since or datetime.min.replace(tzinfo=timezone.utc)
+        
+        try:
+            async with db_manager.acquire(read_only=True) as conn:
+                async with conn.transaction(isolation='repeatable_read', readonly=True):
+                    cursor = await conn.cursor(query, since)
+                    while True:
+                        db_manager.record_query(read_only=True)
+                        rows = await cursor.fetch(chunk_size)
+                        if not rows:
+                            break
+                        yield [dict(row) for row in rows]
+                        
+        except Exception as e:
+            logger.error(f"Failed to stream published articles: {e}")
+            raise ValueError(f"Article export failed: {str(e)}")
+    
+    @staticmethod
+    async def list_article_tombstones(removed_since: datetime) -> List[Dict[str, Any]]:
+        """Published articles unpublished or deleted after removed_since, oldest first"""
+        try:
+            results = await db_manager.execute_prepared('article_tombstones_since', removed_since)
+            return [dict(row) for row in results]
+            
+        except Exception as e:
+            logger.error(f"Failed to list article tombstones: {e}")
+            raise ValueError(f"Article tombstone listing failed: {str(e)}")
+    
+    @staticmethod
+    async def get_related_articles(article_id: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """Precomputed related articles - a single indexed lookup on related_articles"""
+        try:
+            results = await db_manager.execute_prepared('related_articles', uuid.UUID(article_id), limit)
+            return [dict(row) for row in results]
+            
+        except Exception as e:
+            logger.error(f"Failed to get related articles for {article_id}: {e}")
+            raise ValueError(f"Related articles retrieval failed: {str(e)}")
+    
+    @staticmethod
+    async def list_changed_articles(
+        since: datetime,
+        after_id: Optional[str] = None,
+        limit: int = 500
+    ) -> List[Dict[str, Any]]:
+        """Articles whose content or embedding changed after (since, after_id), oldest first, for incremental jobs"""
+        try:
+            after = uuid.UUID(after_id) if after_id else uuid.UUID(int=0)
+            results = await db_manager.execute_prepared(
+                'changed_articles', since, after, limit, use_primary=True
+            )
+            return [dict(row) for row in results]
+            
+        except Exception as e:
+            logger.error(f"Failed to list changed articles: {e}")
+            raise ValueError(f"Changed article listing failed: {str(e)}")
+    
+    @staticmethod
+    async def list_articles_citing_related(article_ids: List[str]) -> List[str]:
+        """Articles whose stored related list includes any of article_ids"""
+        try:
+            ids = [uuid.UUID(str(article_id)) for article_id in article_ids]
+            results = await db_manager.execute_prepared('articles_citing_related', ids, use_primary=True)
+            return [str(row['article_id']) for row in results]
+            
+        except Exception as e:
+            logger.error(f"Failed to list articles citing {len(article_ids)} related articles: {e}")
+            raise ValueError(f"Related article lookup failed: {str(e)}")
+    
+    @staticmethod
+    async def list_articles_entered_by(article_ids: List[str], neighbours: int = 10, candidates: int = 40) -> List[str]:
+        """
+        Articles whose top-`neighbours` list one of article_ids should now enter
+        Checked among each article's `candidates` nearest neighbours (similarity is
+        symmetric), so a newly published or re-embedded article reaches existing lists.
+        """
+        try:
+            ids = [uuid.UUID(str(article_id)) for article_id in article_ids]
+            results = await db_manager.execute_prepared(
+                'articles_entered_by', ids, candidates, neighbours, use_primary=True
+            )
+            return [str(row['id']) for row in results]
+            
+        except Exception as e:
+            logger.error(f"Failed to list reverse neighbours of {len(article_ids)} articles: {e}")
+            raise ValueError(f"Related article lookup failed: {str(e)}")
+    
+    @staticmethod
+    async def refresh_related_articles(article_ids: List[str], neighbours: int = 10) -> None:
+        """Recompute the top-N published neighbours for a batch of articles in one transaction"""
+        try:
+            ids = [uuid.UUID(str(article_id)) for article_id in article_ids]
+            await db_manager.execute_transaction([
+                (db_manager.statements['clear_related_articles'][0], [ids]),
+                (db_manager.statements['compute_related_articles'][0], [ids, neighbours])
+            ])
+            
+        except Exception as e:
+            logger.error(f"Failed to refresh related articles for {len(article_ids)} articles: {e}")
+            raise ValueError(f"Related articles refresh failed: {str(e)}")
+    
+    @staticmethod
+    async def list_articles_needing_ai_review(
+        status: Optional[str] = 'published',
+        after_id: Optional[str] = None,
+        limit: int = 500,
+        attributes: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Articles missing SEO fields or a quality score, in id order, excluding in-flight batches
+        Each row says which is missing (needs_seo / needs_quality). attributes narrows the selection by JSONB containment (e.g. {'category': 'visas'}).
+        """
+        try:
+            after = uuid.UUID(after_id) if after_id else uuid.UUID(int=0)
+            results = await db_manager.execute_prepared(
+                'articles_needing_ai_review', status, after, limit, attributes, use_primary=True
+            )
+            return [dict(row) for row in results]
+            
+        except Exception as e:
+            logger.error(f"Failed to list articles needing AI review: {e}")
+            raise ValueError(f"AI review listing failed: {str(e)}")
+    
+    @staticmethod
+    async def bulk_apply_ai_review(updates: Dict[str, Dict[str, Any]]) -> int:
+        """
+        Write AI review results for many articles in one statement
+        updates maps article id -> {'fill': {...}, 'quality_score': float|None, 'quality_issues': list|None}.
+        fill attributes only replace missing/empty values; score and issues only fill a missing score.
+        """
+        if not updates:
+            return 0
+        
+        try:
+            ids = [uuid.UUID(str(article_id)) for article_id in updates]
+            fills = [update.get('fill') or {} for update in updates.values()]
+            issues = [update.get('quality_issues') for update in updates.values()]
+            scores = [update.get('quality_score') for update in updates.values()]
+            
+            updated = await db_manager.execute_prepared('apply_ai_review', ids, fills, issues, scores)
+            
+            search_cache.invalidate()
+            for article_id in updates:
+                article_cache.invalidate(str(article_id))
+            return updated
+            
+        except Exception as e:
+            logger.error(f"Failed to apply AI review for {len(updates)} articles: {e}")
+            raise ValueError(f"AI review update failed: {str(e)}")
+    
+    @staticmethod
+    async def check_article_counts(repair: bool = False) -> List[Dict[str, Any]]:
+        """
+        Compare trigger-maintained article_counts with a full recount
+        Returns the drifted statuses; repair=True rebuilds the counts under a table lock.
+        """
+        try:
+            if repair:
+                # rebuild_article_counts() writes, so it must run on the primary
+                results = await db_manager.execute_prepared('rebuild_article_counts', use_primary=True)
+                stats_cache.invalidate()
+            else:
+                results = await db_manager.execute_prepared('article_count_drift', use_primary=True)
+            
+            return [dict(row) for row in results]
+            
+        except Exception as e:
+            logger.error(f"Article count consistency check failed: {e}")
+            raise ValueError(f"Article count check failed: {str(e)}")
+    
     @staticmethod
     async def mark_ai_generated(
         article_id: str,
@@ -308,29 +1783,14 @@ class ArticleOperations:
             params = [True, ai_model, generation_prompt, uuid.UUID(article_id)]
             
             if quality_score is not None:
-                query = """
-                    UPDATE articles 
-                    SET 
-                        ai_generated = $1,
-                        ai_model = $2,
-                        generation_prompt = $3,
-                        quality_score = $5
-                    WHERE id = $4
-                    RETURNING id
-                """
-                params.insert(4, quality_score)
+                params.append(quality_score)
+                result = await db_manager.execute_prepared('mark_ai_generated_with_score', *params)
             else:
-                query = """
-                    UPDATE articles 
-                    SET 
-                        ai_generated = $1,
-                        ai_model = $2,
-                        generation_prompt = $3
-                    WHERE id = $4
-                    RETURNING id
-                """
+                result = await db_manager.execute_prepared('mark_ai_generated', *params)
             
-            result = await db_manager.execute_query(query, *params)
+            if result is not None:
+                search_cache.invalidate()
+                article_cache.invalidate(article_id)
             return result is not None
             
         except Exception as e:
@@ -0,0 +1 @@
+# Content export module
@@ -0,0 +1,176 @@
+"""
+Published article export for Quest-CMS
+Streams published articles to NDJSON or Parquet in constant memory
+"""
+import time
+import asyncio
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import Optional, Dict, Any, List, BinaryIO
+import logging
+
+from ..database.operations import ArticleOperations, ARTICLE_PROJECTIONS
+from ..utils.serialization import json_dumps, json_dumps_bytes
+from ..utils.rendering import content_hash, render_markdown
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pyarrow is only needed for Parquet exports
+    pa = None
+    pq = None
+
+logger = logging.getLogger(__name__)
+
+EXPORT_PROJECTION = 'public'
+
+# Incremental exports re-scan this far behind --updated-since: updated_at is the writing
+# transaction's start time, so a row can commit after an export with an earlier timestamp
+WATERMARK_OVERLAP = timedelta(minutes=5)
+
+
+def _fill_html(rows: List[Dict[str, Any]]) -> None:
+    """Render rows whose stored HTML is missing (COPY-loaded) or stale, as the public API does"""
+    for row in rows:
+        html_hash = row.pop('content_html_hash', None)
+        if row['content_html'] is None or html_hash != content_hash(row['content']):
+            row['content_html'] = render_markdown(row['content'])
+
+
+def _tombstone_row(tombstone: Dict[str, Any]) -> Dict[str, Any]:
+    """Export row for an unpublished/deleted article: id, removal time as updated_at, deleted=true"""
+    row = {column: None for column in ARTICLE_PROJECTIONS[EXPORT_PROJECTION]}
+    row.update(id=tombstone['article_id'], updated_at=tombstone['removed_at'], deleted=True)
+    return row
+
+
+class NDJSONExportWriter:
+    """One JSON object per line; each chunk is encoded and written in a single call"""
+
+    def __init__(self, output: BinaryIO):
+        self.output = output
+
+    def write_chunk(self, rows: List[Dict[str, Any]]):
+        self.output.write(b''.join(json_dumps_bytes(row) + b'\n' for row in rows))
+
+    def close(self):
+        self.output.flush()
+
+
+class ParquetExportWriter:
+    """
+    One Parquet row group per chunk; attributes are stored as a JSON string column
+    The schema mirrors the 'public' projection in ARTICLE_PROJECTIONS, plus `deleted` for tombstones.
+    """
+
+    def __init__(self, output: BinaryIO):
+        if pa is None:
+            raise ValueError("Parquet export requires pyarrow (pip install pyarrow)")
+        timestamp = pa.timestamp('us', tz='UTC')
+        self.schema = pa.schema([
+            ('id', pa.string()),
+            ('title', pa.string()),
+            ('content', pa.string()),
+            ('content_html', pa.string()),
+            ('attributes', pa.string()),
+            ('created_at', timestamp),
+            ('updated_at', timestamp),
+            ('published_at', timestamp),
+            ('ai_generated', pa.bool_()),
+            ('ai_model', pa.string()),
+            ('quality_score', pa.float64()),
+            ('deleted', pa.bool_()),
+        ])
+        self.writer = pq.ParquetWriter(output, self.schema, compression='zstd')
+
+    def write_chunk(self, rows: List[Dict[str, Any]]):
+        columns = {
+            'id': [str(row['id']) for row in rows],
+            'title': [row['title'] for row in rows],
+            'content': [row['content'] for row in rows],
+            'content_html': [row['content_html'] for row in rows],
+            'attributes': [json_dumps(row['attributes']) if row['attributes'] is not None else None for row in rows],
+            'created_at': [row['created_at'] for row in rows],
+            'updated_at': [row['updated_at'] for row in rows],
+            'published_at': [row['published_at'] for row in rows],
+            'ai_generated': [row['ai_generated'] for row in rows],
+            'ai_model': [row['ai_model'] for row in rows],
+            'quality_score': [
+                float(row['quality_score']) if isinstance(row['quality_score'], Decimal) else row['quality_score']
+                for row in rows
+            ],
+            'deleted': [bool(row.get('deleted')) for row in rows],
+        }
+        self.writer.write_table(pa.Table.from_pydict(columns, schema=self.schema))
+
+    def close(self):
+        self.writer.close()
+
+
+EXPORT_FORMATS = {
+    'ndjson': NDJSONExportWriter,
+    'parquet': ParquetExportWriter,
+}
+
+async def export_published_articles(
+    output: BinaryIO,
+    export_format: str = 'ndjson',
+    updated_since: Optional[datetime] = None,
+    chunk_size: int = 1000
+) -> Dict[str, Any]:
+    """
+    Write every published article (changed after updated_since) to output
+    Returns row counts and the newest updated_at seen - pass it back as
+    updated_since on the next run for an incremental sync.
+    
+    Incremental exports re-scan WATERMARK_OVERLAP behind updated_since, so an
+    article can appear in two consecutive syncs: consumers upsert by id. They also
+    end with tombstones - {'id', 'updated_at': removal time, 'deleted': true} - for
+    articles unpublished or deleted since then; consumers drop those ids.
+    """
+    try:
+        writer = EXPORT_FORMATS[export_format](output)
+    except KeyError:
+        raise ValueError(f"Unknown export format '{export_format}' (expected one of {', '.join(EXPORT_FORMATS)})")
+
+    rows_written = 0
+    tombstones = 0
+    chunks = 0
+    watermark = updated_since
+    scan_from = updated_since - WATERMARK_OVERLAP if updated_since else None
+    started = time.perf_counter()
+
+    try:
+        async for rows in ArticleOperations.stream_published_articles(
+            updated_since=scan_from, chunk_size=chunk_size, projection=EXPORT_PROJECTION, with_html_hash=True
+        ):
+            await asyncio.to_thread(_fill_html, rows)
+            writer.write_chunk(rows)
+            rows_written += len(rows)
+            chunks += 1
+            watermark = max(watermark, rows[-1]['updated_at']) if watermark else rows[-1]['updated_at']
+
+        # A full export only contains live articles, so removals matter to incremental syncs only
+        if scan_from is not None:
+            removed = [_tombstone_row(tombstone) for tombstone in await ArticleOperations.list_article_tombstones(scan_from)]
+            for start in range(0, len(removed), chunk_size):
+                writer.write_chunk(removed[start:start + chunk_size])
+                chunks += 1
+            if removed:
+                tombstones = len(removed)
+                watermark = max(watermark, removed[-1]['updated_at'])
+    finally:
+        writer.close()
+
+    elapsed = time.perf_counter() - started
+    result = {
+        'format': export_format,
+        'rows': rows_written,
+        'tombstones': tombstones,
+        'chunks': chunks,
+        'watermark': watermark.isoformat() if watermark else None,
+        'elapsed_seconds': round(elapsed, 2),
+        'rows_per_second': round(rows_written / elapsed) if elapsed > 0 else None
+    }
+    logger.info(f"Article export finished: {result}")
+    return result
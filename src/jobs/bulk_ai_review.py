@@ -0,0 +1,144 @@
+"""
+Bulk AI review job for Quest-CMS
+SEO metadata and quality scores for the back catalogue through the Message Batches API
+"""
+import asyncio
+import time
+from typing import Optional, Dict, Any
+import logging
+
+from ..database.connection import db_manager
+from ..database.operations import AIBatchOperations, ArticleOperations
+from ..ai_services.claude import claude_service, BULK_SEO, BULK_QUALITY
+
+logger = logging.getLogger(__name__)
+
+JOB_NAME = 'bulk_ai_review'
+
+# Articles per write-back statement
+APPLY_CHUNK_SIZE = 500
+
+
+class BulkAIReview:
+    """
+    Back-catalogue SEO metadata and quality scoring as message batches
+    Articles missing seo_title/seo_description or a quality score are submitted
+    batch_size at a time, with a request only for what each is missing. Every submitted batch is recorded in
+    ai_batches before polling starts, so a restarted run picks up batches that were
+    still processing or had ended but were not yet written back. Write-back is
+    idempotent: SEO fields only fill empty values, and a score (with its issues) is
+    only written for articles that had none and got a parseable reply.
+    """
+
+    def __init__(
+        self,
+        batch_size: int = 500,
+        poll_interval: float = 60.0,
+        status: Optional[str] = 'published',
+        attributes: Optional[Dict[str, Any]] = None
+    ):
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.status = status
+        self.attributes = attributes
+
+    async def run(self, max_batches: Optional[int] = None, wait: bool = True) -> Dict[str, Any]:
+        """Submit batches for everything still missing, then collect all pending batches"""
+        async with db_manager.advisory_lock(JOB_NAME) as locked:
+            if not locked:
+                logger.info("Bulk AI review already running elsewhere - skipping")
+                return {'skipped': True}
+
+            started = time.perf_counter()
+            result = {'submitted_batches': 0, 'submitted_articles': 0}
+            await self._submit(max_batches, result)
+            if wait:
+                result.update(await self.collect())
+            result['elapsed_seconds'] = round(time.perf_counter() - started, 2)
+            logger.info(f"Bulk AI review finished: {result}")
+            return result
+
+    async def _submit(self, max_batches: Optional[int], result: Dict[str, Any]):
+        after_id: Optional[str] = None
+        while max_batches is None or result['submitted_batches'] < max_batches:
+            articles = await ArticleOperations.list_articles_needing_ai_review(
+                status=self.status, after_id=after_id, limit=self.batch_size, attributes=self.attributes
+            )
+            if not articles:
+                break
+            after_id = str(articles[-1]['id'])
+
+            requests = [request for article in articles for request in claude_service.bulk_review_requests(article)]
+            batch = await claude_service.submit_message_batch(requests)
+            await AIBatchOperations.record_submitted(
+                batch['id'], [str(article['id']) for article in articles], len(requests)
+            )
+            result['submitted_batches'] += 1
+            result['submitted_articles'] += len(articles)
+
+    async def collect(self) -> Dict[str, Any]:
+        """Poll every unapplied batch (including ones from earlier runs) and write back as each ends"""
+        collected = {'applied_batches': 0, 'updated_articles': 0, 'errored_requests': 0}
+        while True:
+            pending = await AIBatchOperations.list_pending()
+            if not pending:
+                return collected
+
+            progressed = False
+            for batch in pending:
+                if batch['status'] == 'submitted':
+                    status = await claude_service.get_message_batch(batch['id'])
+                    if status['processing_status'] != 'ended':
+                        continue
+                    await AIBatchOperations.set_status(batch['id'], 'ended', status['request_counts'])
+
+                applied = await self._apply(batch['id'])
+                collected['applied_batches'] += 1
+                collected['updated_articles'] += applied['updated_articles']
+                collected['errored_requests'] += applied['errored_requests']
+                progressed = True
+
+            if not progressed:
+                logger.info(f"Waiting on {len(pending)} message batches")
+                await asyncio.sleep(self.poll_interval)
+
+    async def _apply(self, batch_id: str) -> Dict[str, int]:
+        """Stream an ended batch's results into bulk article updates"""
+        updates: Dict[str, Dict[str, Any]] = {}
+        updated_articles = 0
+        errored = 0
+
+        async for entry in claude_service.message_batch_results(batch_id):
+            kind, _, article_id = entry['custom_id'].partition('-')
+            if entry['text'] is None:
+                errored += 1
+                logger.warning(f"Batch {batch_id} request {entry['custom_id']} failed: {entry['error']}")
+                continue
+
+            update = updates.setdefault(article_id, {'fill': {}, 'quality_score': None, 'quality_issues': None})
+            if kind == BULK_SEO:
+                seo = claude_service.parse_seo_metadata(entry['text'])
+                update['fill'].update({
+                    key: value for key, value in (
+                        ('seo_title', seo.get('seo_title')),
+                        ('seo_description', seo.get('meta_description')),
+                        ('tags', seo.get('keywords'))
+                    ) if value
+                })
+            elif kind == BULK_QUALITY:
+                quality = claude_service.parse_quality_response(entry['text'])
+                # 0 means no SCORE line; leave the score empty so the next run asks again
+                if quality['quality_score'] > 0:
+                    update['quality_score'] = min(quality['quality_score'], 10)
+                    update['quality_issues'] = quality['issues']
+                else:
+                    logger.warning(f"Batch {batch_id} request {entry['custom_id']}: unparseable quality reply")
+
+            if len(updates) >= APPLY_CHUNK_SIZE:
+                updated_articles += await ArticleOperations.bulk_apply_ai_review(updates)
+                updates = {}
+
+        updated_articles += await ArticleOperations.bulk_apply_ai_review(updates)
+        await AIBatchOperations.set_status(batch_id, 'applied')
+        logger.info(f"Applied message batch {batch_id}: {updated_articles} articles updated, {errored} requests failed")
+        return {'updated_articles': updated_articles, 'errored_requests': errored}
@@ -0,0 +1,64 @@
+"""
+Embedding backfill worker for Quest-CMS
+Computes content embeddings in batches for articles that have none
+"""
+import time
+from typing import Optional, Dict, Any
+import logging
+
+from ..database.operations import ArticleOperations
+from ..ai_services.embeddings import EmbeddingProvider, get_embedding_provider, article_embedding_text
+
+logger = logging.getLogger(__name__)
+
+class EmbeddingBackfill:
+    """
+    Resumable embedding backfill
+    Progress lives in the database (content_embedding IS NULL), so an interrupted
+    run simply picks up where it stopped; edits clear the embedding and re-queue it.
+    """
+
+    def __init__(self, provider: Optional[EmbeddingProvider] = None, batch_size: int = 100):
+        self.provider = provider or get_embedding_provider()
+        self.batch_size = batch_size
+
+    async def run(self, max_batches: Optional[int] = None) -> Dict[str, Any]:
+        """Embed articles batch by batch until none are missing (or max_batches is reached)"""
+        embedded = 0
+        failed_batches = 0
+        batches = 0
+        last_id: Optional[str] = None
+        started = time.perf_counter()
+
+        while max_batches is None or batches < max_batches:
+            articles = await ArticleOperations.list_articles_missing_embeddings(
+                limit=self.batch_size, after_id=last_id
+            )
+            if not articles:
+                break
+
+            batches += 1
+            # Advance past this batch even if it fails, so one bad batch can't stall the run
+            last_id = str(articles[-1]['id'])
+
+            try:
+                texts = [article_embedding_text(a['title'], a['content']) for a in articles]
+                vectors = await self.provider.embed(texts)
+                embedded += await ArticleOperations.upsert_embeddings(
+                    {str(a['id']): vector for a, vector in zip(articles, vectors)}
+                )
+                logger.info(f"Embedding backfill batch {batches}: {embedded} articles embedded so far")
+
+            except Exception as e:
+                failed_batches += 1
+                logger.error(f"Embedding backfill batch {batches} failed (ids up to {last_id}): {e}")
+
+        result = {
+            'embedded': embedded,
+            'batches': batches,
+            'failed_batches': failed_batches,
+            'provider': self.provider.name,
+            'elapsed_seconds': round(time.perf_counter() - started, 2)
+        }
+        logger.info(f"Embedding backfill finished: {result}")
+        return result
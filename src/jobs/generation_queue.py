@@ -0,0 +1,232 @@
+"""
+Batch article generation workers for Quest-CMS
+Drains the generation_jobs queue: Claude generation -> featured image -> article creation
+"""
+import asyncio
+import os
+import random
+import socket
+from typing import Optional, Dict, Any
+import logging
+
+from ..database.connection import db_manager
+from ..database.operations import ArticleOperations, GenerationJobOperations
+from ..ai_services.claude import claude_service
+from ..ai_services.replicate_service import replicate_service
+
+logger = logging.getLogger(__name__)
+
+
+class LeaseLost(Exception):
+    """The job was requeued by another process (lease expired) while we were working on it"""
+
+
+class GenerationWorkerPool:
+    """
+    Async worker pool over the Postgres generation queue
+    Jobs are claimed with FOR UPDATE SKIP LOCKED, so any number of pools - in the
+    app and in `manage.py generation-workers` processes - can drain the same queue.
+    Each completed pipeline step is checkpointed on the job, so a retry resumes
+    after the last step that succeeded instead of paying for generation twice.
+    Running jobs heartbeat their lease; jobs of a crashed process are requeued
+    once the lease expires.
+    """
+
+    def __init__(
+        self,
+        workers: int = 2,
+        poll_interval: float = 10.0,
+        lease_seconds: float = 900.0,
+        retry_base_delay: float = 30.0,
+        retry_max_delay: float = 1800.0
+    ):
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        self.workers = workers
+        self.poll_interval = poll_interval
+        self.lease_seconds = lease_seconds
+        self.retry_base_delay = retry_base_delay
+        self.retry_max_delay = retry_max_delay
+        self.process_id = f"{socket.gethostname()}:{os.getpid()}"
+        self.processed = {'succeeded': 0, 'retried': 0, 'failed': 0}
+        self._wakeup = asyncio.Event()
+
+    @classmethod
+    def from_env(cls, workers: Optional[int] = None) -> 'GenerationWorkerPool':
+        """Pool configured from GENERATION_* environment variables"""
+        return cls(
+            workers=workers or max(1, int(os.getenv("GENERATION_WORKERS", 2))),
+            poll_interval=float(os.getenv("GENERATION_POLL_INTERVAL", 10)),
+            lease_seconds=float(os.getenv("GENERATION_LEASE_SECONDS", 900)),
+            retry_base_delay=float(os.getenv("GENERATION_RETRY_BASE_DELAY", 30)),
+            retry_max_delay=float(os.getenv("GENERATION_RETRY_MAX_DELAY", 1800))
+        )
+
+    async def run_forever(self):
+        """Run the workers and the stale-lease reaper until cancelled"""
+        await db_manager.listen(GenerationJobOperations.NOTIFY_CHANNEL, self._on_notification)
+        logger.info(f"Generation worker pool {self.process_id} started with {self.workers} workers")
+        await asyncio.gather(
+            self._reap_stale_jobs(),
+            *(self._worker(f"{self.process_id}/{index}", drain=False) for index in range(self.workers))
+        )
+
+    async def drain(self) -> Dict[str, int]:
+        """Process runnable jobs until the queue is empty, then return counts"""
+        await GenerationJobOperations.requeue_stale(self.lease_seconds)
+        await asyncio.gather(
+            *(self._worker(f"{self.process_id}/{index}", drain=True) for index in range(self.workers))
+        )
+        return dict(self.processed)
+
+    def _on_notification(self, payload: str):
+        self._wakeup.set()
+
+    async def _worker(self, worker_id: str, drain: bool):
+        while True:
+            try:
+                job = await GenerationJobOperations.claim(worker_id)
+                if job is None:
+                    if drain:
+                        return
+                    await self._wait_for_work()
+                    continue
+
+                await self.process(job, worker_id)
+
+            except ValueError as e:
+                # Database trouble: back off; jobs we could not settle are requeued by the reaper
+                if drain:
+                    raise
+                logger.error(f"Generation worker {worker_id} error: {e}")
+                await asyncio.sleep(self.poll_interval)
+
+    async def _wait_for_work(self):
+        """Sleep until a NOTIFY for new jobs or the poll interval (delayed retries become due)"""
+        self._wakeup.clear()
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), self.poll_interval)
+        except asyncio.TimeoutError:
+            pass
+
+    async def _reap_stale_jobs(self):
+        while True:
+            try:
+                requeued = await GenerationJobOperations.requeue_stale(self.lease_seconds)
+                if requeued:
+                    logger.warning(f"Requeued {requeued} generation jobs with expired leases")
+            except ValueError as e:
+                logger.error(f"Stale generation job check failed: {e}")
+            await asyncio.sleep(self.lease_seconds / 3)
+
+    async def _heartbeat(self, job_id: str, worker_id: str):
+        while True:
+            await asyncio.sleep(self.lease_seconds / 3)
+            try:
+                if not await GenerationJobOperations.heartbeat(job_id, worker_id):
+                    logger.warning(f"Generation job {job_id} lease lost")
+                    return
+            except ValueError:
+                pass
+
+    def retry_delay(self, attempts: int) -> float:
+        """Exponential backoff (base * 2^(attempt-1), capped) with jitter over its upper half"""
+        ceiling = min(self.retry_max_delay, self.retry_base_delay * 2 ** max(0, attempts - 1))
+        return random.uniform(ceiling / 2, ceiling)
+
+    async def process(self, job: Dict[str, Any], worker_id: str):
+        """Run one claimed job through the pipeline and record the outcome"""
+        job_id = str(job['id'])
+        heartbeat = asyncio.create_task(self._heartbeat(job_id, worker_id))
+        try:
+            article_id = await self._run_pipeline(job, worker_id)
+            if not await GenerationJobOperations.complete(job_id, article_id, worker_id):
+                raise LeaseLost(job_id)
+            self.processed['succeeded'] += 1
+            logger.info(f"Generation job {job_id} ('{job['topic']}') created article {article_id}")
+
+        except asyncio.CancelledError:
+            await GenerationJobOperations.release(job_id, worker_id)
+            raise
+
+        except LeaseLost:
+            logger.warning(f"Generation job {job_id} was taken over after its lease expired - abandoning")
+
+        except Exception as e:
+            delay = self.retry_delay(job['attempts'])
+            status = await GenerationJobOperations.retry(job_id, str(e), delay, worker_id)
+            if status == 'failed':
+                self.processed['failed'] += 1
+                logger.error(f"Generation job {job_id} failed permanently after {job['attempts']} attempts: {e}")
+            else:
+                self.processed['retried'] += 1
+                logger.warning(f"Generation job {job_id} attempt {job['attempts']} failed, retrying in {delay:.0f}s: {e}")
+
+        finally:
+            heartbeat.cancel()
+
+    async def _run_pipeline(self, job: Dict[str, Any], worker_id: str) -> str:
+        """generate -> image -> create, skipping steps already checkpointed by earlier attempts"""
+        job_id = str(job['id'])
+        options = job['options'] or {}
+        checkpoint = dict(job['checkpoint'] or {})
+
+        async def save(step: str):
+            if not await GenerationJobOperations.checkpoint(job_id, step, checkpoint, worker_id):
+                raise LeaseLost(job_id)
+
+        if 'article' not in checkpoint:
+            checkpoint['article'] = await claude_service.generate_article_content(
+                job['topic'],
+                job['target_audience'],
+                word_count=options.get('word_count', 1000),
+                additional_requirements=options.get('additional_requirements')
+            )
+            await save('generated')
+        article = checkpoint['article']
+
+        if options.get('generate_image', True) and 'image' not in checkpoint:
+            checkpoint['image'] = await replicate_service.generate_featured_image(
+                title=article['title'],
+                content_preview=article['content'][:200],
+                style=options.get('image_style', 'professional'),
+                use_pro_model=options.get('use_pro_model', False)
+            )
+            await save('image')
+
+        if 'article_id' not in checkpoint:
+            # Idempotent on the job id, so a crash or lost lease before this checkpoint cannot duplicate the article
+            checkpoint['article_id'] = await ArticleOperations.create_generated_article(
+                job_id,
+                title=article['title'],
+                content=self._article_body(article, checkpoint.get('image')),
+                attributes=self._article_attributes(job, article, checkpoint.get('image')),
+                status=options.get('status', 'review'),
+                ai_model=article['model_used'],
+                generation_prompt=f"Topic: {job['topic']} | Audience: {job['target_audience']}",
+                quality_score=article.get('quality_score'),
+                quality_issues=article.get('quality_issues') or None
+            )
+            await save('created')
+
+        return checkpoint['article_id']
+
+    @staticmethod
+    def _article_body(article: Dict[str, Any], image: Optional[Dict[str, Any]]) -> str:
+        if image and image.get('image_url'):
+            return f"![Featured Image]({image['image_url']})\n\n{article['content']}"
+        return article['content']
+
+    @staticmethod
+    def _article_attributes(job: Dict[str, Any], article: Dict[str, Any], image: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Same attribute keys the content editor saves (the job link is articles.generation_job_id)"""
+        seo_metadata = article.get('seo_metadata') or {}
+        attributes = {
+            'seo_title': seo_metadata.get('seo_title') or article['title'],
+            'seo_description': article.get('seo_description', ''),
+            'category': (job['options'] or {}).get('category', ''),
+            'tags': seo_metadata.get('keywords', [])
+        }
+        if image and image.get('image_url'):
+            attributes['featured_image'] = image['image_url']
+        return attributes
@@ -0,0 +1,112 @@
+"""
+Related-articles refresh job for Quest-CMS
+Incrementally recomputes the precomputed top-N neighbours in related_articles
+"""
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Dict, Any, List
+import logging
+
+from ..database.connection import db_manager
+from ..database.operations import ArticleOperations, JobStateOperations
+
+logger = logging.getLogger(__name__)
+
+JOB_NAME = 'related_articles_refresh'
+
+# Re-scan this far behind the watermark: transactions that committed late can carry
+# a change time older than rows we already processed
+WATERMARK_OVERLAP = timedelta(minutes=5)
+
+
+class RelatedArticlesRefresh:
+    """
+    Incremental related-articles refresh
+    Only articles whose updated_at or embedded_at moved past the stored watermark are
+    recomputed (embedding writes set embedded_at, not updated_at), together with the
+    articles currently listing them as related and those whose list they now enter
+    (reverse neighbours, found among each changed article's `reverse_candidates`
+    nearest neighbours). Neighbours come from the HNSW index, one batch per transaction.
+    """
+
+    def __init__(self, neighbours: int = 10, batch_size: int = 200, reverse_candidates: int = 40):
+        self.neighbours = neighbours
+        self.batch_size = batch_size
+        # HNSW returns at most hnsw.ef_search rows (pgvector default 40) per query
+        self.reverse_candidates = reverse_candidates
+
+    async def run(self, max_batches: Optional[int] = None) -> Dict[str, Any]:
+        """Refresh everything changed since the last run; skipped if another process holds the lock"""
+        async with db_manager.advisory_lock(JOB_NAME) as locked:
+            if not locked:
+                logger.info("Related articles refresh already running elsewhere - skipping")
+                return {'skipped': True}
+            return await self._refresh(max_batches)
+
+    async def _refresh(self, max_batches: Optional[int]) -> Dict[str, Any]:
+        state = await JobStateOperations.get_state(JOB_NAME)
+        watermark = (
+            datetime.fromisoformat(state['watermark']) - WATERMARK_OVERLAP
+            if state.get('watermark') else datetime(1970, 1, 1, tzinfo=timezone.utc)
+        )
+
+        refreshed = 0
+        failed_batches = 0
+        batches = 0
+        after_id: Optional[str] = None
+        newest = watermark
+        started = time.perf_counter()
+
+        while max_batches is None or batches < max_batches:
+            changed = await ArticleOperations.list_changed_articles(
+                since=watermark, after_id=after_id, limit=self.batch_size
+            )
+            if not changed:
+                break
+
+            batches += 1
+            watermark = changed[-1]['changed_at']
+            after_id = str(changed[-1]['id'])
+            newest = max(newest, watermark)
+
+            try:
+                changed_ids = [str(row['id']) for row in changed]
+                affected = await self._with_dependents(changed_ids)
+                await ArticleOperations.refresh_related_articles(affected, self.neighbours)
+                refreshed += len(affected)
+                logger.info(f"Related articles batch {batches}: {refreshed} articles refreshed so far")
+
+            except Exception as e:
+                failed_batches += 1
+                logger.error(f"Related articles batch {batches} failed (up to {after_id}): {e}")
+
+        # Only advance the watermark when every batch landed, so failures are retried next run
+        if batches and not failed_batches:
+            await JobStateOperations.set_state(JOB_NAME, {'watermark': newest.isoformat()})
+
+        result = {
+            'refreshed': refreshed,
+            'batches': batches,
+            'failed_batches': failed_batches,
+            'elapsed_seconds': round(time.perf_counter() - started, 2)
+        }
+        logger.info(f"Related articles refresh finished: {result}")
+        return result
+
+    async def _with_dependents(self, article_ids: List[str]) -> List[str]:
+        """Changed articles plus those whose stored neighbours include, or should now include, one of them"""
+        citing, entered = await asyncio.gather(
+            ArticleOperations.list_articles_citing_related(article_ids),
+            ArticleOperations.list_articles_entered_by(article_ids, self.neighbours, self.reverse_candidates)
+        )
+        return list(dict.fromkeys(article_ids + citing + entered))
+
+    async def run_forever(self, interval: float):
+        """Refresh periodically until cancelled"""
+        while True:
+            try:
+                await self.run()
+            except Exception as e:
+                logger.error(f"Related articles refresh failed: {e}")
+            await asyncio.sleep(interval)
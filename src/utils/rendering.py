@@ -0,0 +1,29 @@
+"""
+Markdown rendering for Quest-CMS
+Converts article Markdown to sanitized HTML, stored alongside the article
+"""
+import hashlib
+
+import markdown2
+
+# Bump when the rendering options change so stored HTML is re-rendered
+RENDERER_VERSION = 'markdown2-v1'
+
+# Same extras as NiceGUI's ui.markdown, so the editor preview matches published output
+MARKDOWN_EXTRAS = ['fenced-code-blocks', 'tables']
+
+
+def content_hash(content: str) -> str:
+    """
+    Fingerprint of the Markdown a stored render was produced from
+    Matches md5($RENDERER_VERSION || content) in SQL, so staleness can be checked in a query.
+    """
+    return hashlib.md5((RENDERER_VERSION + content).encode('utf-8')).hexdigest()
+
+
+def render_markdown(content: str) -> str:
+    """
+    Render Markdown to sanitized HTML
+    safe_mode='escape' escapes raw HTML and drops unsafe link protocols (javascript: etc).
+    """
+    return markdown2.markdown(content, safe_mode='escape', extras=MARKDOWN_EXTRAS)
@@ -0,0 +1,46 @@
+"""
+JSON serialization helpers for Quest-CMS
+Uses orjson when it is installed and falls back to the standard library
+"""
+import json
+import uuid
+from datetime import datetime, date
+from decimal import Decimal
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # orjson is optional
+    orjson = None
+
+
+def _default(value: Any) -> Any:
+    """Serialize types that appear in database rows"""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    if isinstance(value, Decimal):
+        return float(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def json_dumps_bytes(value: Any) -> bytes:
+    """Serialize a value to UTF-8 encoded JSON"""
+    if orjson is not None:
+        return orjson.dumps(value, default=_default)
+    return json.dumps(value, default=_default, separators=(',', ':')).encode()
+
+
+def json_dumps(value: Any) -> str:
+    """Serialize a value to a JSON string"""
+    return json_dumps_bytes(value).decode()
+
+
+def json_loads(data: Any) -> Any:
+    """Parse JSON from str, bytes or memoryview"""
+    if orjson is not None:
+        return orjson.loads(data)
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)